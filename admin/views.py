@@ -10,11 +10,12 @@ def administrator_options():
             "1. View System Statistics",
             "2. Manage Hardware Catalog",
             "3. View All Tickets",
-            "4. Return to Main Menu"
+            "4. Hardware Catalog Statistics",
+            "5. Return to Main Menu"
         ]
         print_menu("Administrator Menu", menu_options)
         
-        choice = input("\nEnter your choice (1-4): ")
+        choice = input("\nEnter your choice (1-5): ")
         
         if choice == '1':
             from shared import views as shared_views
@@ -26,6 +27,9 @@ def administrator_options():
             from tickets import views as ticket_views
             ticket_views.view_all_tickets()
         elif choice == '4':
+            from hardware import views as hardware_views
+            hardware_views.view_hardware_statistics()
+        elif choice == '5':
             clear_screen()
             return
         else:
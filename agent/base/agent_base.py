@@ -1,10 +1,10 @@
 import json
 import logging
 import threading
-import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Any
+from shared.clock import get_clock
 
 class BaseAgent(ABC):
     def __init__(self, config_path: str):
@@ -58,10 +58,10 @@ class BaseAgent(ABC):
                 self.logger.debug("Starting new agent cycle")
                 self.process_tasks()
                 self.logger.debug("Agent cycle completed")
-                time.sleep(self.config['capabilities']['message_handling']['check_interval_minutes'] * 60)
+                get_clock().sleep(self.config['capabilities']['message_handling']['check_interval_minutes'] * 60)
             except Exception as e:
                 self.logger.error("Error in agent main loop: %s", str(e), exc_info=True)
-                time.sleep(60)
+                get_clock().sleep(60)
     
     def start(self):
         """Start the agent."""
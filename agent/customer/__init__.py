@@ -1,3 +1,4 @@
-from .customer_agent import CustomerAgent, Customer, init_customer_agent, cleanup_customer_agent
+from .customer_agent import CustomerAgent, init_customer_agent, cleanup_customer_agent
+from .population import CustomerPopulation
 
-__all__ = ['CustomerAgent', 'Customer', 'init_customer_agent', 'cleanup_customer_agent'] 
\ No newline at end of file
+__all__ = ['CustomerAgent', 'CustomerPopulation', 'init_customer_agent', 'cleanup_customer_agent']
@@ -2,40 +2,45 @@ import os
 import sys
 import logging
 import threading
-import time
 import json
+import random
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass
 from tickets import models as ticket_models
 from tickets import utils as ticket_utils
 from hardware import utils as hardware_utils
+from shared.clock import get_clock
+from .population import CustomerPopulation
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent propagation to root logger
 
-@dataclass
-class Customer:
-    """Represents a customer in the system."""
-    id: str
-    name: str
-    satisfaction_level: float  # 0.0 to 1.0
-    last_ticket_time: Optional[datetime]
-    ticket_frequency_hours: float  # Average hours between tickets
-    priority_level: int  # 1-5, where 5 is highest priority
-
 class CustomerAgent:
     def __init__(self, config_path: str = "agent/customer/config/customer_agent_config.json"):
         """Initialize the customer agent."""
         self.config = self._load_config(config_path)
         self._setup_logging()
-        self.interval_minutes = self.config['capabilities']['ticket_creation']['check_interval_minutes']
+        ticket_creation = self.config['capabilities']['ticket_creation']
+        self.interval_minutes = ticket_creation['check_interval_minutes']
+        # Open 'New' tickets at which customers stop filing (None for no limit)
+        self.max_new_tickets: Optional[int] = ticket_creation.get('max_new_tickets')
+        self.max_tickets_per_check: int = ticket_creation.get('max_tickets_per_check', 500)
+        self.population_size: int = ticket_creation.get('population_size', 1000)
+        # Reporter comments generated per check; other tickets reuse earlier comments
+        self.max_comments_per_check: int = ticket_creation.get('max_comments_per_check', 5)
         self.thread = None
         self.running = False
         self._lock = threading.Lock()
-        self.customers: Dict[str, Customer] = {}
-        self._initialize_customers()
+        # Loaded from the tickets database on the first check
+        self.population = CustomerPopulation()
+        self._population_loaded = False
+        # Draws customers, hardware items and ticket intervals; seed it for reproducible runs
+        self.rng = random.Random()
+        # Writes the reporter's comment for a hardware item; replaceable for offline runs
+        self.comment_generator = ticket_utils.generate_reporter_comment
+        # Latest comment generated for each (name, manufacturer, model)
+        self._comments: Dict[tuple, str] = {}
 
     def _load_config(self, config_path: str) -> Dict:
         """Load agent configuration from JSON file."""
@@ -64,91 +69,86 @@ class CustomerAgent:
         self.logger.addHandler(handler)
         self.logger.setLevel(self.config['logging']['level'])
 
-    def _initialize_customers(self):
-        """Initialize a set of default customers."""
-        # Add some default customers with different characteristics
-        self.customers = {
-            "cust_001": Customer(
-                id="cust_001",
-                name="Enterprise Client A",
-                satisfaction_level=0.8,
-                last_ticket_time=None,
-                ticket_frequency_hours=48.0,
-                priority_level=5
-            ),
-            "cust_002": Customer(
-                id="cust_002",
-                name="Small Business B",
-                satisfaction_level=0.6,
-                last_ticket_time=None,
-                ticket_frequency_hours=24.0,
-                priority_level=3
-            ),
-            "cust_003": Customer(
-                id="cust_003",
-                name="Individual User C",
-                satisfaction_level=0.9,
-                last_ticket_time=None,
-                ticket_frequency_hours=72.0,
-                priority_level=1
-            )
+    def _ticket_limit(self) -> int:
+        """Number of tickets the next check may create."""
+        limit = self.max_tickets_per_check
+        if self.max_new_tickets is not None:
+            new_tickets_count = ticket_models.get_tickets_by_status().get('New', 0)
+            limit = min(limit, self.max_new_tickets - new_tickets_count)
+        return max(0, limit)
+
+    def _reporter_comments(self, hardware_items: List[Dict]) -> List[str]:
+        """One reporter comment per hardware item, calling the generator at most max_comments_per_check times.
+        
+        Tickets for the same item in a batch share a comment. Items past the
+        cap reuse the last comment generated for them, or a stock comment.
+        """
+        generated = set()
+        comments = []
+        for item in hardware_items:
+            key = (item['name'], item['manufacturer'], item['model'])
+            if key not in generated and len(generated) < self.max_comments_per_check:
+                self._comments[key] = self.comment_generator(item)
+                generated.add(key)
+            comments.append(self._comments.get(key) or f"My {item['name']} stopped working. {item['failure']}")
+        return comments
+
+    def _build_ticket(self, number: int, customer_name: str, hardware_item: Dict, reporter_comment: str) -> Dict:
+        return {
+            'id': f"TICKET-{number}",
+            'title': f"Support request from {customer_name}",
+            'status': 'New',
+            'description': f"Customer {customer_name} has reported an issue with their {hardware_item['name']}. {hardware_item['failure']}\n\nReporter's comment:\n{reporter_comment}",
+            'hardware': {
+                'name': hardware_item['name'],
+                'model': hardware_item['model'],
+                'manufacturer': hardware_item['manufacturer']
+            }
         }
 
-    def _should_create_ticket(self, customer: Customer) -> bool:
-        """Determine if a ticket should be created for this customer."""
-        if not customer.last_ticket_time:
-            return True
+    def check_and_create_tickets(self, now: Optional[datetime] = None) -> int:
+        """Create tickets for every customer due, as one batch.
+        
+        Due customers come off the population's heap, earliest first, up to
+        the ticket limit; the rest stay due for the next check. Their tickets
+        are added in one transaction and their next ticket times recomputed
+        in one update.
+        
+        Args:
+            now: Game time of the check (defaults to the clock's current time)
         
-        hours_since_last_ticket = (datetime.now() - customer.last_ticket_time).total_seconds() / 3600
-        return hours_since_last_ticket >= customer.ticket_frequency_hours
-
-    def _adjust_satisfaction(self, customer: Customer, ticket_resolved: bool):
-        """Adjust customer satisfaction based on ticket resolution."""
-        if ticket_resolved:
-            customer.satisfaction_level = min(1.0, customer.satisfaction_level + 0.1)
-        else:
-            customer.satisfaction_level = max(0.0, customer.satisfaction_level - 0.2)
-
-    def check_and_create_tickets(self):
-        """Check customers and create tickets as needed."""
+        Returns:
+            int: Number of tickets created
+        """
+        now = now or get_clock().now()
         try:
-            # Get current ticket counts
-            status_counts = ticket_models.get_tickets_by_status()
-            new_tickets_count = status_counts.get('New', 0)
-
-            # Check each customer
-            for customer in self.customers.values():
-                if new_tickets_count >= 3:
-                    break
-
-                if self._should_create_ticket(customer):
-                    # Get a random hardware item for the ticket
-                    hardware_item = hardware_utils.get_random_hardware_item()
-                    
-                    # Generate reporter comment
-                    reporter_comment = ticket_utils.generate_reporter_comment(hardware_item)
-                    
-                    # Create a new ticket
-                    new_ticket = {
-                        'id': f"TICKET-{ticket_models.get_ticket_count() + 1}",
-                        'title': f"Support request from {customer.name}",
-                        'status': 'New',
-                        'description': f"Customer {customer.name} has reported an issue with their {hardware_item['name']}. {hardware_item['failure']}\n\nReporter's comment:\n{reporter_comment}",
-                        'hardware': {
-                            'name': hardware_item['name'],
-                            'model': hardware_item['model'],
-                            'manufacturer': hardware_item['manufacturer']
-                        }
-                    }
-                    
-                    # Add the ticket to the database
-                    ticket_models.add_ticket(new_ticket)
-                    self.logger.info(f"Created new ticket for customer {customer.name}: {new_ticket['id']}")
-                    customer.last_ticket_time = datetime.now()
-                    new_tickets_count += 1
+            if not self._population_loaded:
+                added = self.population.ensure(self.population_size, now.timestamp(), self.rng)
+                self._population_loaded = True
+                self.logger.info("Loaded %d customers (%d new)", len(self.population), added)
+            
+            due = self.population.pop_due(now.timestamp(), self._ticket_limit())
+            if not due:
+                return 0
+            
+            customers = self.population.get_customers(due)
+            hardware_items = hardware_utils.get_random_hardware_items(len(customers), self.rng)
+            comments = self._reporter_comments(hardware_items)
+            first_number = ticket_models.get_ticket_count() + 1
+            tickets = [
+                self._build_ticket(first_number + i, name, hardware_item, comment)
+                for i, ((_, name, _, _), hardware_item, comment) in enumerate(zip(customers, hardware_items, comments))
+            ]
+            ticket_models.add_tickets_bulk(tickets)
+            self.population.reschedule(due, now.timestamp(), self.rng)
+            self.logger.info("Created %d tickets for %d due customers", len(tickets), len(due))
+            return len(tickets)
 
         except Exception as e:
             self.logger.error(f"Error in check_and_create_tickets: {e}")
+            # Customers taken off the heap may not have been rescheduled; reload it next time
+            self._population_loaded = False
+            return 0
 
     def run(self):
         """Main job loop."""
@@ -156,10 +156,10 @@ class CustomerAgent:
         while self.running:
             try:
                 self.check_and_create_tickets()
-                time.sleep(self.interval_minutes * 60)
+                get_clock().sleep(self.interval_minutes * 60)
             except Exception as e:
                 self.logger.error(f"Error in customer agent: {e}")
-                time.sleep(60)
+                get_clock().sleep(60)
 
     def start(self):
         """Start the customer agent."""
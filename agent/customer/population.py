@@ -0,0 +1,170 @@
+"""The simulated customer population, stored in the tickets database.
+
+Each customer has a satisfaction level, an average number of hours between
+tickets and a priority, and the game time (epoch seconds) of their next
+ticket. CustomerPopulation keeps those next-ticket times in a min-heap, so the
+customers due at a tick come off the top without scanning the population.
+After a batch of tickets, the next ticket time of every customer in the batch
+is drawn and written back in one UPDATE. Less satisfied customers file sooner, and a random
+jitter keeps the population from filing in lockstep. Every random draw comes
+from a random.Random the caller passes in, so a seeded run is reproducible.
+"""
+import heapq
+import json
+import random
+from typing import List, Optional, Tuple
+
+from shared.database import DatabaseConnection
+
+CUSTOMER_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    satisfaction REAL NOT NULL CHECK (satisfaction BETWEEN 0 AND 1),
+    ticket_frequency_hours REAL NOT NULL CHECK (ticket_frequency_hours > 0),
+    priority INTEGER NOT NULL CHECK (priority BETWEEN 1 AND 5),
+    last_ticket_at REAL,
+    next_ticket_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_customers_next_ticket ON customers (next_ticket_at);
+'''
+
+
+# (name, satisfaction, ticket_frequency_hours, priorities) of each kind of customer
+CUSTOMER_SEGMENTS = [
+    ("Enterprise Client", 0.8, 48.0, (4, 5)),
+    ("Small Business", 0.6, 24.0, (2, 3)),
+    ("Individual User", 0.9, 72.0, (1,)),
+]
+
+# Customers inserted per executemany call when seeding
+SEED_BATCH_SIZE = 5000
+
+
+def init_db():
+    """Create the customers table in the tickets database."""
+    DatabaseConnection.init_db('tickets', CUSTOMER_SCHEMA)
+
+
+def next_ticket_interval(frequency_hours: float, satisfaction: float, rng: random.Random) -> float:
+    """Seconds until a customer's next ticket.
+
+    The customer's frequency, shortened when dissatisfied (x0.5 at
+    satisfaction 0, x1.5 at 1), with +/-25% jitter.
+    """
+    return frequency_hours * 3600 * (0.5 + satisfaction) * rng.uniform(0.75, 1.25)
+
+
+class CustomerPopulation:
+    """The customers who file tickets, with a min-heap of next ticket times."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def ensure(self, size: int, now: float, rng: Optional[random.Random] = None) -> int:
+        """Grow the population to at least size customers, then load the heap.
+
+        New customers get attributes drawn from CUSTOMER_SEGMENTS, and first
+        tickets spread over one ticket interval from now.
+
+        Args:
+            size: Minimum number of customers
+            now: Current game time in epoch seconds
+            rng: random.Random to draw attributes with
+
+        Returns:
+            int: Number of customers added
+        """
+        rng = rng or random.Random()
+        init_db()
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM customers")
+            first_id = cursor.fetchone()[0] + 1
+            cursor.execute("SELECT COUNT(*) FROM customers")
+            missing = max(0, size - cursor.fetchone()[0])
+            for start in range(0, missing, SEED_BATCH_SIZE):
+                cursor.executemany('''
+                    INSERT INTO customers (id, name, satisfaction, ticket_frequency_hours, priority, next_ticket_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    self._new_customer(customer_id, now, rng)
+                    for customer_id in range(first_id + start, first_id + min(missing, start + SEED_BATCH_SIZE))
+                ])
+        self.load()
+        return missing
+
+    @staticmethod
+    def _new_customer(customer_id: int, now: float, rng: random.Random) -> tuple:
+        name, satisfaction, frequency_hours, priorities = rng.choice(CUSTOMER_SEGMENTS)
+        satisfaction = min(1.0, max(0.0, rng.gauss(satisfaction, 0.1)))
+        frequency_hours = frequency_hours * rng.uniform(0.5, 1.5)
+        return (customer_id, f"{name} {customer_id:05d}", satisfaction, frequency_hours,
+                rng.choice(priorities), now + rng.uniform(0, frequency_hours * 3600))
+
+    def load(self):
+        """Rebuild the heap from the customers table."""
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute("SELECT next_ticket_at, id FROM customers ORDER BY next_ticket_at")
+            self._heap = [tuple(row) for row in cursor.fetchall()]  # Sorted, so already a heap
+
+    def pop_due(self, now: float, limit: int) -> List[int]:
+        """Take up to limit customers whose next ticket is due at now, earliest first.
+
+        Customers taken stay off the heap until they are rescheduled.
+        """
+        due = []
+        while self._heap and len(due) < limit and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    def get_customers(self, customer_ids: List[int]) -> List[tuple]:
+        """Get (id, name, satisfaction, priority) for customers, in the given order."""
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute('''
+                SELECT c.id, c.name, c.satisfaction, c.priority
+                FROM json_each(?) j
+                JOIN customers c ON c.id = j.value
+                ORDER BY j.key
+            ''', (json.dumps(customer_ids),))
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def reschedule(self, customer_ids: List[int], now: float, rng: Optional[random.Random] = None):
+        """Record a ticket at now for each customer and push their next ticket time onto the heap.
+
+        Intervals are drawn from rng in the order of customer_ids.
+        """
+        if not customer_ids:
+            return
+        rng = rng or random.Random()
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute('''
+                SELECT c.id, c.ticket_frequency_hours, c.satisfaction
+                FROM json_each(?) j
+                JOIN customers c ON c.id = j.value
+                ORDER BY j.key
+            ''', (json.dumps(customer_ids),))
+            rescheduled = [
+                (now + next_ticket_interval(frequency_hours, satisfaction, rng), customer_id)
+                for customer_id, frequency_hours, satisfaction in cursor.fetchall()
+            ]
+            cursor.execute('''
+                UPDATE customers
+                SET last_ticket_at = ?, next_ticket_at = json_extract(j.value, '$[0]')
+                FROM json_each(?) j
+                WHERE customers.id = json_extract(j.value, '$[1]')
+            ''', (now, json.dumps(rescheduled)))
+        for entry in rescheduled:
+            heapq.heappush(self._heap, entry)
+
+    def adjust_satisfaction(self, customer_id: int, ticket_resolved: bool):
+        """Raise a customer's satisfaction after a resolved ticket, or lower it after an unresolved one."""
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute('''
+                UPDATE customers
+                SET satisfaction = MIN(1.0, MAX(0.0, satisfaction + ?))
+                WHERE id = ?
+            ''', (0.1 if ticket_resolved else -0.2, customer_id))
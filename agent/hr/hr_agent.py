@@ -2,7 +2,7 @@ import os
 from typing import Optional
 from ..base.agent_base import BaseAgent
 from human_resources import models as hr_models
-from human_resources.repository import RoleRepository, EmployeeRepository
+from human_resources.repository import RoleRepository, EmployeeRepository, PerformanceRatingRepository
 from mailbox import models as mailbox_models
 import llm
 
@@ -24,8 +24,7 @@ class HRAgent(BaseAgent):
             raise ValueError(f"{self.config['role']} role not found in database")
         
         # Get HR Manager employee
-        employees = EmployeeRepository.get_all()
-        hr_manager = next((emp for emp in employees if emp.role_id == self.role.id), None)
+        hr_manager = self._get_hr_manager()
         if not hr_manager:
             raise ValueError(f"No employee found with {self.config['role']} role")
             
@@ -40,45 +39,62 @@ class HRAgent(BaseAgent):
         if self.config['capabilities']['employee_concerns']['enabled']:
             self._handle_employee_concerns()
     
+    def _get_hr_manager(self):
+        """Get the employee holding the agent's role, or None."""
+        managers = EmployeeRepository.get_by_role_id(self.role.id)
+        return managers[0] if managers else None
+    
     def _check_messages(self):
         """Check and respond to HR-related messages."""
         self.logger.info("Starting message check cycle")
         try:
-            employees = EmployeeRepository.get_all()
-            hr_manager = next((emp for emp in employees if emp.role_id == self.role.id), None)
+            hr_manager = self._get_hr_manager()
             if not hr_manager:
                 self.logger.error("No employee found with HR Manager role")
                 return
                 
-            messages = mailbox_models.get_messages(hr_manager.id)
-            unread_messages = [msg for msg in messages if not msg[5]]
-            self.logger.info("Found %d unread messages", len(unread_messages))
-
-            for msg in unread_messages:
-                msg_id, sender_name, subject, content, timestamp, _ = msg
-                self.logger.info("Processing message from %s: %s", sender_name, subject)
-                
-                sender_employee = next((emp for emp in employees if f"{emp.first_name} {emp.last_name}" == sender_name), None)
-                if not sender_employee:
-                    self.logger.error("Could not find employee record for sender: %s", sender_name)
-                    continue
-                
-                response = self._generate_hr_response(sender_name, subject, content)
-                if response:
-                    mailbox_models.add_message(
-                        hr_manager.id,
-                        sender_employee.id,
-                        f"Re: {subject}",
-                        response
-                    )
-                    mailbox_models.mark_as_read(msg_id)
-                    self.logger.info("Successfully responded to message from %s", sender_name)
-                else:
-                    self.logger.warning("No response generated for message from %s", sender_name)
+            # Only unread mail is needed; walk it a page at a time
+            page_cursor = None
+            processed = 0
+            while True:
+                unread_messages, page_cursor = mailbox_models.get_message_page(
+                    hr_manager.id, unread_only=True, cursor=page_cursor, sender_ids=True
+                )
+                for msg in unread_messages:
+                    self._respond_to_message(hr_manager, msg)
+                processed += len(unread_messages)
+                if page_cursor is None:
+                    break
+            self.logger.info("Processed %d unread messages", processed)
 
         except Exception as e:
             self.logger.error("Error in message check: %s", str(e), exc_info=True)
     
+    def _respond_to_message(self, hr_manager, msg):
+        """Reply to a single unread message and mark it as read."""
+        msg_id, sender_id, subject, content, timestamp, _ = msg
+        
+        sender_employee = EmployeeRepository.get_by_id(sender_id)
+        if not sender_employee:
+            self.logger.error("Could not find employee record for sender id: %s", sender_id)
+            return
+        sender_name = f"{sender_employee.first_name} {sender_employee.last_name}"
+        self.logger.info("Processing message from %s: %s", sender_name, subject)
+        
+        response = self._generate_hr_response(sender_name, subject, content)
+        if response:
+            mailbox_models.add_message(
+                hr_manager.id,
+                sender_employee.id,
+                f"Re: {subject}",
+                response,
+                reply_to_id=msg_id
+            )
+            mailbox_models.mark_as_read(msg_id)
+            self.logger.info("Successfully responded to message from %s", sender_name)
+        else:
+            self.logger.warning("No response generated for message from %s", sender_name)
+    
     def _generate_hr_response(self, sender: str, subject: str, content: str) -> Optional[str]:
         """Generate an HR-appropriate response using LLM."""
         try:
@@ -97,27 +113,44 @@ class HRAgent(BaseAgent):
         """Periodically check for employee concerns that need HR attention."""
         self.logger.info("Starting employee concerns check cycle")
         try:
-            employees = EmployeeRepository.get_all()
-            self.logger.info("Checking concerns for %d employees", len(employees))
+            hr_manager = self._get_hr_manager()
+            if not hr_manager:
+                self.logger.error("No employee found with HR Manager role")
+                return
+            
+            # Every employee's rating summary in one read
+            ratings, _ = PerformanceRatingRepository.get_rollups()
+            self.logger.info("Checking concerns for %d rated employees", len(ratings))
             
-            for employee in employees:
-                if self._should_reach_out(employee):
-                    self._generate_proactive_outreach(employee)
+            for employee_id, summary in ratings.items():
+                employee = EmployeeRepository.get_by_id(employee_id)
+                if employee and employee.id != hr_manager.id and self._should_reach_out(employee, summary):
+                    if self._generate_proactive_outreach(hr_manager, employee):
+                        PerformanceRatingRepository.record_outreach(employee.id, summary.latest_review_date)
                     
         except Exception as e:
             self.logger.error("Error in employee concerns check: %s", str(e), exc_info=True)
     
-    def _should_reach_out(self, employee) -> bool:
-        """Determine if HR should proactively reach out to an employee."""
-        # Implement logic based on config thresholds
+    def _should_reach_out(self, employee, ratings) -> bool:
+        """Determine if HR should proactively reach out to an employee.
+        
+        Only the performance metric has data so far: HR reaches out when the
+        latest or average rating, as a fraction of 5, falls below the threshold,
+        and at most once per new review. The last review reached out about is
+        stored with the rating rollups, so restarts do not repeat a check-in.
+        """
         metrics = self.config['capabilities']['employee_concerns']['monitoring_metrics']
         thresholds = self.config['capabilities']['employee_concerns']['thresholds']
         
-        # This is a placeholder - implement actual metric checking logic
-        return False
+        if employee.employment_status != 'active' or 'performance' not in metrics:
+            return False
+        if ratings.last_outreach_review_date and ratings.last_outreach_review_date >= ratings.latest_review_date:
+            return False
+        score = min(ratings.latest_rating, ratings.average) / 5
+        return score < thresholds['performance']
     
-    def _generate_proactive_outreach(self, employee):
-        """Generate a proactive outreach message to an employee."""
+    def _generate_proactive_outreach(self, hr_manager, employee) -> bool:
+        """Generate a proactive outreach message to an employee; returns whether it was sent."""
         try:
             prompt = self.config['llm_config']['prompt_templates']['proactive_outreach'].format(
                 employee_name=f"{employee.first_name} {employee.last_name}"
@@ -125,12 +158,14 @@ class HRAgent(BaseAgent):
             response = self.llm_client.prompt(prompt)
             
             mailbox_models.add_message(
-                sender=self.email,
-                recipient=employee.email,
-                subject="HR Check-in",
-                content=response.text()
+                hr_manager.id,
+                employee.id,
+                "HR Check-in",
+                response.text()
             )
             self.logger.info("Sent proactive outreach to employee: %s %s", 
                            employee.first_name, employee.last_name)
+            return True
         except Exception as e:
-            self.logger.error("Error generating proactive outreach: %s", str(e), exc_info=True) 
\ No newline at end of file
+            self.logger.error("Error generating proactive outreach: %s", str(e), exc_info=True)
+            return False 
\ No newline at end of file
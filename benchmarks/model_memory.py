@@ -0,0 +1,86 @@
+"""Memory and load time of HR employee records: old dataclasses vs slotted models.
+
+Builds N employees (100,000 by default) from row tuples the way the repository
+loads them, and reports bytes per employee and build time for each approach.
+The baseline is the dataclass Employee with eager date parsing that the
+models used before they became SlottedModel subclasses.
+
+Usage: python -m benchmarks.model_memory [N]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from human_resources.models import Employee
+
+
+@dataclass
+class DataclassEmployee:
+    id: Optional[int]
+    first_name: str
+    last_name: str
+    email: str
+    role_id: Optional[int]
+    hire_date: date
+    employment_status: str
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            id=row[0],
+            first_name=row[1],
+            last_name=row[2],
+            email=row[3],
+            role_id=row[4],
+            hire_date=date.fromisoformat(row[5]),
+            employment_status=row[6],
+            created_at=datetime.fromisoformat(row[7]) if row[7] else None
+        )
+
+
+def make_rows(count):
+    """Rows shaped like SELECT id, first_name, ... FROM employees."""
+    return [
+        (i, f"First{i}", f"Last{i}", f"user{i}@example.com", i % 12,
+         f"20{10 + i % 14}-0{1 + i % 9}-1{i % 9}", 'active', f"2024-01-01 09:{i % 60:02d}:00")
+        for i in range(count)
+    ]
+
+
+def measure(build, rows):
+    """Return (bytes per record, seconds) for building one record per row."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [build(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return allocated / len(rows), elapsed
+
+
+def main(count=100_000):
+    rows = make_rows(count)
+    results = [
+        ("dataclass, eager dates", measure(DataclassEmployee.from_row, rows)),
+        ("slotted, lazy dates", measure(Employee.from_tuple, rows)),
+        ("slotted, dates read", measure(lambda row: _touch(Employee.from_tuple(row)), rows)),
+    ]
+    print(f"{count:,} employees")
+    for label, (per_record, elapsed) in results:
+        print(f"  {label:<24} {per_record:7.0f} bytes/employee  {per_record * count / 2**20:6.1f} MiB  {elapsed:6.3f} s")
+
+
+def _touch(employee):
+    employee.hire_date, employee.created_at
+    return employee
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -1,10 +1,26 @@
+import json
 import sqlite3
+import threading
 from datetime import datetime
-from typing import List, Tuple, Optional
-from human_resources.database import get_db_connection as get_hr_db_connection
+from typing import Dict, List, Tuple, Optional
+from human_resources.repository import EmployeeRepository
 from human_resources.utils import get_current_employee
 from shared.database import DatabaseConnection
 
+# SQL expression turning an 'HH:MM' column into minutes since midnight
+_MINUTES_SQL = "(CAST(substr({0}, 1, 2) AS INTEGER) * 60 + CAST(substr({0}, 4, 2) AS INTEGER))"
+
+# Current game day number, keyed by calendar database path. Every change to the
+# current day goes through this module, which publishes the new value here so
+# readers such as the game header do not query for it. Racing advances may
+# publish out of order, so the lock keeps the cache at the highest day seen.
+_current_day_cache: Dict[str, int] = {}
+_current_day_lock = threading.Lock()
+
+# Default working hours searched by find_free_slots
+WORKDAY_START = "09:00"
+WORKDAY_END = "17:00"
+
 # Schema for calendar database
 CALENDAR_SCHEMA = '''
     CREATE TABLE IF NOT EXISTS game_days (
@@ -38,14 +54,211 @@ CALENDAR_SCHEMA = '''
         PRIMARY KEY (meeting_id, employee_id),
         FOREIGN KEY (meeting_id) REFERENCES schedule (id) ON DELETE CASCADE
     );
+
+    CREATE INDEX IF NOT EXISTS idx_schedule_game_day
+    ON schedule (game_day_id, start_time);
+
+    -- Meetings per game day for the header, maintained by the triggers below
+    CREATE TABLE IF NOT EXISTS meeting_counts (
+        game_day_id INTEGER PRIMARY KEY,
+        meetings INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS meeting_counts_insert AFTER INSERT ON schedule BEGIN
+        INSERT INTO meeting_counts (game_day_id, meetings) VALUES (new.game_day_id, 1)
+        ON CONFLICT (game_day_id) DO UPDATE SET meetings = meetings + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS meeting_counts_delete AFTER DELETE ON schedule BEGIN
+        UPDATE meeting_counts SET meetings = meetings - 1 WHERE game_day_id = old.game_day_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS meeting_counts_move AFTER UPDATE OF game_day_id ON schedule
+    WHEN old.game_day_id != new.game_day_id BEGIN
+        UPDATE meeting_counts SET meetings = meetings - 1 WHERE game_day_id = old.game_day_id;
+        INSERT INTO meeting_counts (game_day_id, meetings) VALUES (new.game_day_id, 1)
+        ON CONFLICT (game_day_id) DO UPDATE SET meetings = meetings + 1;
+    END;
+
+    -- Busy intervals per attendee and day, in minutes since midnight, kept in
+    -- sync with schedule and meeting_attendees by the triggers below
+    CREATE TABLE IF NOT EXISTS attendee_busy (
+        meeting_id INTEGER NOT NULL,
+        employee_id INTEGER NOT NULL,
+        game_day_id INTEGER NOT NULL,
+        start_minute INTEGER NOT NULL,
+        end_minute INTEGER NOT NULL,
+        PRIMARY KEY (meeting_id, employee_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_attendee_busy_interval
+    ON attendee_busy (game_day_id, employee_id, start_minute, end_minute);
+
+    CREATE TRIGGER IF NOT EXISTS attendee_busy_insert AFTER INSERT ON meeting_attendees BEGIN
+        INSERT OR REPLACE INTO attendee_busy (meeting_id, employee_id, game_day_id, start_minute, end_minute)
+        SELECT s.id, new.employee_id, s.game_day_id, ''' + _MINUTES_SQL.format('s.start_time') + ''', ''' + _MINUTES_SQL.format('s.end_time') + '''
+        FROM schedule s WHERE s.id = new.meeting_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS attendee_busy_delete AFTER DELETE ON meeting_attendees BEGIN
+        DELETE FROM attendee_busy WHERE meeting_id = old.meeting_id AND employee_id = old.employee_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS attendee_busy_reschedule AFTER UPDATE OF game_day_id, start_time, end_time ON schedule BEGIN
+        UPDATE attendee_busy
+        SET game_day_id = new.game_day_id,
+            start_minute = ''' + _MINUTES_SQL.format('new.start_time') + ''',
+            end_minute = ''' + _MINUTES_SQL.format('new.end_time') + '''
+        WHERE meeting_id = new.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS attendee_busy_cancel AFTER DELETE ON schedule BEGIN
+        DELETE FROM attendee_busy WHERE meeting_id = old.id;
+    END;
+
+    -- Recurring meetings are stored once and expanded into occurrences on
+    -- read; every interval_days from first_day until last_day (or forever)
+    CREATE TABLE IF NOT EXISTS recurring_meetings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        start_time TEXT NOT NULL,
+        end_time TEXT NOT NULL,
+        first_day INTEGER NOT NULL,
+        last_day INTEGER,
+        interval_days INTEGER NOT NULL DEFAULT 1 CHECK (interval_days > 0),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_recurring_meetings_span
+    ON recurring_meetings (first_day, last_day);
+
+    CREATE TABLE IF NOT EXISTS recurring_attendees (
+        recurrence_id INTEGER NOT NULL,
+        employee_id INTEGER NOT NULL,
+        PRIMARY KEY (recurrence_id, employee_id),
+        FOREIGN KEY (recurrence_id) REFERENCES recurring_meetings (id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_recurring_attendees_employee
+    ON recurring_attendees (employee_id, recurrence_id);
+
+    -- One row per occurrence that was cancelled or moved
+    CREATE TABLE IF NOT EXISTS recurrence_exceptions (
+        recurrence_id INTEGER NOT NULL,
+        day_number INTEGER NOT NULL,
+        cancelled BOOLEAN NOT NULL DEFAULT 0,
+        title TEXT,
+        start_time TEXT,
+        end_time TEXT,
+        PRIMARY KEY (recurrence_id, day_number),
+        FOREIGN KEY (recurrence_id) REFERENCES recurring_meetings (id) ON DELETE CASCADE
+    );
+
+    -- Recurring occurrences per day for the header, counted by count_meetings
+    -- on the first read of a day and forgotten by the triggers below whenever
+    -- a change to the recurring meetings may alter it
+    CREATE TABLE IF NOT EXISTS recurring_counts (
+        day_number INTEGER PRIMARY KEY,
+        meetings INTEGER NOT NULL
+    );
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_add AFTER INSERT ON recurring_meetings BEGIN
+        DELETE FROM recurring_counts WHERE day_number >= new.first_day;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_change AFTER UPDATE ON recurring_meetings BEGIN
+        DELETE FROM recurring_counts WHERE day_number >= MIN(old.first_day, new.first_day);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_remove AFTER DELETE ON recurring_meetings BEGIN
+        DELETE FROM recurring_counts WHERE day_number >= old.first_day;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_exception_add AFTER INSERT ON recurrence_exceptions BEGIN
+        DELETE FROM recurring_counts WHERE day_number = new.day_number;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_exception_change AFTER UPDATE ON recurrence_exceptions BEGIN
+        DELETE FROM recurring_counts WHERE day_number IN (old.day_number, new.day_number);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS recurring_counts_exception_remove AFTER DELETE ON recurrence_exceptions BEGIN
+        DELETE FROM recurring_counts WHERE day_number = old.day_number;
+    END;
+'''
+
+# Prefix of occurrence ids, which identify a recurring meeting on a given day
+OCCURRENCE_ID_PREFIX = "R"
+
+# How far ahead a new recurring meeting is checked for conflicts
+RECURRENCE_CHECK_DAYS = 28
+
+# Occurrences of recurring meetings on the days from ? to ?, with exceptions
+# applied; prefixed to queries that select FROM occurrences
+_OCCURRENCES_CTE = '''
+    WITH RECURSIVE days(day_number) AS (
+        SELECT ? UNION ALL SELECT day_number + 1 FROM days WHERE day_number < ?
+    ),
+    occurrences AS (
+        SELECT r.id AS recurrence_id, d.day_number,
+               COALESCE(x.title, r.title) AS title, r.description,
+               COALESCE(x.start_time, r.start_time) AS start_time,
+               COALESCE(x.end_time, r.end_time) AS end_time
+        FROM days d
+        JOIN recurring_meetings r
+          ON r.first_day <= d.day_number
+         AND (r.last_day IS NULL OR r.last_day >= d.day_number)
+         AND (d.day_number - r.first_day) % r.interval_days = 0
+        LEFT JOIN recurrence_exceptions x
+          ON x.recurrence_id = r.id AND x.day_number = d.day_number
+        WHERE NOT COALESCE(x.cancelled, 0)
+    )
 '''
 
+def _publish_current_day(day_number: int, force: bool = False):
+    """Publish a new current game day to readers of get_current_game_day.
+
+    The day only moves forward unless force is set, as when resetting to day 1.
+    """
+    path = DatabaseConnection.get_db_path('calendar')
+    with _current_day_lock:
+        cached = _current_day_cache.get(path)
+        if force or cached is None or day_number > cached:
+            _current_day_cache[path] = day_number
+
+def invalidate_current_day_cache():
+    """Forget the cached current game day, forcing the next read to query it."""
+    with _current_day_lock:
+        _current_day_cache.pop(DatabaseConnection.get_db_path('calendar'), None)
+
 def init_db():
     """Initialize the calendar database."""
+    invalidate_current_day_cache()
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'meeting_counts'")
+        has_meeting_counts = cursor.fetchone() is not None
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'attendee_busy'")
+        has_busy_index = cursor.fetchone() is not None
+    
     DatabaseConnection.init_db('calendar', CALENDAR_SCHEMA)
     
-    # Initialize current_game_day if empty
     with DatabaseConnection.get_cursor('calendar') as cursor:
+        # Count meetings scheduled before the counter table existed
+        if not has_meeting_counts:
+            cursor.execute('''
+                INSERT INTO meeting_counts (game_day_id, meetings)
+                SELECT game_day_id, COUNT(*) FROM schedule GROUP BY game_day_id
+            ''')
+        if not has_busy_index:
+            cursor.execute(f'''
+                INSERT INTO attendee_busy (meeting_id, employee_id, game_day_id, start_minute, end_minute)
+                SELECT s.id, ma.employee_id, s.game_day_id, {_MINUTES_SQL.format('s.start_time')}, {_MINUTES_SQL.format('s.end_time')}
+                FROM meeting_attendees ma
+                JOIN schedule s ON s.id = ma.meeting_id
+            ''')
+        
+        # Initialize current_game_day if empty
         cursor.execute('SELECT COUNT(*) FROM current_game_day')
         if cursor.fetchone()[0] == 0:
             # Insert day 1 into game_days if it doesn't exist
@@ -62,60 +275,252 @@ def reset_game_days():
         # Clear existing game days and related data
         cursor.execute('DELETE FROM meeting_attendees')
         cursor.execute('DELETE FROM schedule')
+        cursor.execute('DELETE FROM current_game_day')
         cursor.execute('DELETE FROM game_days')
+        cursor.execute('DELETE FROM meeting_counts')
+        cursor.execute('DELETE FROM recurring_meetings')
+        cursor.execute('DELETE FROM recurring_counts')
         
         # Insert day 1
         cursor.execute('INSERT INTO game_days (day_number) VALUES (1)')
         day1_id = cursor.lastrowid
         
         # Reset current game day to day 1
-        cursor.execute('DELETE FROM current_game_day')
         cursor.execute('INSERT INTO current_game_day (id, game_day_id) VALUES (1, ?)', (day1_id,))
+    _publish_current_day(1, force=True)
 
 def get_current_game_day() -> int:
-    """Get the current game day number."""
-    with DatabaseConnection.get_cursor('calendar') as cursor:
-        cursor.execute('''
-            SELECT g.day_number 
-            FROM current_game_day c
-            JOIN game_days g ON c.game_day_id = g.id
-        ''')
-        return cursor.fetchone()[0]
+    """Get the current game day number, from the cache once it has been read."""
+    path = DatabaseConnection.get_db_path('calendar')
+    day_number = _current_day_cache.get(path)
+    if day_number is not None:
+        return day_number
+    
+    # Read under the lock so a stale read cannot land after a reset publishes day 1
+    with _current_day_lock:
+        with DatabaseConnection.get_cursor('calendar') as cursor:
+            cursor.execute('''
+                SELECT g.day_number 
+                FROM current_game_day c
+                JOIN game_days g ON c.game_day_id = g.id
+            ''')
+            day_number = cursor.fetchone()[0]
+        cached = _current_day_cache.get(path)
+        if cached is None or day_number > cached:
+            _current_day_cache[path] = day_number
+        return _current_day_cache[path]
 
 def advance_game_day() -> int:
-    """Advance the game day by one and return the new day number."""
-    with DatabaseConnection.get_cursor('calendar') as cursor:
-        current_day = get_current_game_day()
-        new_day = current_day + 1
-        
+    """Advance the game day by one and return the new day number.
+    
+    The next day is created if needed and made current in one IMMEDIATE
+    transaction, so concurrent advances each move the day on exactly once.
+    """
+    with DatabaseConnection.get_connection('calendar') as conn:
+        conn.execute('BEGIN IMMEDIATE')
         try:
-            # Try to insert the new day
-            cursor.execute('INSERT INTO game_days (day_number) VALUES (?)', (new_day,))
-            new_day_id = cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # If the day already exists, get its id
-            cursor.execute('SELECT id FROM game_days WHERE day_number = ?', (new_day,))
-            new_day_id = cursor.fetchone()[0]
-        
-        # Update current_game_day to point to the new day
-        cursor.execute('UPDATE current_game_day SET game_day_id = ?, updated_at = CURRENT_TIMESTAMP', (new_day_id,))
-        
-        return new_day
+            conn.execute('''
+                INSERT OR IGNORE INTO game_days (day_number)
+                SELECT g.day_number + 1
+                FROM current_game_day c
+                JOIN game_days g ON c.game_day_id = g.id
+            ''')
+            new_day = conn.execute('''
+                UPDATE current_game_day
+                SET game_day_id = (
+                        SELECT n.id FROM game_days g
+                        JOIN game_days n ON n.day_number = g.day_number + 1
+                        WHERE g.id = current_game_day.game_day_id
+                    ),
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING (SELECT day_number FROM game_days WHERE id = game_day_id)
+            ''').fetchone()[0]
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    
+    _publish_current_day(new_day)
+    return new_day
 
 def is_valid_scheduling_day(game_day: int) -> bool:
     """Check if the given game day is valid for scheduling meetings."""
     current_day = get_current_game_day()
     return game_day > current_day
 
-def add_meeting(title: str, description: str, start_time: str, end_time: str, employee_ids: List[int], game_day: Optional[int] = None) -> bool:
-    """Add a new meeting to the schedule with attendees."""
-    if game_day is None:
-        game_day = get_current_game_day() + 1
-        
-    if not is_valid_scheduling_day(game_day):
-        return False
+def to_minutes(time_str: str) -> int:
+    """Convert 'HH:MM' to minutes since midnight."""
+    hours, minutes = time_str.split(':')
+    return int(hours) * 60 + int(minutes)
+
+def normalize_time(time_str: str) -> str:
+    """Validate a time of day such as '9:30' or '09:30' and return it as 'HH:MM'.
+    
+    Stored times must be zero-padded, since the busy index and the occurrence
+    queries read the hours and minutes at fixed positions.
+    
+    Raises:
+        ValueError: If the text is not a time between 00:00 and 23:59
+    """
+    hours, separator, minutes = str(time_str).strip().partition(':')
+    if (not separator or not hours.isdigit() or not minutes.isdigit()
+            or len(hours) > 2 or len(minutes) != 2 or int(hours) > 23 or int(minutes) > 59):
+        raise ValueError(f"Invalid time {time_str!r}; expected HH:MM")
+    return f"{int(hours):02d}:{minutes}"
+
+def _meeting_window(start_time: str, end_time: str) -> Optional[Tuple[str, str]]:
+    """Normalize a meeting's start and end times, or None if either is invalid or it does not end after it starts."""
+    try:
+        start_time, end_time = normalize_time(start_time), normalize_time(end_time)
+    except ValueError:
+        return None
+    return (start_time, end_time) if start_time < end_time else None
+
+def format_minutes(minutes: int) -> str:
+    """Convert minutes since midnight to 'HH:MM'."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def occurrence_id(recurrence_id: int) -> str:
+    """Get the meeting id used for the occurrences of a recurring meeting."""
+    return f"{OCCURRENCE_ID_PREFIX}{recurrence_id}"
+
+def parse_meeting_id(text: str):
+    """Parse a meeting id entered by the user.
+    
+    Returns:
+        int for a scheduled meeting, or an occurrence id string such as 'R3'
+        for a recurring one
     
-    # Validate that all employees are active and not the current player
+    Raises:
+        ValueError: If the text is not a meeting id
+    """
+    text = text.strip().upper()
+    if text.startswith(OCCURRENCE_ID_PREFIX):
+        return occurrence_id(int(text[len(OCCURRENCE_ID_PREFIX):]))
+    return int(text)
+
+def recurrence_id_of(meeting_id) -> Optional[int]:
+    """Get the recurring meeting behind an occurrence id, or None for other ids."""
+    if isinstance(meeting_id, str) and meeting_id.startswith(OCCURRENCE_ID_PREFIX):
+        return int(meeting_id[len(OCCURRENCE_ID_PREFIX):])
+    return None
+
+def _find_conflicts(cursor, employee_ids: List[int], game_day: int, start_time: str, end_time: str,
+                    exclude_meeting_id=None) -> List[Tuple]:
+    """Find attendees already busy during a time window, using the caller's cursor."""
+    attendees = json.dumps(list(employee_ids))
+    window = (to_minutes(end_time), to_minutes(start_time))
+    recurrence_id = recurrence_id_of(exclude_meeting_id)
+    cursor.execute(f'''
+        {_OCCURRENCES_CTE}
+        SELECT b.employee_id, b.meeting_id, s.title, b.start_minute
+        FROM game_days g
+        JOIN attendee_busy b ON b.game_day_id = g.id
+        JOIN schedule s ON s.id = b.meeting_id
+        WHERE g.day_number = ?
+          AND b.employee_id IN (SELECT value FROM json_each(?))
+          AND b.start_minute < ? AND b.end_minute > ?
+          AND b.meeting_id IS NOT ?
+        UNION ALL
+        SELECT ra.employee_id, ? || o.recurrence_id, o.title, {_MINUTES_SQL.format('o.start_time')}
+        FROM occurrences o
+        JOIN recurring_attendees ra ON ra.recurrence_id = o.recurrence_id
+        WHERE ra.employee_id IN (SELECT value FROM json_each(?))
+          AND {_MINUTES_SQL.format('o.start_time')} < ? AND {_MINUTES_SQL.format('o.end_time')} > ?
+          AND o.recurrence_id IS NOT ?
+        ORDER BY 1, 4
+    ''', (game_day, game_day,
+          game_day, attendees, *window, None if recurrence_id is not None else exclude_meeting_id,
+          OCCURRENCE_ID_PREFIX, attendees, *window, recurrence_id))
+    return [tuple(row[:3]) for row in cursor.fetchall()]
+
+def find_conflicts(employee_ids: List[int], game_day: int, start_time: str, end_time: str,
+                   exclude_meeting_id=None) -> List[Tuple]:
+    """Find attendees who already have a meeting overlapping a time window.
+    
+    Args:
+        employee_ids: Proposed attendees
+        game_day: Day number of the proposed meeting
+        start_time, end_time: 'HH:MM' bounds of the proposed meeting
+        exclude_meeting_id: Meeting or occurrence being edited, which cannot
+            conflict with itself
+    
+    Returns:
+        list: (employee_id, meeting_id, title) for every overlapping meeting,
+            where meeting_id is an occurrence id for recurring meetings
+    
+    Raises:
+        ValueError: If a time is not a valid 'HH:MM' time
+    """
+    start_time, end_time = normalize_time(start_time), normalize_time(end_time)
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        return _find_conflicts(cursor, employee_ids, game_day, start_time, end_time, exclude_meeting_id)
+
+def find_free_slots(employee_ids: List[int], game_day: int, duration: int, last_day: Optional[int] = None,
+                    day_start: str = WORKDAY_START, day_end: str = WORKDAY_END) -> List[Tuple[int, str, str]]:
+    """Find windows when every given employee is free for at least duration minutes.
+    
+    Args:
+        employee_ids: Employees who must all be free
+        game_day: First day number to search
+        duration: Required length in minutes
+        last_day: Last day number to search (defaults to game_day)
+        day_start, day_end: 'HH:MM' working hours searched on each day
+    
+    Returns:
+        list: (day_number, start_time, end_time) of each maximal free window
+    
+    Raises:
+        ValueError: If day_start or day_end is not a valid 'HH:MM' time
+    """
+    last_day = game_day if last_day is None else last_day
+    window_start, window_end = to_minutes(normalize_time(day_start)), to_minutes(normalize_time(day_end))
+    
+    # Busy intervals of all employees over the whole range in one query:
+    # scheduled meetings through the busy index, recurring ones expanded
+    attendees = json.dumps(list(employee_ids))
+    busy = {day: [] for day in range(game_day, last_day + 1)}
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute(f'''
+            {_OCCURRENCES_CTE}
+            SELECT g.day_number, b.start_minute, b.end_minute
+            FROM game_days g
+            JOIN attendee_busy b ON b.game_day_id = g.id
+            WHERE g.day_number BETWEEN ? AND ?
+              AND b.employee_id IN (SELECT value FROM json_each(?))
+              AND b.start_minute < ? AND b.end_minute > ?
+            UNION ALL
+            SELECT day_number, start_minute, end_minute FROM (
+                SELECT o.day_number,
+                       {_MINUTES_SQL.format('o.start_time')} AS start_minute,
+                       {_MINUTES_SQL.format('o.end_time')} AS end_minute
+                FROM occurrences o
+                WHERE o.recurrence_id IN (
+                    SELECT recurrence_id FROM recurring_attendees
+                    WHERE employee_id IN (SELECT value FROM json_each(?))
+                )
+            )
+            WHERE start_minute < ? AND end_minute > ?
+            ORDER BY 1, 2
+        ''', (game_day, last_day,
+              game_day, last_day, attendees, window_end, window_start,
+              attendees, window_end, window_start))
+        for day_number, start_minute, end_minute in cursor.fetchall():
+            busy[day_number].append((start_minute, end_minute))
+    
+    slots = []
+    for day_number, intervals in busy.items():
+        free_from = window_start
+        for start_minute, end_minute in intervals:
+            if start_minute - free_from >= duration:
+                slots.append((day_number, format_minutes(free_from), format_minutes(start_minute)))
+            free_from = max(free_from, end_minute)
+        if window_end - free_from >= duration:
+            slots.append((day_number, format_minutes(free_from), format_minutes(window_end)))
+    return slots
+
+def _can_attend(employee_ids: List[int]) -> bool:
+    """Check that all employees are active and none is the current player."""
     current_employee = get_current_employee()
     current_employee_id = current_employee.id if current_employee else None
     
@@ -133,24 +538,48 @@ def add_meeting(title: str, description: str, start_time: str, end_time: str, em
         
         active_employee_ids = [row['id'] for row in cursor.fetchall()]
     
-    if len(active_employee_ids) != len(employee_ids):
+    return len(active_employee_ids) == len(employee_ids)
+
+def add_meeting(title: str, description: str, start_time: str, end_time: str, employee_ids: List[int], game_day: Optional[int] = None) -> bool:
+    """Add a new meeting to the schedule with attendees.
+    
+    Returns False if the day is not in the future, an attendee is unavailable
+    or already has an overlapping meeting, or the times are invalid.
+    """
+    if game_day is None:
+        game_day = get_current_game_day() + 1
+        
+    if not is_valid_scheduling_day(game_day):
+        return False
+    
+    window = _meeting_window(start_time, end_time)
+    if window is None:
+        return False
+    start_time, end_time = window
+    
+    if not _can_attend(employee_ids):
         return False
         
     with DatabaseConnection.get_cursor('calendar') as cursor:
         try:
-            # Get current max day
-            cursor.execute('SELECT MAX(day_number) FROM game_days')
-            current_max_day = cursor.fetchone()[0] or 0
-            
-            # If target day is beyond current max, add all missing days
-            if game_day > current_max_day:
-                for day in range(current_max_day + 1, game_day + 1):
-                    cursor.execute('INSERT INTO game_days (day_number) VALUES (?)', (day,))
+            # Add any missing days up to the target day in one statement
+            cursor.execute('''
+                WITH RECURSIVE missing(day_number) AS (
+                    SELECT COALESCE(MAX(day_number), 0) + 1 FROM game_days
+                    UNION ALL
+                    SELECT day_number + 1 FROM missing WHERE day_number < ?
+                )
+                INSERT OR IGNORE INTO game_days (day_number)
+                SELECT day_number FROM missing WHERE day_number <= ?
+            ''', (game_day, game_day))
             
             # Get the game day ID for the target day
             cursor.execute('SELECT id FROM game_days WHERE day_number = ?', (game_day,))
             game_day_id = cursor.fetchone()[0]
             
+            if _find_conflicts(cursor, employee_ids, game_day, start_time, end_time):
+                return False
+            
             # Add meeting
             cursor.execute('''
                 INSERT INTO schedule (game_day_id, title, description, start_time, end_time)
@@ -170,46 +599,101 @@ def add_meeting(title: str, description: str, start_time: str, end_time: str, em
         except sqlite3.Error:
             return False
 
+def _attendee_ids(grouped_ids: Optional[str]) -> List[int]:
+    """Parse a GROUP_CONCAT of attendee ids."""
+    return sorted(int(employee_id) for employee_id in grouped_ids.split(',')) if grouped_ids else []
+
 def get_meetings(game_day: int) -> List[Tuple]:
-    """Get all meetings for a specific game day with their attendees."""
+    """Get all meetings for a specific game day with their attendees.
+    
+    Recurring meetings are expanded into that day's occurrences, whose id is
+    an occurrence id such as 'R3' rather than a schedule id.
+    
+    Returns:
+        list: (id, title, description, start_time, end_time, attendees) tuples, where
+            attendees is a list of (employee_id, name) pairs
+    """
     with DatabaseConnection.get_cursor('calendar') as cursor:
-        # First get all meetings
-        cursor.execute('''
-            SELECT s.id, s.title, s.description, s.start_time, s.end_time
-            FROM schedule s
-            JOIN game_days g ON s.game_day_id = g.id
+        # Meetings, occurrences and their attendee ids in one pass
+        cursor.execute(f'''
+            {_OCCURRENCES_CTE}
+            SELECT s.id, s.title, s.description, s.start_time, s.end_time,
+                   GROUP_CONCAT(ma.employee_id) AS attendee_ids, 0 AS recurring
+            FROM game_days g
+            JOIN schedule s ON s.game_day_id = g.id
+            LEFT JOIN meeting_attendees ma ON ma.meeting_id = s.id
             WHERE g.day_number = ?
-            ORDER BY s.start_time
+            GROUP BY s.id
+            UNION ALL
+            SELECT ? || o.recurrence_id, o.title, o.description, o.start_time, o.end_time,
+                   GROUP_CONCAT(ra.employee_id), 1
+            FROM occurrences o
+            LEFT JOIN recurring_attendees ra ON ra.recurrence_id = o.recurrence_id
+            GROUP BY o.recurrence_id
+            ORDER BY 4, 7, 1
+        ''', (game_day, game_day, game_day, OCCURRENCE_ID_PREFIX))
+        meetings = [(tuple(row[:5]), _attendee_ids(row['attendee_ids'])) for row in cursor.fetchall()]
+    
+    # Resolve every attendee name with one batched lookup
+    names = EmployeeRepository.get_names_by_ids({
+        employee_id for _, attendee_ids in meetings for employee_id in attendee_ids
+    })
+    return [
+        (*meeting, [(employee_id, names[employee_id]) for employee_id in attendee_ids if employee_id in names])
+        for meeting, attendee_ids in meetings
+    ]
+
+def count_meetings(game_day: int) -> int:
+    """Get the number of meetings on a game day, including recurring ones, without loading them.
+    
+    Both counts are single-row reads; recurring occurrences are only
+    expanded the first time a day is counted after its recurring meetings
+    changed.
+    """
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute('''
+            SELECT COALESCE((
+                SELECT mc.meetings
+                FROM game_days g
+                JOIN meeting_counts mc ON mc.game_day_id = g.id
+                WHERE g.day_number = ?1
+            ), 0), (SELECT meetings FROM recurring_counts WHERE day_number = ?1)
         ''', (game_day,))
-        
-        meetings = cursor.fetchall()
-        
-        result = []
-        for meeting in meetings:
-            meeting_id = meeting[0]
-            # Get attendees for this meeting
-            cursor.execute('SELECT employee_id FROM meeting_attendees WHERE meeting_id = ?', (meeting_id,))
-            attendee_ids = [row[0] for row in cursor.fetchall()]
-            
-            # Get employee names from HR database
-            with DatabaseConnection.get_cursor('hr') as hr_cursor:
-                placeholders = ','.join('?' * len(attendee_ids))
-                hr_cursor.execute(f'''
-                    SELECT id, first_name, last_name 
-                    FROM employees 
-                    WHERE id IN ({placeholders})
-                ''', attendee_ids)
-                
-                attendees = [(row['id'], f"{row['first_name']} {row['last_name']}") for row in hr_cursor.fetchall()]
-            
-            result.append((*meeting, attendees))
-        
-        return result
+        scheduled, recurring = cursor.fetchone()
+        if recurring is None:
+            cursor.execute(f'''
+                {_OCCURRENCES_CTE}
+                INSERT OR REPLACE INTO recurring_counts (day_number, meetings)
+                SELECT ?, COUNT(*) FROM occurrences
+                RETURNING meetings
+            ''', (game_day, game_day, game_day))
+            recurring = cursor.fetchone()[0]
+        return scheduled + recurring
 
 def update_meeting(meeting_id: int, title: str, description: str, start_time: str, end_time: str, employee_ids: List[int]) -> bool:
-    """Update an existing meeting."""
+    """Update an existing meeting.
+    
+    Returns False if the meeting does not exist, the times are invalid, or an
+    attendee already has an overlapping meeting.
+    """
+    window = _meeting_window(start_time, end_time)
+    if window is None:
+        return False
+    start_time, end_time = window
+    
     with DatabaseConnection.get_cursor('calendar') as cursor:
         try:
+            cursor.execute('''
+                SELECT g.day_number FROM schedule s
+                JOIN game_days g ON g.id = s.game_day_id
+                WHERE s.id = ?
+            ''', (meeting_id,))
+            row = cursor.fetchone()
+            if not row:
+                return False
+            if _find_conflicts(cursor, employee_ids, row[0], start_time, end_time, exclude_meeting_id=meeting_id):
+                return False
+            
             # Update meeting details
             cursor.execute('''
                 UPDATE schedule 
@@ -239,57 +723,152 @@ def delete_meeting(meeting_id: int) -> bool:
             return False
 
 def get_meeting(meeting_id: int) -> Optional[Tuple]:
-    """Get details of a specific meeting."""
+    """Get details of a specific meeting.
+    
+    Returns:
+        tuple: (id, title, description, start_time, end_time, day_number, attendees),
+            where attendees is a comma-separated string of names, or None if not found
+    """
     with DatabaseConnection.get_cursor('calendar') as cursor:
-        # Get meeting details
         cursor.execute('''
-            SELECT s.id, s.title, s.description, s.start_time, s.end_time, g.day_number
+            SELECT s.id, s.title, s.description, s.start_time, s.end_time, g.day_number,
+                   GROUP_CONCAT(ma.employee_id) AS attendee_ids
             FROM schedule s
             JOIN game_days g ON s.game_day_id = g.id
+            LEFT JOIN meeting_attendees ma ON ma.meeting_id = s.id
             WHERE s.id = ?
+            GROUP BY s.id
         ''', (meeting_id,))
-        
         meeting = cursor.fetchone()
-        if not meeting:
-            return None
-        
-        # Get attendees
-        cursor.execute('SELECT employee_id FROM meeting_attendees WHERE meeting_id = ?', (meeting_id,))
-        attendee_ids = [row[0] for row in cursor.fetchall()]
-        
-        # Get employee names from HR database
-        hr_conn = get_hr_db_connection()
-        hr_cursor = hr_conn.cursor()
-        
-        if attendee_ids:
-            placeholders = ','.join('?' * len(attendee_ids))
-            hr_cursor.execute(f'''
-                SELECT first_name, last_name 
-                FROM employees 
-                WHERE id IN ({placeholders})
-                ORDER BY first_name, last_name
-            ''', attendee_ids)
-            attendees = [f"{row['first_name']} {row['last_name']}" for row in hr_cursor.fetchall()]
-            attendee_str = ', '.join(attendees)
-        else:
-            attendee_str = "None"
-        
-        hr_conn.close()
-        return meeting + (attendee_str,)
+    
+    if not meeting:
+        return None
+    
+    names = EmployeeRepository.get_names_by_ids(_attendee_ids(meeting['attendee_ids']))
+    attendee_str = ', '.join(sorted(names.values())) or "None"
+    return tuple(meeting[:6]) + (attendee_str,)
 
-def get_available_employees() -> List[Tuple]:
-    """Get list of available employees for meetings."""
-    hr_conn = get_hr_db_connection()
-    hr_cursor = hr_conn.cursor()
+def add_recurring_meeting(title: str, description: str, start_time: str, end_time: str, employee_ids: List[int],
+                          first_day: int, interval_days: int = 1, last_day: Optional[int] = None) -> Optional[int]:
+    """Add a meeting that repeats every interval_days from first_day.
+    
+    The rule is stored once; occurrences are expanded when a day is read.
+    Conflicts are checked for occurrences in the next RECURRENCE_CHECK_DAYS days.
+    
+    Args:
+        first_day: Day number of the first occurrence (must be in the future)
+        interval_days: Days between occurrences (1 for daily, 7 for weekly)
+        last_day: Last day an occurrence may fall on (None repeats forever)
     
-    hr_cursor.execute('''
-        SELECT id, first_name, last_name 
-        FROM employees 
-        WHERE employment_status = 'active'
-        ORDER BY first_name, last_name
-    ''')
+    Returns:
+        int: The recurring meeting's id, or None if it could not be added
+    """
+    if not is_valid_scheduling_day(first_day) or interval_days < 1:
+        return None
+    if last_day is not None and last_day < first_day:
+        return None
+    window = _meeting_window(start_time, end_time)
+    if window is None or not _can_attend(employee_ids):
+        return None
+    start_time, end_time = window
     
-    employees = [(row['id'], f"{row['first_name']} {row['last_name']}") for row in hr_cursor.fetchall()]
-    hr_conn.close()
+    check_until = first_day + RECURRENCE_CHECK_DAYS
+    if last_day is not None:
+        check_until = min(check_until, last_day)
     
-    return employees 
\ No newline at end of file
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        try:
+            for day in range(first_day, check_until + 1, interval_days):
+                if _find_conflicts(cursor, employee_ids, day, start_time, end_time):
+                    return None
+            
+            cursor.execute('''
+                INSERT INTO recurring_meetings
+                (title, description, start_time, end_time, first_day, last_day, interval_days)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (title, description, start_time, end_time, first_day, last_day, interval_days))
+            recurrence_id = cursor.lastrowid
+            cursor.executemany(
+                'INSERT INTO recurring_attendees (recurrence_id, employee_id) VALUES (?, ?)',
+                [(recurrence_id, employee_id) for employee_id in employee_ids]
+            )
+            return recurrence_id
+        except sqlite3.Error:
+            return None
+
+def _occurs_on(cursor, recurrence_id: int, game_day: int) -> bool:
+    """Check that a recurring meeting has an occurrence on a day (cancelled or not)."""
+    cursor.execute('''
+        SELECT 1 FROM recurring_meetings
+        WHERE id = ? AND first_day <= ? AND (last_day IS NULL OR last_day >= ?)
+          AND (? - first_day) % interval_days = 0
+    ''', (recurrence_id, game_day, game_day, game_day))
+    return cursor.fetchone() is not None
+
+def cancel_occurrence(recurrence_id: int, game_day: int) -> bool:
+    """Cancel a single occurrence of a recurring meeting."""
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        try:
+            if not _occurs_on(cursor, recurrence_id, game_day):
+                return False
+            cursor.execute('''
+                INSERT INTO recurrence_exceptions (recurrence_id, day_number, cancelled)
+                VALUES (?, ?, 1)
+                ON CONFLICT (recurrence_id, day_number) DO UPDATE SET cancelled = 1
+            ''', (recurrence_id, game_day))
+            return True
+        except sqlite3.Error:
+            return False
+
+def reschedule_occurrence(recurrence_id: int, game_day: int, start_time: str, end_time: str,
+                          title: Optional[str] = None) -> bool:
+    """Move a single occurrence of a recurring meeting to other times on its day.
+    
+    Returns False if the meeting does not occur that day, the times are
+    invalid, or an attendee already has an overlapping meeting.
+    """
+    window = _meeting_window(start_time, end_time)
+    if window is None:
+        return False
+    start_time, end_time = window
+    
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        try:
+            if not _occurs_on(cursor, recurrence_id, game_day):
+                return False
+            cursor.execute('SELECT employee_id FROM recurring_attendees WHERE recurrence_id = ?', (recurrence_id,))
+            employee_ids = [row[0] for row in cursor.fetchall()]
+            if _find_conflicts(cursor, employee_ids, game_day, start_time, end_time,
+                               exclude_meeting_id=occurrence_id(recurrence_id)):
+                return False
+            cursor.execute('''
+                INSERT INTO recurrence_exceptions (recurrence_id, day_number, cancelled, title, start_time, end_time)
+                VALUES (?, ?, 0, ?, ?, ?)
+                ON CONFLICT (recurrence_id, day_number) DO UPDATE SET
+                    cancelled = 0, title = excluded.title,
+                    start_time = excluded.start_time, end_time = excluded.end_time
+            ''', (recurrence_id, game_day, title, start_time, end_time))
+            return True
+        except sqlite3.Error:
+            return False
+
+def end_recurring_meeting(recurrence_id: int, last_day: int) -> bool:
+    """Stop a recurring meeting after last_day, deleting it if it would never occur."""
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        try:
+            cursor.execute('''
+                DELETE FROM recurring_meetings WHERE id = ? AND first_day > ?
+            ''', (recurrence_id, last_day))
+            if cursor.rowcount:
+                return True
+            cursor.execute('''
+                UPDATE recurring_meetings SET last_day = ?
+                WHERE id = ? AND (last_day IS NULL OR last_day > ?)
+            ''', (last_day, recurrence_id, last_day))
+            cursor.execute('''
+                DELETE FROM recurrence_exceptions WHERE recurrence_id = ? AND day_number > ?
+            ''', (recurrence_id, last_day))
+            cursor.execute('SELECT 1 FROM recurring_meetings WHERE id = ?', (recurrence_id,))
+            return cursor.fetchone() is not None
+        except sqlite3.Error:
+            return False
@@ -1,9 +1,11 @@
 from . import models
+from human_resources.repository import EmployeeRepository
+from human_resources.views import browse_employees
 from shared.common_ui import print_common_header
 from shared.rich_ui import print_menu, print_status, print_info, print_error, clear_screen
 from rich.table import Table
 from rich.console import Console
-from typing import List
+from typing import List, Optional
 
 console = Console()
 
@@ -20,6 +22,7 @@ def show_calendar_menu():
             "2. Add Meeting",
             "3. Edit Meeting",
             "4. Delete Meeting",
+            "5. Add Recurring Meeting",
             "Q. Return to Main Menu"
         ]
         
@@ -34,6 +37,8 @@ def show_calendar_menu():
             edit_meeting(current_day)
         elif choice == '4':
             delete_meeting(current_day)
+        elif choice == '5':
+            add_recurring_meeting(current_day)
         elif choice == 'Q':
             clear_screen()
             break
@@ -41,39 +46,67 @@ def show_calendar_menu():
             print_error("Invalid choice. Please try again.")
             input("Press Enter to continue...")
 
-def select_employees() -> List[int]:
-    """Select employees for a meeting."""
-    employees = models.get_available_employees()
-    if not employees:
-        print_error("No employees available.")
-        return []
-    
-    table = Table(title="Select Employees")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="yellow")
-    
-    for emp_id, name in employees:
-        table.add_row(str(emp_id), name)
-    
-    console.print(table)
-    print("\nEnter employee IDs separated by commas (e.g., 1,2,3)")
-    print("Press Enter when done, or 'c' to cancel")
-    
+def select_employees(current_attendees: Optional[str] = None) -> List[int]:
+    """Select active employees for a meeting from the paged employee directory.
+    
+    Args:
+        current_attendees: Attendees of the meeting being edited, shown in the
+            directory prompt since the directory clears the screen
+    """
+    prompt = "Enter employee IDs separated by commas (e.g., 1,2,3)"
+    if current_attendees is not None:
+        prompt = f"Current attendees: {current_attendees or 'None'}\n{prompt}"
     while True:
-        choice = input("Employee IDs: ").strip()
-        if choice.lower() == 'c':
+        choice = browse_employees("Select Employees", prompt, 'active')
+        if choice is None:
             return []
         
         try:
             selected_ids = [int(id.strip()) for id in choice.split(',') if id.strip()]
-            # Validate that all selected IDs exist
-            valid_ids = [emp_id for emp_id, _ in employees]
-            if all(id in valid_ids for id in selected_ids):
-                return selected_ids
-            else:
-                print_error("One or more invalid employee IDs. Please try again.")
         except ValueError:
             print_error("Invalid input. Please enter numbers separated by commas.")
+            input("Press Enter to continue...")
+            continue
+        
+        # Validate that all selected IDs are active employees
+        employees = [EmployeeRepository.get_by_id(id) for id in selected_ids]
+        if selected_ids and all(emp and emp.employment_status == 'active' for emp in employees):
+            return selected_ids
+        print_error("One or more invalid employee IDs. Please try again.")
+        input("Press Enter to continue...")
+
+def format_attendees(attendees) -> str:
+    """Format a meeting's (employee_id, name) attendee pairs for display."""
+    return ', '.join(name for _, name in attendees) or "None"
+
+def read_time(prompt: str, default: str = None) -> str:
+    """Prompt for a time until a valid one is entered, or return the default on Enter; returns 'HH:MM'."""
+    while True:
+        try:
+            return models.normalize_time(input(prompt) or default or '')
+        except ValueError:
+            print_error("Invalid time format. Please use HH:MM format.")
+
+def show_conflicts(employee_ids: List[int], game_day: int, start_time: str, end_time: str,
+                   exclude_meeting_id=None) -> bool:
+    """Report attendees who are already busy and suggest free slots that day.
+    
+    Returns True if there were conflicts.
+    """
+    conflicts = models.find_conflicts(employee_ids, game_day, start_time, end_time, exclude_meeting_id)
+    if not conflicts:
+        return False
+    
+    names = EmployeeRepository.get_names_by_ids({emp_id for emp_id, _, _ in conflicts})
+    lines = [f"{names.get(emp_id, emp_id)} is in '{title}' (meeting {meeting_id})"
+             for emp_id, meeting_id, title in conflicts]
+    print_error("Scheduling conflict:\n" + "\n".join(lines))
+    
+    duration = models.to_minutes(end_time) - models.to_minutes(start_time)
+    slots = models.find_free_slots(employee_ids, game_day, duration)
+    if slots:
+        print_info("Free Slots", "\n".join(f"Day {day}: {start} - {end}" for day, start, end in slots))
+    return True
 
 def view_schedule(game_day: int):
     """View the schedule for a specific game day."""
@@ -97,7 +130,7 @@ def view_schedule(game_day: int):
     for meeting in meetings:
         meeting_id, title, description, start_time, end_time, attendees = meeting
         time_slot = f"{start_time} - {end_time}"
-        table.add_row(str(meeting_id), time_slot, title, description or "", attendees or "None")
+        table.add_row(str(meeting_id), time_slot, title, description or "", format_attendees(attendees))
     
     console.print(table)
     input("\nPress Enter to continue...")
@@ -130,17 +163,8 @@ def add_meeting(game_day: int):
     title = input("Meeting Title: ")
     description = input("Description (optional): ")
     
-    while True:
-        start_time = input("Start Time (HH:MM): ")
-        if len(start_time) == 5 and start_time[2] == ':' and start_time[:2].isdigit() and start_time[3:].isdigit():
-            break
-        print_error("Invalid time format. Please use HH:MM format.")
-    
-    while True:
-        end_time = input("End Time (HH:MM): ")
-        if len(end_time) == 5 and end_time[2] == ':' and end_time[:2].isdigit() and end_time[3:].isdigit():
-            break
-        print_error("Invalid time format. Please use HH:MM format.")
+    start_time = read_time("Start Time (HH:MM): ")
+    end_time = read_time("End Time (HH:MM): ")
     
     print("\nSelect meeting attendees:")
     employee_ids = select_employees()
@@ -149,7 +173,9 @@ def add_meeting(game_day: int):
         input("\nPress Enter to continue...")
         return
     
-    if models.add_meeting(title, description, start_time, end_time, employee_ids, target_day):
+    if show_conflicts(employee_ids, target_day, start_time, end_time):
+        print_error("Meeting not created.")
+    elif models.add_meeting(title, description, start_time, end_time, employee_ids, target_day):
         print_status("Success", "Meeting added successfully!")
     else:
         print_error("Failed to add meeting.")
@@ -176,15 +202,19 @@ def edit_meeting(game_day: int):
     for meeting in meetings:
         meeting_id, title, _, start_time, end_time, attendees = meeting
         time_slot = f"{start_time} - {end_time}"
-        table.add_row(str(meeting_id), time_slot, title, attendees or "None")
+        table.add_row(str(meeting_id), time_slot, title, format_attendees(attendees))
     
     console.print(table)
     
     try:
-        meeting_id = int(input("\nEnter meeting ID to edit (or 0 to cancel): "))
+        meeting_id = models.parse_meeting_id(input("\nEnter meeting ID to edit (or 0 to cancel): "))
         if meeting_id == 0:
             return
         
+        if models.recurrence_id_of(meeting_id) is not None:
+            edit_occurrence(meeting_id, game_day, meetings)
+            return
+        
         meeting = models.get_meeting(meeting_id)
         if not meeting:
             print_error("Meeting not found.")
@@ -197,27 +227,18 @@ def edit_meeting(game_day: int):
         new_title = input(f"Title [{title}]: ") or title
         new_description = input(f"Description [{description}]: ") or description
         
-        while True:
-            new_start = input(f"Start Time [{start_time}]: ") or start_time
-            if len(new_start) == 5 and new_start[2] == ':' and new_start[:2].isdigit() and new_start[3:].isdigit():
-                break
-            print_error("Invalid time format. Please use HH:MM format.")
-        
-        while True:
-            new_end = input(f"End Time [{end_time}]: ") or end_time
-            if len(new_end) == 5 and new_end[2] == ':' and new_end[:2].isdigit() and new_end[3:].isdigit():
-                break
-            print_error("Invalid time format. Please use HH:MM format.")
+        new_start = read_time(f"Start Time [{start_time}]: ", start_time)
+        new_end = read_time(f"End Time [{end_time}]: ", end_time)
         
-        print("\nCurrent attendees:", current_attendees or "None")
-        print("Select new attendees:")
-        new_employee_ids = select_employees()
+        new_employee_ids = select_employees(current_attendees)
         if not new_employee_ids:
             print_error("No employees selected. Meeting not updated.")
             input("\nPress Enter to continue...")
             return
         
-        if models.update_meeting(meeting_id, new_title, new_description, new_start, new_end, new_employee_ids):
+        if show_conflicts(new_employee_ids, meeting[5], new_start, new_end, meeting_id):
+            print_error("Meeting not updated.")
+        elif models.update_meeting(meeting_id, new_title, new_description, new_start, new_end, new_employee_ids):
             print_status("Success", "Meeting updated successfully!")
         else:
             print_error("Failed to update meeting.")
@@ -247,16 +268,28 @@ def delete_meeting(game_day: int):
     for meeting in meetings:
         meeting_id, title, _, start_time, end_time, attendees = meeting
         time_slot = f"{start_time} - {end_time}"
-        table.add_row(str(meeting_id), time_slot, title, attendees or "None")
+        table.add_row(str(meeting_id), time_slot, title, format_attendees(attendees))
     
     console.print(table)
     
     try:
-        meeting_id = int(input("\nEnter meeting ID to delete (or 0 to cancel): "))
+        meeting_id = models.parse_meeting_id(input("\nEnter meeting ID to delete (or 0 to cancel): "))
         if meeting_id == 0:
             return
         
-        if models.delete_meeting(meeting_id):
+        recurrence_id = models.recurrence_id_of(meeting_id)
+        if recurrence_id is not None:
+            choice = input("Cancel only this occurrence (O) or this and all later ones (A)? ").upper()
+            if choice == 'O':
+                deleted = models.cancel_occurrence(recurrence_id, game_day)
+            elif choice == 'A':
+                deleted = models.end_recurring_meeting(recurrence_id, game_day - 1)
+            else:
+                return
+        else:
+            deleted = models.delete_meeting(meeting_id)
+        
+        if deleted:
             print_status("Success", "Meeting deleted successfully!")
         else:
             print_error("Failed to delete meeting.")
@@ -264,4 +297,67 @@ def delete_meeting(game_day: int):
     except ValueError:
         print_error("Invalid meeting ID.")
     
-    input("\nPress Enter to continue...") 
\ No newline at end of file
+    input("\nPress Enter to continue...")
+
+def edit_occurrence(meeting_id: str, game_day: int, meetings):
+    """Move one occurrence of a recurring meeting to other times on its day."""
+    meeting = next((m for m in meetings if m[0] == meeting_id), None)
+    if not meeting:
+        print_error("Meeting not found.")
+        input("\nPress Enter to continue...")
+        return
+    
+    _, title, _, start_time, end_time, attendees = meeting
+    print("\nOnly this occurrence is changed. Enter new values (press Enter to keep current value):")
+    new_title = input(f"Title [{title}]: ") or title
+    new_start = read_time(f"Start Time [{start_time}]: ", start_time)
+    new_end = read_time(f"End Time [{end_time}]: ", end_time)
+    
+    employee_ids = [employee_id for employee_id, _ in attendees]
+    recurrence_id = models.recurrence_id_of(meeting_id)
+    if show_conflicts(employee_ids, game_day, new_start, new_end, meeting_id):
+        print_error("Meeting not updated.")
+    elif models.reschedule_occurrence(recurrence_id, game_day, new_start, new_end, new_title):
+        print_status("Success", "Meeting updated successfully!")
+    else:
+        print_error("Failed to update meeting.")
+    
+    input("\nPress Enter to continue...")
+
+def add_recurring_meeting(game_day: int):
+    """Add a meeting that repeats every few days."""
+    clear_screen()
+    print_common_header()
+    
+    print_info("Add Recurring Meeting", f"Current game day is {game_day}")
+    try:
+        first_day = int(input(f"First day of the meeting (must be > {game_day}): "))
+        interval_days = int(input("Repeat every how many days (1 = daily, 7 = weekly): ") or 1)
+        last_day = input("Last day (press Enter to repeat indefinitely): ")
+        last_day = int(last_day) if last_day else None
+    except ValueError:
+        print_error("Please enter valid day numbers.")
+        input("\nPress Enter to continue...")
+        return
+    
+    title = input("Meeting Title: ")
+    description = input("Description (optional): ")
+    start_time = read_time("Start Time (HH:MM): ")
+    end_time = read_time("End Time (HH:MM): ")
+    
+    print("\nSelect meeting attendees:")
+    employee_ids = select_employees()
+    if not employee_ids:
+        print_error("No employees selected. Meeting not created.")
+        input("\nPress Enter to continue...")
+        return
+    
+    recurrence_id = models.add_recurring_meeting(
+        title, description, start_time, end_time, employee_ids, first_day, interval_days, last_day
+    )
+    if recurrence_id is not None:
+        print_status("Success", f"Recurring meeting {models.occurrence_id(recurrence_id)} added successfully!")
+    else:
+        print_error("Failed to add recurring meeting. Check the days, times and attendee availability.")
+    
+    input("\nPress Enter to continue...")
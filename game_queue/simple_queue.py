@@ -2,13 +2,19 @@ import json
 import time
 import threading
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
+from shared.clock import get_clock
 from shared.database import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
 class GameEventQueue:
+    """SQLite-backed queue of game events.
+    
+    created_at and processed_at are UTC, like the CURRENT_TIMESTAMP column
+    default, and taken from the shared clock.
+    """
     def __init__(self):
         """Initialize the game event queue with SQLite backend."""
         self._init_db()
@@ -34,8 +40,8 @@ class GameEventQueue:
         with self._lock:
             with DatabaseConnection.get_cursor('game_state') as cursor:
                 cursor.execute(
-                    "INSERT INTO game_events (event_type, priority, data) VALUES (?, ?, ?)",
-                    (event_type, priority, json.dumps(data))
+                    "INSERT INTO game_events (event_type, priority, data, created_at) VALUES (?, ?, ?, ?)",
+                    (event_type, priority, json.dumps(data), get_clock().utc_now().isoformat(sep=' '))
                 )
                 return cursor.lastrowid
 
@@ -67,8 +73,8 @@ class GameEventQueue:
             with DatabaseConnection.get_cursor('game_state') as cursor:
                 status = 'completed' if success else 'failed'
                 cursor.execute(
-                    "UPDATE game_events SET status = ?, processed_at = CURRENT_TIMESTAMP WHERE id = ?",
-                    (status, event_id)
+                    "UPDATE game_events SET status = ?, processed_at = ? WHERE id = ?",
+                    (status, get_clock().utc_now().isoformat(sep=' '), event_id)
                 )
 
     def get_pending_events(self) -> List[Dict[str, Any]]:
@@ -92,6 +98,6 @@ class GameEventQueue:
         """Clean up events older than specified days."""
         with DatabaseConnection.get_cursor('game_state') as cursor:
             cursor.execute(
-                "DELETE FROM game_events WHERE created_at < datetime('now', ?)",
-                (f'-{days} days',)
+                "DELETE FROM game_events WHERE created_at < ?",
+                ((get_clock().utc_now() - timedelta(days=days)).isoformat(sep=' '),)
             ) 
\ No newline at end of file
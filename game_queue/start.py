@@ -5,6 +5,7 @@ from .simple_queue import GameEventQueue
 import threading
 import time
 import queue as thread_queue
+from typing import Optional
 
 # Configure logging to write only to file
 log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
@@ -97,6 +98,18 @@ class QueueManager:
         except Exception as e:
             logger.error(f"Error handling event {event_type}: {e}")
 
+    def process_next(self) -> Optional[dict]:
+        """Handle the next pending event in the calling thread.
+        
+        Returns:
+            dict: The event handled, or None if no event was pending
+        """
+        event = self.queue.get_next_event()
+        if event:
+            self.handle_event(event)
+            self.queue.mark_event_processed(event['id'])
+        return event
+
     def start(self):
         """Start the queue processor."""
         if self.processor_thread is not None:
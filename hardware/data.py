@@ -1,864 +1,156 @@
-# Hardware catalog data
-HARDWARE_CATALOG = {
-    "consumer-electronics": [
-        {
-            "name": "QuantumCore™ Home Assistant",
-            "manufacturer": "FutureTech Industries",
-            "model": "QCH-3000",
-            "release_date": "2145",
-            "repair_difficulty": 3,
-            "operating_system": "QOS v4.2",
-            "specs": {
-                "processor": "8-core @ 12.8 THz",
-                "memory": "128 TB holographic storage",
-                "power": "48V DC, 2.5A",
-                "connectivity": "Quantum Entanglement Network (QEN), WiFi 12, Bluetooth 8.0"
-            },
-            "common_failures": [
-                "Quantum state decoherence in processing unit",
-                "Holographic storage matrix corruption",
-                "Power supply quantum tunneling leakage",
-                "QEN transceiver alignment drift"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Quantum State Reset",
-                    "steps": [
-                        "Use quantum stabilizer tool",
-                        "Perform cold reboot sequence",
-                        "Recalibrate quantum gates"
-                    ]
-                },
-                {
-                    "name": "Storage Recovery",
-                    "steps": [
-                        "Run holographic integrity check",
-                        "Rebuild storage matrix",
-                        "Restore from quantum backup"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Stabilizer (Model QS-2000)",
-                "Holographic Matrix Scanner",
-                "Quantum Gate Calibrator"
-            ]
-        },
-        {
-            "name": "NeuralSync™ VR Headset",
-            "manufacturer": "MindLink Technologies",
-            "model": "NS-VR-500",
-            "release_date": "2146",
-            "repair_difficulty": 4,
-            "operating_system": "NeuralOS v3.1+",
-            "specs": {
-                "interface": "Direct brainwave synchronization",
-                "display": "16K per eye, 240Hz refresh",
-                "battery": "5000mAh quantum cell",
-                "sensors": "Full body motion tracking"
-            },
-            "common_failures": [
-                "Neural sync signal degradation",
-                "Quantum battery cell depletion",
-                "Motion tracking calibration drift",
-                "Brainwave interface desynchronization"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Neural Interface Reset",
-                    "steps": [
-                        "Disconnect neural sync module",
-                        "Run diagnostic sequence",
-                        "Recalibrate brainwave patterns"
-                    ]
-                },
-                {
-                    "name": "Battery Recovery",
-                    "steps": [
-                        "Perform quantum cell realignment",
-                        "Reset power management system",
-                        "Verify charging circuit integrity"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Neural Interface Diagnostic Kit",
-                "Quantum Cell Realignment Tool",
-                "Brainwave Pattern Calibrator"
-            ]
-        }
-    ],
-    "industrial-equipment": [
-        {
-            "name": "HyperForge™ Plasma Fabricator",
-            "manufacturer": "MetalTech Solutions",
-            "model": "HPF-9000",
-            "release_date": "2144",
-            "repair_difficulty": 5,
-            "specs": {
-                "chamber": "Triple-containment field, 50,000K max temp",
-                "power": "750kW @ 480V 3-phase",
-                "capacity": "Up to 2000kg/hour",
-                "precision": "0.001mm tolerance",
-                "control_system": "QuantumLogic™ PLC with AI assistance",
-                "safety_systems": "Triple redundant emergency shutdown"
-            },
-            "common_failures": [
-                "Plasma containment field desynchronization",
-                "Quantum control system drift",
-                "Coolant system crystallization",
-                "Material feed servo misalignment",
-                "AI neural pattern degradation"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Containment Field Reset",
-                    "steps": [
-                        "Initiate emergency plasma quench",
-                        "Recalibrate magnetic field generators",
-                        "Verify field symmetry with quantum sensors",
-                        "Perform staged power-up sequence"
-                    ]
-                },
-                {
-                    "name": "Coolant System Recovery",
-                    "steps": [
-                        "Heat coolant lines to prevent crystal formation",
-                        "Flush system with anti-crystallization agent",
-                        "Replace molecular filters",
-                        "Verify flow rates in all subsystems"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Field Analyzer (QFA-X series)",
-                "Plasma Diagnostic Suite",
-                "Industrial AI Neural Pattern Debugger",
-                "Molecular Filter Replacement Kit"
-            ]
-        },
-        {
-            "name": "NanoMill™ Precision Fabricator",
-            "manufacturer": "MicroTech Industries",
-            "model": "NM-5500",
-            "release_date": "2145",
-            "repair_difficulty": 4.5,
-            "specs": {
-                "working_area": "2m x 2m x 1.5m",
-                "resolution": "0.1 nanometer precision",
-                "atmosphere": "Class 100 cleanroom environment",
-                "control_system": "Atomic-scale positioning system",
-                "materials": "Compatible with metals, ceramics, and composites"
-            },
-            "common_failures": [
-                "Atomic positioner drift",
-                "Cleanroom containment breach",
-                "Quantum measurement system failure",
-                "Material feed contamination",
-                "Control system quantum decoherence"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Atomic Positioner Calibration",
-                    "steps": [
-                        "Initialize quantum reference grid",
-                        "Perform multi-point calibration",
-                        "Verify positioning accuracy",
-                        "Update drift compensation algorithms"
-                    ]
-                },
-                {
-                    "name": "Cleanroom Recovery",
-                    "steps": [
-                        "Initiate emergency containment protocols",
-                        "Purge atmosphere with filtered gas",
-                        "Check seal integrity",
-                        "Verify particle count levels"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Atomic Position Calibrator",
-                "Quantum Reference Grid Generator",
-                "Cleanroom Particle Analyzer",
-                "Seal Integrity Tester"
-            ]
-        },
-        {
-            "name": "IndustrialMind™ Process Controller",
-            "manufacturer": "AutoLogic Systems",
-            "model": "IPC-2200",
-            "release_date": "2146",
-            "repair_difficulty": 3,
-            "specs": {
-                "processing": "Quantum-Classical Hybrid Architecture",
-                "memory": "1 PB Neural Storage",
-                "connectivity": "Industrial Ethernet, QuantumNet, Legacy Protocols",
-                "redundancy": "Triple-redundant processing units",
-                "security": "Military-grade quantum encryption"
-            },
-            "common_failures": [
-                "Neural network corruption",
-                "Quantum-classical sync loss",
-                "Protocol translation errors",
-                "Redundancy verification failure",
-                "Security system lockout"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Neural Network Recovery",
-                    "steps": [
-                        "Backup current state",
-                        "Initialize recovery partition",
-                        "Rebuild neural connections",
-                        "Verify process control accuracy"
-                    ]
-                },
-                {
-                    "name": "Quantum-Classical Synchronization",
-                    "steps": [
-                        "Reset timing reference",
-                        "Realign quantum states",
-                        "Update sync parameters",
-                        "Test processing accuracy"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Neural Network Analyzer",
-                "Quantum State Debugger",
-                "Protocol Analysis Kit",
-                "Security Override Module"
-            ]
-        },
-        {
-            "name": "AtmoProcessor™ Environmental Control System",
-            "manufacturer": "CleanTech Solutions",
-            "model": "AP-8000",
-            "release_date": "2145",
-            "repair_difficulty": 4,
-            "specs": {
-                "processing_capacity": "1,000,000 m³/hour",
-                "filtration": "Molecular-level separation",
-                "efficiency": "99.9999% contaminant removal",
-                "power_consumption": "250kW continuous",
-                "control": "AI-driven adaptive processing"
-            },
-            "common_failures": [
-                "Molecular filter saturation",
-                "Pressure gradient imbalance",
-                "AI control system errors",
-                "Energy distribution failure",
-                "Contamination sensor malfunction"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Filter System Recovery",
-                    "steps": [
-                        "Analyze contamination levels",
-                        "Regenerate molecular filters",
-                        "Balance pressure gradients",
-                        "Verify filtration efficiency"
-                    ]
-                },
-                {
-                    "name": "AI Control Reset",
-                    "steps": [
-                        "Backup environmental data",
-                        "Reset neural patterns",
-                        "Recalibrate sensors",
-                        "Verify control responses"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Molecular Analysis Kit",
-                "Pressure Mapping System",
-                "AI Neural Pattern Analyzer",
-                "Environmental Sensor Calibrator"
-            ]
-        }
-    ],
-    "networking-devices": [
-        {
-            "name": "QuantumCore™ Network Switch",
-            "manufacturer": "NetQuantum Technologies",
-            "model": "QNS-X9000",
-            "release_date": "2145",
-            "repair_difficulty": 5,
-            "specs": {
-                "ports": "128x quantum-enabled ports, 64x legacy optical ports",
-                "throughput": "100 Petabits/second per quantum port",
-                "latency": "0.1 nanoseconds",
-                "buffer": "1 Exabyte quantum memory buffer",
-                "quantum_entanglement": "Supports up to 1024 simultaneous entangled pairs",
-                "power": "3kW, redundant quantum power supplies"
-            },
-            "common_failures": [
-                "Quantum entanglement desynchronization",
-                "Buffer quantum state collapse",
-                "Port crystal oscillator drift",
-                "Quantum memory decoherence",
-                "Entanglement routing table corruption"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Quantum State Recovery",
-                    "steps": [
-                        "Initialize quantum state analyzer",
-                        "Measure entanglement fidelity",
-                        "Realign quantum buffers",
-                        "Rebuild routing tables"
-                    ]
-                },
-                {
-                    "name": "Port Synchronization",
-                    "steps": [
-                        "Reset crystal oscillators",
-                        "Calibrate quantum timing",
-                        "Test port integrity",
-                        "Verify quantum-classical conversion"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum State Analyzer (QSA-9000)",
-                "Entanglement Fidelity Meter",
-                "Quantum Buffer Debugger",
-                "Crystal Oscillator Calibration Kit"
-            ]
-        },
-        {
-            "name": "HyperMesh™ Wireless Controller",
-            "manufacturer": "AirLogic Systems",
-            "model": "HM-7500",
-            "release_date": "2146",
-            "repair_difficulty": 4,
-            "specs": {
-                "coverage": "10km radius with quantum repeaters",
-                "frequency_bands": "0.1-1000 GHz + quantum bands",
-                "concurrent_devices": "1 million per controller",
-                "ai_processing": "Neural traffic optimization",
-                "security": "Post-quantum cryptography",
-                "redundancy": "Triple controller failover"
-            },
-            "common_failures": [
-                "Neural traffic pattern corruption",
-                "Quantum repeater alignment drift",
-                "Cryptographic key desynchronization",
-                "Device authentication cache overflow",
-                "AI optimization loop failure"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Neural Pattern Reset",
-                    "steps": [
-                        "Backup traffic patterns",
-                        "Reset neural processors",
-                        "Rebuild optimization models",
-                        "Verify traffic flow"
-                    ]
-                },
-                {
-                    "name": "Quantum Repeater Alignment",
-                    "steps": [
-                        "Scan quantum channels",
-                        "Realign repeater arrays",
-                        "Update positioning data",
-                        "Test signal integrity"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Neural Pattern Analyzer",
-                "Quantum Channel Scanner",
-                "Cryptographic Debug Kit",
-                "AI Pattern Optimizer"
-            ]
-        },
-        {
-            "name": "DataStream™ Load Balancer",
-            "manufacturer": "LoadTech Solutions",
-            "model": "DS-5000",
-            "release_date": "2145",
-            "repair_difficulty": 3,
-            "specs": {
-                "capacity": "1 Exabit/second throughput",
-                "algorithms": "AI-driven dynamic routing",
-                "sessions": "100 million concurrent",
-                "health_monitoring": "Quantum-assisted predictive",
-                "redundancy": "Active-active clustering",
-                "ssl_offload": "Quantum cryptography accelerator"
-            },
-            "common_failures": [
-                "Session state corruption",
-                "Algorithm neural pattern drift",
-                "Health monitor false positives",
-                "Quantum accelerator desync",
-                "Cluster state inconsistency"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Session Recovery",
-                    "steps": [
-                        "Backup session data",
-                        "Reset state tables",
-                        "Rebuild session cache",
-                        "Verify persistence"
-                    ]
-                },
-                {
-                    "name": "Algorithm Retraining",
-                    "steps": [
-                        "Analyze traffic patterns",
-                        "Retrain neural network",
-                        "Update routing rules",
-                        "Test load distribution"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Session State Analyzer",
-                "Neural Network Debugger",
-                "Quantum Accelerator Toolkit",
-                "Cluster State Validator"
-            ]
-        },
-        {
-            "name": "SecureGate™ Quantum Firewall",
-            "manufacturer": "CyberQuantum Defense",
-            "model": "SG-8000",
-            "release_date": "2146",
-            "repair_difficulty": 4.5,
-            "specs": {
-                "throughput": "500 Petabits/second",
-                "inspection": "Deep quantum packet analysis",
-                "threat_detection": "AI + quantum pattern matching",
-                "encryption": "Post-quantum cryptography",
-                "virtual_contexts": "1000 quantum-isolated instances",
-                "updates": "Real-time quantum threat database"
-            },
-            "common_failures": [
-                "Quantum pattern matcher corruption",
-                "Threat database synchronization failure",
-                "Virtual context isolation breach",
-                "Cryptographic module failure",
-                "AI detection engine crash"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Pattern Matcher Recovery",
-                    "steps": [
-                        "Reset quantum patterns",
-                        "Rebuild threat database",
-                        "Verify detection accuracy",
-                        "Test false positive rate"
-                    ]
-                },
-                {
-                    "name": "Context Isolation Repair",
-                    "steps": [
-                        "Verify quantum barriers",
-                        "Reset context states",
-                        "Rebuild isolation tables",
-                        "Test context separation"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Pattern Debug Kit",
-                "Threat Database Analyzer",
-                "Context Isolation Tester",
-                "Cryptographic Module Validator"
-            ]
-        }
-    ],
-    "medical-equipment": [
-        {
-            "name": "NeuroScan™ Quantum MRI",
-            "manufacturer": "MedTech Quantum",
-            "model": "NSQ-9000",
-            "release_date": "2145",
-            "repair_difficulty": 5,
-            "specs": {
-                "field_strength": "15 Tesla with quantum field stabilization",
-                "resolution": "0.1mm isotropic",
-                "scan_speed": "Full brain scan in 30 seconds",
-                "ai_analysis": "Real-time neural pattern recognition",
-                "safety": "Quantum field containment system",
-                "patient_monitoring": "Continuous vital sign tracking"
-            },
-            "common_failures": [
-                "Quantum field instability",
-                "Neural pattern recognition drift",
-                "Patient monitoring desynchronization",
-                "Cooling system quantum crystallization",
-                "AI diagnostic algorithm corruption"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Field Stabilization",
-                    "steps": [
-                        "Initiate emergency field shutdown",
-                        "Recalibrate quantum stabilizers",
-                        "Verify field symmetry",
-                        "Perform staged power-up"
-                    ]
-                },
-                {
-                    "name": "AI System Recovery",
-                    "steps": [
-                        "Backup diagnostic patterns",
-                        "Reset neural processors",
-                        "Rebuild recognition models",
-                        "Verify diagnostic accuracy"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Field Analyzer",
-                "Neural Pattern Debugger",
-                "Patient Monitor Calibrator",
-                "AI Diagnostic Validator"
-            ]
-        },
-        {
-            "name": "BioSync™ Life Support System",
-            "manufacturer": "LifeTech Systems",
-            "model": "BLS-8000",
-            "release_date": "2146",
-            "repair_difficulty": 4.5,
-            "specs": {
-                "capacity": "10 patients simultaneously",
-                "monitoring": "Continuous quantum biofeedback",
-                "life_support": "AI-driven adaptive systems",
-                "redundancy": "Triple-redundant critical systems",
-                "power": "Quantum battery backup (72 hours)",
-                "safety": "Automated emergency protocols"
-            },
-            "common_failures": [
-                "Biofeedback quantum desync",
-                "Life support algorithm drift",
-                "Power system quantum leakage",
-                "Emergency protocol failure",
-                "Patient data corruption"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Biofeedback Recovery",
-                    "steps": [
-                        "Reset quantum sensors",
-                        "Recalibrate monitoring systems",
-                        "Verify patient data integrity",
-                        "Test feedback loops"
-                    ]
-                },
-                {
-                    "name": "Life Support Reset",
-                    "steps": [
-                        "Backup patient parameters",
-                        "Reset control algorithms",
-                        "Verify system redundancy",
-                        "Test emergency protocols"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Biofeedback Analyzer",
-                "Life Support Debug Kit",
-                "Power System Validator",
-                "Emergency Protocol Tester"
-            ]
-        },
-        {
-            "name": "NanoMed™ Surgical Robot",
-            "manufacturer": "SurgicalTech Robotics",
-            "model": "NSR-7000",
-            "release_date": "2145",
-            "repair_difficulty": 4,
-            "specs": {
-                "precision": "0.01mm surgical accuracy",
-                "ai_control": "Neural network guidance",
-                "instruments": "Quantum-stabilized tools",
-                "imaging": "Real-time quantum tomography",
-                "safety": "Triple-redundant control systems",
-                "training": "Virtual reality simulation mode"
-            },
-            "common_failures": [
-                "Surgical precision drift",
-                "Neural control pattern corruption",
-                "Quantum tool stabilization failure",
-                "Imaging system desynchronization",
-                "Safety system false positives"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Precision Calibration",
-                    "steps": [
-                        "Initialize calibration sequence",
-                        "Test movement accuracy",
-                        "Verify tool alignment",
-                        "Update control algorithms"
-                    ]
-                },
-                {
-                    "name": "Neural Control Reset",
-                    "steps": [
-                        "Backup control patterns",
-                        "Reset neural processors",
-                        "Rebuild movement models",
-                        "Test surgical accuracy"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Surgical Precision Calibrator",
-                "Neural Control Debugger",
-                "Quantum Tool Analyzer",
-                "Imaging System Validator"
-            ]
-        },
-        {
-            "name": "GeneTherapy™ Treatment System",
-            "manufacturer": "BioQuantum Solutions",
-            "model": "GTS-6000",
-            "release_date": "2146",
-            "repair_difficulty": 4.5,
-            "specs": {
-                "treatment": "Quantum-assisted gene editing",
-                "monitoring": "Real-time cellular analysis",
-                "safety": "Triple containment system",
-                "ai_control": "Adaptive treatment protocols",
-                "power": "Quantum energy cell",
-                "redundancy": "Backup treatment systems"
-            },
-            "common_failures": [
-                "Gene editing quantum drift",
-                "Cellular analysis corruption",
-                "Containment system breach",
-                "Treatment protocol failure",
-                "Power system instability"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Quantum System Recovery",
-                    "steps": [
-                        "Reset quantum processors",
-                        "Recalibrate editing systems",
-                        "Verify containment integrity",
-                        "Test treatment accuracy"
-                    ]
-                },
-                {
-                    "name": "Analysis System Reset",
-                    "steps": [
-                        "Backup cellular data",
-                        "Reset analysis algorithms",
-                        "Rebuild monitoring systems",
-                        "Verify data integrity"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Gene Analyzer",
-                "Cellular Monitor Debugger",
-                "Containment System Tester",
-                "Treatment Protocol Validator"
-            ]
-        }
-    ],
-    "automotive-systems": [
-        {
-            "name": "QuantumDrive™ Propulsion System",
-            "manufacturer": "AutoTech Quantum",
-            "model": "QDP-9000",
-            "release_date": "2145",
-            "repair_difficulty": 5,
-            "specs": {
-                "power": "500kW quantum-enhanced electric motor",
-                "range": "2000km on single charge",
-                "charging": "5-minute quantum fast charge",
-                "control": "AI-optimized power management",
-                "cooling": "Quantum phase-change system",
-                "safety": "Triple-redundant power control"
-            },
-            "common_failures": [
-                "Quantum motor desynchronization",
-                "Power management algorithm drift",
-                "Cooling system quantum crystallization",
-                "Charging system quantum interference",
-                "Safety system false triggers"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Motor System Recovery",
-                    "steps": [
-                        "Initiate emergency shutdown",
-                        "Reset quantum field generators",
-                        "Recalibrate motor controllers",
-                        "Verify power distribution"
-                    ]
-                },
-                {
-                    "name": "Cooling System Reset",
-                    "steps": [
-                        "Check quantum phase state",
-                        "Reset cooling algorithms",
-                        "Verify temperature sensors",
-                        "Test cooling efficiency"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Motor Analyzer",
-                "Power Management Debugger",
-                "Phase-Change System Tester",
-                "Safety System Validator"
-            ]
-        },
-        {
-            "name": "AutoPilot™ Navigation System",
-            "manufacturer": "NavTech Systems",
-            "model": "AP-8000",
-            "release_date": "2146",
-            "repair_difficulty": 4.5,
-            "specs": {
-                "processing": "Quantum neural network",
-                "sensors": "360° quantum radar array",
-                "mapping": "Real-time quantum cartography",
-                "decision": "AI-driven path planning",
-                "redundancy": "Triple sensor arrays",
-                "updates": "Over-the-air quantum sync"
-            },
-            "common_failures": [
-                "Neural network pattern corruption",
-                "Quantum radar desynchronization",
-                "Mapping system drift",
-                "AI decision algorithm failure",
-                "Sensor array misalignment"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Neural Network Reset",
-                    "steps": [
-                        "Backup driving patterns",
-                        "Reset neural processors",
-                        "Rebuild decision models",
-                        "Verify navigation accuracy"
-                    ]
-                },
-                {
-                    "name": "Sensor Array Calibration",
-                    "steps": [
-                        "Initialize calibration sequence",
-                        "Align quantum radar units",
-                        "Test sensor accuracy",
-                        "Verify redundancy"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Neural Network Debugger",
-                "Quantum Radar Calibrator",
-                "Mapping System Analyzer",
-                "AI Decision Validator"
-            ]
-        },
-        {
-            "name": "SafeGuard™ Collision Prevention",
-            "manufacturer": "SafetyTech Solutions",
-            "model": "SCP-7000",
-            "release_date": "2145",
-            "repair_difficulty": 4,
-            "specs": {
-                "detection": "Quantum-enhanced lidar",
-                "response": "0.001s reaction time",
-                "analysis": "AI threat assessment",
-                "control": "Emergency maneuver system",
-                "redundancy": "Triple sensor arrays",
-                "updates": "Real-time threat database"
-            },
-            "common_failures": [
-                "Lidar quantum interference",
-                "Response system latency",
-                "Threat assessment errors",
-                "Maneuver control drift",
-                "Sensor array desync"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Lidar System Recovery",
-                    "steps": [
-                        "Reset quantum emitters",
-                        "Recalibrate detection arrays",
-                        "Verify response timing",
-                        "Test threat detection"
-                    ]
-                },
-                {
-                    "name": "Control System Reset",
-                    "steps": [
-                        "Backup control patterns",
-                        "Reset maneuver algorithms",
-                        "Verify system response",
-                        "Test emergency protocols"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Lidar Analyzer",
-                "Response System Tester",
-                "Threat Assessment Debugger",
-                "Control System Validator"
-            ]
-        },
-        {
-            "name": "EcoFlow™ Energy Management",
-            "manufacturer": "PowerTech Systems",
-            "model": "EF-6000",
-            "release_date": "2146",
-            "repair_difficulty": 3,
-            "specs": {
-                "capacity": "200kWh quantum battery",
-                "efficiency": "99.9% power conversion",
-                "charging": "Bidirectional quantum transfer",
-                "management": "AI-optimized distribution",
-                "monitoring": "Real-time quantum analysis",
-                "safety": "Triple-redundant protection"
-            },
-            "common_failures": [
-                "Battery quantum state collapse",
-                "Power conversion inefficiency",
-                "Charging system interference",
-                "Distribution algorithm drift",
-                "Monitoring system desync"
-            ],
-            "troubleshooting_procedures": [
-                {
-                    "name": "Battery System Recovery",
-                    "steps": [
-                        "Reset quantum state",
-                        "Recalibrate conversion systems",
-                        "Verify charging circuits",
-                        "Test power distribution"
-                    ]
-                },
-                {
-                    "name": "Management System Reset",
-                    "steps": [
-                        "Backup power patterns",
-                        "Reset distribution algorithms",
-                        "Verify monitoring accuracy",
-                        "Test safety protocols"
-                    ]
-                }
-            ],
-            "special_tools": [
-                "Quantum Battery Analyzer",
-                "Power Conversion Tester",
-                "Charging System Debugger",
-                "Distribution System Validator"
-            ]
-        }
-    ]
-} 
\ No newline at end of file
+"""Hardware catalog data files.
+
+The catalog ships as one data file per category in ``data/hardware``, mirroring
+the ``docs/hardware/*.md`` split. Each file is a stream of records: a header
+record (``{"format_version": 1, "category": "..."}``) followed by one record per
+hardware item. Files are only opened when a category is iterated, so importing
+this module costs nothing and large third-party catalogs never have to be held
+in memory or live in Python source.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Directory holding the bundled catalog data files
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'hardware')
+
+# Optional manifest fixing category order (and therefore category ids on migration)
+CATALOG_INDEX = 'index.json'
+
+# Data file format version understood by the readers below
+CATALOG_FORMAT_VERSION = 1
+
+
+class CatalogFormatError(ValueError):
+    """Raised when a catalog data file is malformed or uses an unsupported version."""
+
+
+def _read_jsonl_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSON Lines file, one line at a time."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _read_msgpack_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a file of concatenated msgpack maps."""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(f"The msgpack package is required to read {path}") from e
+    with open(path, 'rb') as f:
+        yield from msgpack.Unpacker(f, raw=False)
+
+
+# Record readers keyed by file extension
+RECORD_READERS: Dict[str, Callable[[str], Iterator[Dict[str, Any]]]] = {
+    '.jsonl': _read_jsonl_records,
+    '.msgpack': _read_msgpack_records,
+}
+
+
+def register_record_reader(extension: str, reader: Callable[[str], Iterator[Dict[str, Any]]]):
+    """Register a reader for catalog data files with the given extension.
+
+    Args:
+        extension: File extension including the dot (e.g. '.cbor')
+        reader: Callable taking a file path and yielding header then item records
+    """
+    RECORD_READERS[extension] = reader
+
+
+class CatalogLoader:
+    """Streams hardware items from a directory of per-category data files."""
+
+    def __init__(self, catalog_dir: Optional[str] = None):
+        self.catalog_dir = catalog_dir or CATALOG_DIR
+
+    def _category_files(self) -> List[Tuple[str, str]]:
+        """Get (category, path) pairs, in index order when an index is present."""
+        index_path = os.path.join(self.catalog_dir, CATALOG_INDEX)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self._check_version(index, index_path)
+            return [(entry['name'], os.path.join(self.catalog_dir, entry['file']))
+                    for entry in index['categories']]
+
+        files = []
+        for filename in sorted(os.listdir(self.catalog_dir)):
+            name, extension = os.path.splitext(filename)
+            if extension in RECORD_READERS:
+                files.append((name, os.path.join(self.catalog_dir, filename)))
+        return files
+
+    @staticmethod
+    def _check_version(record: Dict[str, Any], path: str):
+        version = record.get('format_version')
+        if version != CATALOG_FORMAT_VERSION:
+            raise CatalogFormatError(
+                f"{path}: unsupported catalog format version {version!r} "
+                f"(expected {CATALOG_FORMAT_VERSION})"
+            )
+
+    def categories(self) -> List[str]:
+        """Get the category names available in the catalog."""
+        return [name for name, _ in self._category_files()]
+
+    def iter_items(self, category: str) -> Iterator[Dict[str, Any]]:
+        """Stream the hardware items of a single category."""
+        for name, path in self._category_files():
+            if name == category:
+                return self._iter_file(name, path)
+        raise KeyError(f"Unknown hardware category: {category}")
+
+    def iter_catalog(self) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """Stream (category, items) pairs; each category file is opened on demand."""
+        for name, path in self._category_files():
+            yield name, self._iter_file(name, path)
+
+    def _iter_file(self, category: str, path: str) -> Iterator[Dict[str, Any]]:
+        extension = os.path.splitext(path)[1]
+        reader = RECORD_READERS.get(extension)
+        if reader is None:
+            raise CatalogFormatError(f"{path}: no reader registered for '{extension}' files")
+
+        records = reader(path)
+        header = next(records, None)
+        if header is None:
+            raise CatalogFormatError(f"{path}: missing header record")
+        self._check_version(header, path)
+        if header.get('category', category) != category:
+            raise CatalogFormatError(
+                f"{path}: header category {header['category']!r} does not match {category!r}"
+            )
+        return records
+
+
+_loader: Optional[CatalogLoader] = None
+
+
+def get_loader() -> CatalogLoader:
+    """Get the active catalog loader, creating the default one on first use."""
+    global _loader
+    if _loader is None:
+        _loader = CatalogLoader()
+    return _loader
+
+
+def set_loader(loader: Optional[CatalogLoader]):
+    """Replace the active catalog loader (None restores the bundled catalog)."""
+    global _loader
+    _loader = loader
+
+
+def iter_catalog() -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+    """Stream (category, items) pairs from the active loader."""
+    return get_loader().iter_catalog()
+
+
+def __getattr__(name):
+    # Kept for callers that still expect the old in-memory dict; this reads every file.
+    if name == 'HARDWARE_CATALOG':
+        return {category: list(items) for category, items in iter_catalog()}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,194 @@
+"""Generate the docs/hardware category pages from the hardware catalog database.
+
+Each category is rendered in its own worker process using the batch detail
+API, and a manifest of content hashes is kept next to the pages so that only
+categories whose rendered content changed are rewritten. Pages in the
+manifest whose category no longer exists are deleted.
+
+Usage:
+    python -m hardware.docs [--output DIR] [--workers N] [--force]
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from shared.database import DatabaseConnection
+from . import models
+
+# Default output directory for the category pages
+DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'docs', 'hardware')
+
+# Content hashes of the last published pages, kept alongside them
+MANIFEST_FILE = '.catalog-manifest.json'
+
+# Introductions for the bundled categories; other categories get a generic one
+CATEGORY_INTROS = {
+    'consumer-electronics': "This category covers common household and personal electronic devices that frequently require repair.",
+    'industrial-equipment': "This category covers heavy industrial machinery, manufacturing equipment, and industrial control systems commonly found in factories, processing plants, and industrial facilities.",
+    'networking-devices': "This category covers advanced networking equipment used in enterprise, datacenter, and quantum communication infrastructure.",
+    'medical-equipment': "This category covers advanced medical devices and diagnostic equipment used in hospitals, clinics, and research facilities.",
+    'automotive-systems': "This category covers advanced vehicle systems, including autonomous driving, propulsion, and safety systems used in modern transportation.",
+}
+
+DIFFICULTY_LABELS = {1: "Trivial", 2: "Low", 3: "Moderate", 4: "High", 5: "Expert"}
+
+
+def difficulty_label(difficulty: float) -> str:
+    """Label a repair difficulty; half steps fall between two labels, e.g. 'High to Expert'."""
+    lower = DIFFICULTY_LABELS.get(math.floor(difficulty))
+    upper = DIFFICULTY_LABELS.get(math.ceil(difficulty))
+    if lower is None or upper is None:
+        return "Unknown"
+    return lower if lower == upper else f"{lower} to {upper}"
+
+
+def category_title(category_name: str) -> str:
+    """Turn a category slug like 'consumer-electronics' into 'Consumer Electronics'."""
+    return ' '.join(word.capitalize() for word in category_name.split('-'))
+
+
+def render_item(item: Dict, details: Dict) -> str:
+    """Render the markdown section for a single hardware item."""
+    lines = [f"## {item['name']}", ""]
+    lines.append(f"**Manufacturer:** {item['manufacturer']}  ")
+    lines.append(f"**Model Number:** {item['model']}  ")
+    if item['release_date']:
+        lines.append(f"**Release Date:** {item['release_date']}  ")
+    difficulty = item['repair_difficulty']
+    if difficulty is not None:
+        label = difficulty_label(difficulty)
+        lines.append(f"**Repair Difficulty:** {label} ({difficulty}/5)")
+    else:
+        lines.append("**Repair Difficulty:** Unrated")
+
+    specs = [f"- {name.replace('_', ' ').title()}: {value}" for name, value in details['specs'].items()]
+    if item['operating_system']:
+        specs.append(f"- Operating System: {item['operating_system']}")
+    if specs:
+        lines.extend(["", "### Specifications", *specs])
+
+    if details['failures']:
+        lines.extend(["", "### Common Failure Modes"])
+        lines.extend(f"{i}. {failure}" for i, failure in enumerate(details['failures'], 1))
+
+    if details['procedures']:
+        lines.extend(["", "### Troubleshooting Procedures"])
+        for i, procedure in enumerate(details['procedures'], 1):
+            if i > 1:
+                lines.append("")
+            lines.append(f"{i}. **{procedure['name']}**")
+            lines.extend(f"   - {step['description']}" for step in procedure['steps'])
+
+    if details['special_tools']:
+        lines.extend(["", "### Special Tools Required"])
+        lines.extend(f"- {tool}" for tool in details['special_tools'])
+
+    return "\n".join(lines)
+
+
+def render_category(category_name: str, items, details: Dict) -> str:
+    """Render the full markdown page for a category."""
+    intro = CATEGORY_INTROS.get(
+        category_name,
+        f"This category covers {category_title(category_name).lower()} hardware."
+    )
+    sections = [f"# {category_title(category_name)}", intro]
+    sections.extend(render_item(item, details[item['id']]) for item in items)
+    return "\n\n".join(sections) + "\n"
+
+
+def _init_worker(db_paths: Dict[str, str]):
+    """Point a worker process at the same database files as the parent."""
+    DatabaseConnection.set_test_db_paths(db_paths)
+
+
+def _render_category_page(category: Dict):
+    """Render one category page; runs inside a worker process."""
+    items = models.get_hardware_items(category['id'])
+    details = models.get_hardware_details([item['id'] for item in items])
+    content = render_category(category['name'], items, details)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return category['name'], content, digest
+
+
+def _load_manifest(output_dir: str) -> Dict[str, str]:
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def generate_catalog_docs(output_dir: Optional[str] = None, workers: Optional[int] = None, force: bool = False) -> Dict[str, str]:
+    """Render one markdown page per hardware category.
+
+    Args:
+        output_dir: Directory to write the pages to (defaults to docs/hardware)
+        workers: Number of worker processes (defaults to one per category, capped
+            at the CPU count); 1 renders in-process
+        force: Rewrite every page even if its content hash is unchanged
+
+    Returns:
+        Mapping of category name to 'written', 'unchanged' or 'removed'
+    """
+    output_dir = output_dir or DOCS_DIR
+    os.makedirs(output_dir, exist_ok=True)
+
+    categories = models.get_hardware_categories()
+    if workers is None:
+        workers = min(len(categories), os.cpu_count() or 1)
+
+    if workers <= 1:
+        rendered = [_render_category_page(category) for category in categories]
+    else:
+        db_paths = {'hardware': DatabaseConnection.get_db_path('hardware')}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(db_paths,)) as executor:
+            rendered = list(executor.map(_render_category_page, categories))
+
+    manifest = _load_manifest(output_dir)
+    results = {}
+    for category_name, content, digest in rendered:
+        filename = f"{category_name}.md"
+        path = os.path.join(output_dir, filename)
+        if not force and manifest.get(filename) == digest and os.path.exists(path):
+            results[category_name] = 'unchanged'
+            continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        manifest[filename] = digest
+        results[category_name] = 'written'
+
+    # Remove pages published for categories that no longer exist
+    current = {f"{category_name}.md" for category_name, _, _ in rendered}
+    for filename in sorted(set(manifest) - current):
+        path = os.path.join(output_dir, filename)
+        if os.path.exists(path):
+            os.remove(path)
+        del manifest[filename]
+        results[filename[:-len('.md')]] = 'removed'
+
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate hardware catalog docs from the catalog database.")
+    parser.add_argument('--output', help="Output directory (default: docs/hardware)")
+    parser.add_argument('--workers', type=int, help="Number of worker processes")
+    parser.add_argument('--force', action='store_true', help="Rewrite pages even if unchanged")
+    args = parser.parse_args()
+
+    results = generate_catalog_docs(args.output, args.workers, args.force)
+    for category_name, status in results.items():
+        print(f"{category_name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
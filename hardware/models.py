@@ -48,11 +48,153 @@ CREATE TABLE IF NOT EXISTS special_tools
  hardware_id INTEGER NOT NULL,
  tool_name TEXT NOT NULL,
  FOREIGN KEY (hardware_id) REFERENCES hardware_items(id));
+
+CREATE TABLE IF NOT EXISTS procedure_terms
+(term TEXT NOT NULL,
+ procedure_id INTEGER NOT NULL,
+ weight REAL NOT NULL,
+ PRIMARY KEY (term, procedure_id),
+ FOREIGN KEY (procedure_id) REFERENCES troubleshooting_procedures(id));
+
+CREATE TABLE IF NOT EXISTS failure_procedure_suggestions
+(failure_id INTEGER NOT NULL,
+ rank INTEGER NOT NULL,
+ procedure_id INTEGER NOT NULL,
+ score REAL NOT NULL,
+ PRIMARY KEY (failure_id, rank),
+ FOREIGN KEY (failure_id) REFERENCES hardware_failures(id),
+ FOREIGN KEY (procedure_id) REFERENCES troubleshooting_procedures(id));
+
+CREATE INDEX IF NOT EXISTS idx_hardware_failures_hardware
+ON hardware_failures (hardware_id);
+
+CREATE INDEX IF NOT EXISTS idx_hardware_items_identity
+ON hardware_items (name, model, manufacturer);
+
+CREATE TABLE IF NOT EXISTS hardware_statistics
+(scope TEXT NOT NULL,
+ name TEXT NOT NULL,
+ value INTEGER NOT NULL DEFAULT 0,
+ PRIMARY KEY (scope, name));
+'''
+
+# Catalog tables and their columns, parents before children
+CATALOG_TABLES = {
+    'hardware_categories': ['id', 'name'],
+    'hardware_items': ['id', 'category_id', 'name', 'manufacturer', 'model',
+                       'release_date', 'repair_difficulty', 'operating_system'],
+    'hardware_specs': ['id', 'hardware_id', 'spec_name', 'spec_value'],
+    'hardware_failures': ['id', 'hardware_id', 'failure_description'],
+    'troubleshooting_procedures': ['id', 'hardware_id', 'name'],
+    'troubleshooting_steps': ['id', 'procedure_id', 'step_number', 'description'],
+    'special_tools': ['id', 'hardware_id', 'tool_name'],
+}
+
+# Queries that rebuild every hardware_statistics row from the catalog tables
+STATISTICS_REBUILD_SQL = '''
+DELETE FROM hardware_statistics;
+
+INSERT INTO hardware_statistics (scope, name, value)
+SELECT 'total', 'hardware', COUNT(*) FROM hardware_items
+UNION ALL SELECT 'total', 'categories', COUNT(*) FROM hardware_categories
+UNION ALL SELECT 'total', 'specs', COUNT(*) FROM hardware_specs
+UNION ALL SELECT 'total', 'failures', COUNT(*) FROM hardware_failures
+UNION ALL SELECT 'total', 'procedures', COUNT(*) FROM troubleshooting_procedures
+UNION ALL SELECT 'total', 'special_tools', COUNT(*) FROM special_tools;
+
+INSERT INTO hardware_statistics (scope, name, value)
+SELECT 'category_hardware', hc.name, COUNT(hi.id)
+FROM hardware_categories hc
+LEFT JOIN hardware_items hi ON hi.category_id = hc.id
+GROUP BY hc.id;
+
+INSERT INTO hardware_statistics (scope, name, value)
+SELECT 'category_failures', hc.name, COUNT(hf.id)
+FROM hardware_categories hc
+LEFT JOIN hardware_items hi ON hi.category_id = hc.id
+LEFT JOIN hardware_failures hf ON hf.hardware_id = hi.id
+GROUP BY hc.id;
+
+INSERT INTO hardware_statistics (scope, name, value)
+SELECT 'difficulty', COALESCE(CAST(repair_difficulty AS TEXT), 'unrated'), COUNT(*)
+FROM hardware_items
+GROUP BY repair_difficulty;
 '''
 
 def init_db():
     """Initialize the hardware catalog database."""
     DatabaseConnection.init_db('hardware', HARDWARE_SCHEMA)
+    
+    # Build the statistics snapshot and triage index for catalogs created before they existed
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("SELECT COUNT(*) FROM hardware_statistics")
+        if cursor.fetchone()[0] == 0:
+            rebuild_hardware_statistics(cursor)
+        
+        cursor.execute("""
+            SELECT EXISTS (SELECT 1 FROM troubleshooting_procedures)
+               AND NOT EXISTS (SELECT 1 FROM procedure_terms)
+        """)
+        if cursor.fetchone()[0]:
+            from .triage import build_relevance_index
+            build_relevance_index(cursor)
+
+def rebuild_hardware_statistics(cursor):
+    """Recompute the statistics snapshot from the catalog tables.
+    
+    Used after bulk loads (migration, snapshot import); single-row writes
+    adjust the snapshot incrementally instead.
+    
+    Args:
+        cursor: Cursor on the hardware database, inside the caller's transaction
+    """
+    for statement in STATISTICS_REBUILD_SQL.split(';'):
+        if statement.strip():
+            cursor.execute(statement)
+
+def clear_hardware_catalog(cursor):
+    """Delete every catalog row, children before parents, along with the triage index.
+    
+    Args:
+        cursor: Cursor on the hardware database, inside the caller's transaction
+    """
+    cursor.execute("DELETE FROM failure_procedure_suggestions")
+    cursor.execute("DELETE FROM procedure_terms")
+    cursor.execute("DELETE FROM troubleshooting_steps")
+    cursor.execute("DELETE FROM troubleshooting_procedures")
+    cursor.execute("DELETE FROM special_tools")
+    cursor.execute("DELETE FROM hardware_failures")
+    cursor.execute("DELETE FROM hardware_specs")
+    cursor.execute("DELETE FROM hardware_items")
+    cursor.execute("DELETE FROM hardware_categories")
+
+def bulk_insert_rows(cursor, table, columns, rows):
+    """Insert many rows into a catalog table with a single prepared statement.
+    
+    Args:
+        cursor: Cursor on the hardware database, inside the caller's transaction
+        table (str): Name of a table from CATALOG_TABLES
+        columns (list): Column names, in the order of each row's values
+        rows (iterable): Row tuples to insert
+    """
+    if table not in CATALOG_TABLES:
+        raise ValueError(f"Unknown catalog table: {table}")
+    unknown = set(columns) - set(CATALOG_TABLES[table])
+    if unknown:
+        raise ValueError(f"Unknown columns for {table}: {sorted(unknown)}")
+    placeholders = ','.join('?' * len(columns))
+    cursor.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+        rows
+    )
+
+def _bump_statistic(cursor, scope, name, delta=1):
+    """Adjust a single statistics counter by delta."""
+    cursor.execute("""
+        INSERT INTO hardware_statistics (scope, name, value)
+        VALUES (?, ?, ?)
+        ON CONFLICT (scope, name) DO UPDATE SET value = value + excluded.value
+    """, (scope, name, delta))
 
 def get_hardware_categories():
     """Get all hardware categories from the database."""
@@ -140,21 +282,113 @@ def get_special_tools(hardware_id):
         """, (hardware_id,))
         return [row[0] for row in cursor.fetchall()]
 
+def _chunked(values, size=500):
+    """Split a list of query parameters into chunks that fit SQLite's variable limit."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def get_hardware_details(hardware_ids):
+    """Get specs, failures, procedures and special tools for many hardware items at once.
+    
+    Runs one query per detail table for each chunk of ids instead of one query
+    per item, so rendering a whole category stays a handful of round trips.
+    
+    Args:
+        hardware_ids (list): IDs of the hardware items to load
+        
+    Returns:
+        dict: Mapping of hardware ID to a dict with 'specs', 'failures',
+            'procedures' and 'special_tools' keys
+    """
+    details = {
+        hardware_id: {"specs": {}, "failures": [], "procedures": [], "special_tools": []}
+        for hardware_id in hardware_ids
+    }
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        for chunk in _chunked(list(details)):
+            placeholders = ','.join('?' * len(chunk))
+            
+            cursor.execute(f"""
+                SELECT hardware_id, spec_name, spec_value
+                FROM hardware_specs
+                WHERE hardware_id IN ({placeholders})
+                ORDER BY id
+            """, chunk)
+            for hardware_id, spec_name, spec_value in cursor.fetchall():
+                details[hardware_id]["specs"][spec_name] = spec_value
+            
+            cursor.execute(f"""
+                SELECT hardware_id, failure_description
+                FROM hardware_failures
+                WHERE hardware_id IN ({placeholders})
+                ORDER BY id
+            """, chunk)
+            for hardware_id, failure in cursor.fetchall():
+                details[hardware_id]["failures"].append(failure)
+            
+            cursor.execute(f"""
+                SELECT tp.hardware_id, tp.id, tp.name, ts.step_number, ts.description
+                FROM troubleshooting_procedures tp
+                LEFT JOIN troubleshooting_steps ts ON ts.procedure_id = tp.id
+                WHERE tp.hardware_id IN ({placeholders})
+                ORDER BY tp.id, ts.step_number
+            """, chunk)
+            procedures = {}
+            for hardware_id, procedure_id, name, step_number, description in cursor.fetchall():
+                procedure = procedures.get(procedure_id)
+                if procedure is None:
+                    procedure = {"id": procedure_id, "name": name, "steps": []}
+                    procedures[procedure_id] = procedure
+                    details[hardware_id]["procedures"].append(procedure)
+                if step_number is not None:
+                    procedure["steps"].append({"number": step_number, "description": description})
+            
+            cursor.execute(f"""
+                SELECT hardware_id, tool_name
+                FROM special_tools
+                WHERE hardware_id IN ({placeholders})
+                ORDER BY id
+            """, chunk)
+            for hardware_id, tool in cursor.fetchall():
+                details[hardware_id]["special_tools"].append(tool)
+    return details
+
 def get_hardware_statistics():
-    """Get statistics about the hardware catalog."""
+    """Get statistics about the hardware catalog.
+    
+    Reads the whole statistics snapshot in a single query.
+    
+    Returns:
+        dict: Totals ('total_hardware', 'total_categories', 'total_specs',
+            'total_failures', 'total_procedures', 'total_special_tools'),
+            'by_category' mapping category name to hardware and failure counts,
+            and 'difficulty_histogram' mapping repair difficulty as text
+            (e.g. '3', '4.5' or 'unrated') to item counts
+    """
     with DatabaseConnection.get_cursor('hardware') as cursor:
-        # Count hardware items
-        cursor.execute("SELECT COUNT(*) FROM hardware_items")
-        total_hardware = cursor.fetchone()[0]
-        
-        # Count hardware categories
-        cursor.execute("SELECT COUNT(*) FROM hardware_categories")
-        total_categories = cursor.fetchone()[0]
-        
-        return {
-            "total_hardware": total_hardware,
-            "total_categories": total_categories
-        }
+        cursor.execute("SELECT scope, name, value FROM hardware_statistics")
+        rows = cursor.fetchall()
+    
+    statistics = {
+        "total_hardware": 0,
+        "total_categories": 0,
+        "total_specs": 0,
+        "total_failures": 0,
+        "total_procedures": 0,
+        "total_special_tools": 0,
+        "by_category": {},
+        "difficulty_histogram": {}
+    }
+    for scope, name, value in rows:
+        if scope == 'total':
+            statistics[f"total_{name}"] = value
+        elif scope == 'category_hardware':
+            statistics["by_category"].setdefault(name, {"hardware": 0, "failures": 0})["hardware"] = value
+        elif scope == 'category_failures':
+            statistics["by_category"].setdefault(name, {"hardware": 0, "failures": 0})["failures"] = value
+        elif scope == 'difficulty' and value:
+            statistics["difficulty_histogram"][name] = value
+    return statistics
 
 def add_hardware_item(category_id, name, manufacturer, model):
     """Add a new hardware item to the catalog.
@@ -175,6 +409,13 @@ def add_hardware_item(category_id, name, manufacturer, model):
                 INSERT INTO hardware_items (category_id, name, manufacturer, model)
                 VALUES (?, ?, ?, ?)
             """, (category_id, name, manufacturer, model))
+            
+            # Keep the statistics snapshot in step with the new item
+            cursor.execute("SELECT name FROM hardware_categories WHERE id = ?", (category_id,))
+            category_name = cursor.fetchone()[0]
+            _bump_statistic(cursor, 'total', 'hardware')
+            _bump_statistic(cursor, 'category_hardware', category_name)
+            _bump_statistic(cursor, 'difficulty', 'unrated')
             return True, None
     except Exception as e:
         return False, str(e)
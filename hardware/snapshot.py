@@ -0,0 +1,186 @@
+"""Export and import the hardware catalog as a single snapshot file.
+
+A snapshot is a deflate-compressed zip archive holding a ``manifest.json`` and
+the seven catalog tables split into row groups. Each row group is stored
+column-wise (``{"columns": [...], "data": [[col0 values], [col1 values], ...]}``)
+so repeated values compress well, and carries a sha256 checksum in the manifest.
+Row ids are preserved, so an imported catalog is identical to the exported one.
+
+Import streams one row group at a time into ``executemany`` inside a single
+transaction, checking each group's checksum as it is read, then rebuilds the
+statistics snapshot and triage index.
+
+Usage:
+    python -m hardware.snapshot export PATH
+    python -m hardware.snapshot import PATH
+"""
+import argparse
+import hashlib
+import json
+import zipfile
+from typing import Dict
+
+from shared.database import DatabaseConnection
+from . import models, triage
+
+# Snapshot format version understood by import_catalog_snapshot
+SNAPSHOT_FORMAT_VERSION = 1
+
+MANIFEST_MEMBER = 'manifest.json'
+
+# Rows per row group; bounds memory on both export and import
+DEFAULT_ROW_GROUP_SIZE = 5000
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is malformed, corrupt or of an unsupported version."""
+
+
+def _encode_row_group(columns, rows) -> bytes:
+    data = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+    return json.dumps({"columns": columns, "data": data}, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_row_group(payload: bytes, columns, member: str):
+    group = json.loads(payload)
+    if group.get('columns') != columns:
+        raise SnapshotError(f"{member}: columns {group.get('columns')!r} do not match the manifest")
+    return list(zip(*group['data']))
+
+
+def export_catalog_snapshot(path: str, row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> Dict[str, int]:
+    """Write the hardware catalog tables to a snapshot file.
+
+    Args:
+        path: Destination file path
+        row_group_size: Maximum number of rows per row group
+
+    Returns:
+        Mapping of table name to exported row count
+    """
+    manifest = {"format_version": SNAPSHOT_FORMAT_VERSION, "tables": []}
+    counts = {}
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive, \
+            DatabaseConnection.get_cursor('hardware') as cursor:
+        for table, columns in models.CATALOG_TABLES.items():
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+            row_groups = []
+            row_count = 0
+            while True:
+                rows = [tuple(row) for row in cursor.fetchmany(row_group_size)]
+                if not rows:
+                    break
+                member = f"{table}/{len(row_groups):06d}.json"
+                payload = _encode_row_group(columns, rows)
+                archive.writestr(member, payload)
+                row_groups.append({
+                    "member": member,
+                    "rows": len(rows),
+                    "sha256": hashlib.sha256(payload).hexdigest()
+                })
+                row_count += len(rows)
+            manifest["tables"].append({
+                "name": table,
+                "columns": columns,
+                "row_count": row_count,
+                "row_groups": row_groups
+            })
+            counts[table] = row_count
+        archive.writestr(MANIFEST_MEMBER, json.dumps(manifest, indent=4))
+    return counts
+
+
+def _read_manifest(archive: zipfile.ZipFile) -> Dict:
+    try:
+        manifest = json.loads(archive.read(MANIFEST_MEMBER))
+    except KeyError:
+        raise SnapshotError("Snapshot has no manifest")
+    version = manifest.get('format_version')
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(
+            f"Unsupported snapshot format version {version!r} (expected {SNAPSHOT_FORMAT_VERSION})"
+        )
+    tables = {table['name']: table for table in manifest.get('tables', [])}
+    missing = [name for name in models.CATALOG_TABLES if name not in tables]
+    if missing:
+        raise SnapshotError(f"Snapshot is missing tables: {', '.join(missing)}")
+    return tables
+
+
+def verify_catalog_snapshot(path: str) -> Dict[str, int]:
+    """Check a snapshot's manifest and row group checksums without importing it.
+
+    Returns:
+        Mapping of table name to row count
+    """
+    with zipfile.ZipFile(path) as archive:
+        tables = _read_manifest(archive)
+        for table in tables.values():
+            for group in table['row_groups']:
+                _read_row_group(archive, table, group)
+    return {name: tables[name]['row_count'] for name in models.CATALOG_TABLES}
+
+
+def _read_row_group(archive: zipfile.ZipFile, table: Dict, group: Dict):
+    member = group['member']
+    try:
+        payload = archive.read(member)
+    except KeyError:
+        raise SnapshotError(f"Snapshot is missing row group {member}")
+    if hashlib.sha256(payload).hexdigest() != group['sha256']:
+        raise SnapshotError(f"{member}: checksum mismatch")
+    rows = _decode_row_group(payload, table['columns'], member)
+    if len(rows) != group['rows']:
+        raise SnapshotError(f"{member}: expected {group['rows']} rows, found {len(rows)}")
+    return rows
+
+
+def import_catalog_snapshot(path: str) -> Dict[str, int]:
+    """Replace the hardware catalog with the contents of a snapshot file.
+
+    Each row group is checksummed and decoded once, as it is imported. The
+    import runs in one transaction, so a corrupt row group rolls it back and
+    leaves the current catalog in place.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Mapping of table name to imported row count
+    """
+    counts = {}
+    with zipfile.ZipFile(path) as archive, DatabaseConnection.get_cursor('hardware') as cursor:
+        tables = _read_manifest(archive)
+        models.clear_hardware_catalog(cursor)
+        # Parents before children, in CATALOG_TABLES order
+        for name in models.CATALOG_TABLES:
+            table = tables[name]
+            for group in table['row_groups']:
+                rows = _read_row_group(archive, table, group)
+                models.bulk_insert_rows(cursor, name, table['columns'], rows)
+            counts[name] = table['row_count']
+
+        models.rebuild_hardware_statistics(cursor)
+        triage.build_relevance_index(cursor)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import a hardware catalog snapshot.")
+    parser.add_argument('command', choices=['export', 'import', 'verify'])
+    parser.add_argument('path', help="Snapshot file path")
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        counts = export_catalog_snapshot(args.path)
+    elif args.command == 'import':
+        models.init_db()
+        counts = import_catalog_snapshot(args.path)
+    else:
+        counts = verify_catalog_snapshot(args.path)
+    for table, count in counts.items():
+        print(f"{table}: {count}")
+
+
+if __name__ == "__main__":
+    main()
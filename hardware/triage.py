@@ -0,0 +1,220 @@
+"""Failure-to-procedure relevance index for ticket triage.
+
+The indexer runs offline (after migration or snapshot import, or on demand via
+``python -m hardware.triage``). It scores every known failure description
+against every troubleshooting procedure (name plus steps) with TF-IDF cosine
+similarity, boosted for procedures of the same hardware item, and stores:
+
+- ``failure_procedure_suggestions``: the top-k procedures per failure
+- ``procedure_terms``: normalized TF-IDF weights per procedure term, used to
+  score free text that does not match a known failure
+
+Serving a suggestion is then a single indexed query, with no LLM call.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from shared.database import DatabaseConnection
+
+# Number of suggestions stored per failure
+DEFAULT_TOP_K = 5
+
+# Score added to procedures written for the same hardware item as the failure
+SAME_HARDWARE_BONUS = 0.25
+
+STOP_WORDS = {
+    'and', 'for', 'from', 'into', 'its', 'not', 'off', 'the', 'then', 'this',
+    'that', 'with', 'all', 'any', 'are', 'was', 'has', 'have', 'your', 'their',
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase terms, dropping stop words and plural 's'."""
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if len(token) < 3 or token in STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def _normalize(weights: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in weights.items()}
+
+
+def build_relevance_index(cursor, top_k: int = DEFAULT_TOP_K):
+    """Rebuild the procedure term weights and per-failure suggestions.
+
+    Args:
+        cursor: Cursor on the hardware database, inside the caller's transaction
+        top_k: Number of suggestions to keep per failure
+    """
+    cursor.execute("DELETE FROM failure_procedure_suggestions")
+    cursor.execute("DELETE FROM procedure_terms")
+
+    # Build one document per procedure from its name and steps
+    cursor.execute("""
+        SELECT tp.id, tp.hardware_id, tp.name, ts.description
+        FROM troubleshooting_procedures tp
+        LEFT JOIN troubleshooting_steps ts ON ts.procedure_id = tp.id
+        ORDER BY tp.id, ts.step_number
+    """)
+    documents = defaultdict(list)
+    procedures_by_hardware = defaultdict(list)
+    for procedure_id, hardware_id, name, step in cursor.fetchall():
+        if procedure_id not in documents:
+            procedures_by_hardware[hardware_id].append(procedure_id)
+            documents[procedure_id].extend(tokenize(name))
+        if step:
+            documents[procedure_id].extend(tokenize(step))
+
+    if not documents:
+        return
+
+    document_frequency = Counter()
+    for terms in documents.values():
+        document_frequency.update(set(terms))
+    total = len(documents)
+    idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    # Normalized TF-IDF vectors, plus an inverted index for sparse scoring
+    postings = defaultdict(list)
+    term_rows = []
+    for procedure_id, terms in documents.items():
+        vector = _normalize({term: count * idf[term] for term, count in Counter(terms).items()})
+        for term, weight in vector.items():
+            postings[term].append((procedure_id, weight))
+            term_rows.append((term, procedure_id, weight))
+    cursor.executemany(
+        "INSERT INTO procedure_terms (term, procedure_id, weight) VALUES (?, ?, ?)",
+        term_rows
+    )
+
+    cursor.execute("SELECT id, hardware_id, failure_description FROM hardware_failures")
+    suggestion_rows = []
+    for failure_id, hardware_id, description in cursor.fetchall():
+        query = _normalize({
+            term: count * idf[term]
+            for term, count in Counter(tokenize(description)).items()
+            if term in idf
+        })
+        scores = defaultdict(float)
+        for term, query_weight in query.items():
+            for procedure_id, weight in postings[term]:
+                scores[procedure_id] += query_weight * weight
+        # Procedures for the failing item are candidates even with no shared terms
+        for procedure_id in procedures_by_hardware.get(hardware_id, ()):
+            scores[procedure_id] += SAME_HARDWARE_BONUS
+
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1], entry[0]))[:top_k]
+        suggestion_rows.extend(
+            (failure_id, rank, procedure_id, score)
+            for rank, (procedure_id, score) in enumerate(ranked, 1)
+        )
+    cursor.executemany("""
+        INSERT INTO failure_procedure_suggestions (failure_id, rank, procedure_id, score)
+        VALUES (?, ?, ?, ?)
+    """, suggestion_rows)
+
+
+def rebuild_relevance_index(top_k: int = DEFAULT_TOP_K):
+    """Rebuild the relevance index in its own transaction."""
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        build_relevance_index(cursor, top_k)
+
+
+def _format_suggestions(rows) -> List[Dict]:
+    return [{
+        "id": row['procedure_id'],
+        "name": row['name'],
+        "hardware_id": row['hardware_id'],
+        "hardware_name": row['hardware_name'],
+        "score": round(row['score'], 3)
+    } for row in rows]
+
+
+def suggest_procedures_for_failure(failure_id: int, limit: int = 3) -> List[Dict]:
+    """Get the precomputed top procedures for a known failure."""
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("""
+            SELECT s.procedure_id, s.score, tp.name, tp.hardware_id, hi.name AS hardware_name
+            FROM failure_procedure_suggestions s
+            JOIN troubleshooting_procedures tp ON tp.id = s.procedure_id
+            JOIN hardware_items hi ON hi.id = tp.hardware_id
+            WHERE s.failure_id = ?
+            ORDER BY s.rank
+            LIMIT ?
+        """, (failure_id, limit))
+        return _format_suggestions(cursor.fetchall())
+
+
+def suggest_procedures_for_text(text: str, hardware_id: Optional[int] = None, limit: int = 3) -> List[Dict]:
+    """Rank procedures for free text using the precomputed term weights."""
+    terms = sorted(set(tokenize(text)))
+    if not terms:
+        return []
+    placeholders = ','.join('?' * len(terms))
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute(f"""
+            SELECT pt.procedure_id,
+                   SUM(pt.weight) + CASE WHEN tp.hardware_id = ? THEN ? ELSE 0 END AS score,
+                   tp.name, tp.hardware_id, hi.name AS hardware_name
+            FROM procedure_terms pt
+            JOIN troubleshooting_procedures tp ON tp.id = pt.procedure_id
+            JOIN hardware_items hi ON hi.id = tp.hardware_id
+            WHERE pt.term IN ({placeholders})
+            GROUP BY pt.procedure_id
+            ORDER BY score DESC, pt.procedure_id
+            LIMIT ?
+        """, (hardware_id, SAME_HARDWARE_BONUS, *terms, limit))
+        return _format_suggestions(cursor.fetchall())
+
+
+def suggest_procedures_for_ticket(ticket: Dict, limit: int = 3) -> List[Dict]:
+    """Suggest troubleshooting procedures for a ticket.
+
+    The ticket's hardware and the failure quoted in its description are matched
+    against the catalog; a known failure is served straight from the
+    precomputed suggestions, anything else falls back to free-text scoring.
+
+    Args:
+        ticket: Ticket dict with 'description' and 'hardware' keys
+        limit: Maximum number of suggestions
+
+    Returns:
+        list: Dicts with 'id', 'name', 'hardware_id', 'hardware_name' and 'score'
+    """
+    description = ticket.get('description') or ''
+    hardware = ticket.get('hardware') or {}
+
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("""
+            SELECT hi.id AS hardware_id, hf.id AS failure_id
+            FROM hardware_items hi
+            LEFT JOIN hardware_failures hf
+                ON hf.hardware_id = hi.id AND instr(?, hf.failure_description) > 0
+            WHERE hi.name = ? AND hi.model = ? AND hi.manufacturer = ?
+            ORDER BY length(hf.failure_description) DESC
+            LIMIT 1
+        """, (description, hardware.get('name'), hardware.get('model'), hardware.get('manufacturer')))
+        match = cursor.fetchone()
+
+    if match and match['failure_id'] is not None:
+        suggestions = suggest_procedures_for_failure(match['failure_id'], limit)
+        if suggestions:
+            return suggestions
+    return suggest_procedures_for_text(description, match['hardware_id'] if match else None, limit)
+
+
+if __name__ == "__main__":
+    rebuild_relevance_index()
+    print("Triage relevance index rebuilt.")
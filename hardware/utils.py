@@ -1,21 +1,21 @@
 import random
-from . import data
+from . import data, models, triage
 from shared.database import DatabaseConnection
 
-def migrate_hardware_catalog():
-    """Migrate the hardware catalog data into the database."""
+def migrate_hardware_catalog(loader=None):
+    """Migrate the hardware catalog data into the database.
+    
+    Args:
+        loader (data.CatalogLoader, optional): Loader to stream the catalog from.
+            Defaults to the active loader (the bundled data files).
+    """
+    loader = loader or data.get_loader()
     with DatabaseConnection.get_cursor('hardware') as cursor:
         # Clear existing data
-        cursor.execute("DELETE FROM troubleshooting_steps")
-        cursor.execute("DELETE FROM troubleshooting_procedures")
-        cursor.execute("DELETE FROM special_tools")
-        cursor.execute("DELETE FROM hardware_failures")
-        cursor.execute("DELETE FROM hardware_specs")
-        cursor.execute("DELETE FROM hardware_items")
-        cursor.execute("DELETE FROM hardware_categories")
+        models.clear_hardware_catalog(cursor)
         
         # Insert categories and hardware items
-        for category_name, items in data.HARDWARE_CATALOG.items():
+        for category_name, items in loader.iter_catalog():
             # Insert category
             cursor.execute("INSERT INTO hardware_categories (name) VALUES (?)", (category_name,))
             category_id = cursor.lastrowid
@@ -72,6 +72,10 @@ def migrate_hardware_catalog():
                         INSERT INTO special_tools (hardware_id, tool_name)
                         VALUES (?, ?)
                     """, (hardware_id, tool))
+        
+        # Refresh the statistics snapshot and triage index in the same transaction
+        models.rebuild_hardware_statistics(cursor)
+        triage.build_relevance_index(cursor)
 
 def get_random_hardware_item():
     """Get a random hardware item from the database."""
@@ -111,4 +115,47 @@ def get_random_hardware_item():
                         "failure": failure
                     }
     
-    return None 
\ No newline at end of file
+    return None
+
+
+def get_random_hardware_items(count, rng=None):
+    """Get count random hardware items, each with a random failure, from one catalog read.
+    
+    Items are drawn with replacement the same way as get_random_hardware_item:
+    an item with at least one failure, then one of its failures.
+    
+    Args:
+        count: Number of items to draw
+        rng: random.Random to draw with (defaults to the random module)
+    
+    Returns:
+        list: Item dicts shaped like get_random_hardware_item's, empty if the
+            catalog has no failures
+    """
+    rng = rng or random
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("""
+            SELECT hi.id, hi.name, hi.manufacturer, hi.model, hc.name, hf.failure_description
+            FROM hardware_items hi
+            JOIN hardware_categories hc ON hi.category_id = hc.id
+            JOIN hardware_failures hf ON hf.hardware_id = hi.id
+            ORDER BY hi.id
+        """)
+        failures_by_item = {}
+        for *item, failure in cursor.fetchall():
+            failures_by_item.setdefault(tuple(item), []).append(failure)
+    
+    if not failures_by_item:
+        return []
+    items = list(failures_by_item)
+    drawn = []
+    for item in rng.choices(items, k=count):
+        drawn.append({
+            "id": item[0],
+            "name": item[1],
+            "manufacturer": item[2],
+            "model": item[3],
+            "category": item[4],
+            "failure": rng.choice(failures_by_item[item])
+        })
+    return drawn
@@ -3,6 +3,9 @@ from shared import views as shared_views
 from shared.rich_ui import print_info, print_error, print_table, clear_screen, print_menu
 from shared.database import DatabaseConnection
 
+# Width of the longest bar in the repair difficulty histogram
+HISTOGRAM_BAR_WIDTH = 40
+
 def clear_screen():
     """Clear the terminal screen."""
     shared_views.clear_screen()
@@ -273,6 +276,41 @@ def update_hardware_item():
     finally:
         input("Press Enter to continue...")
 
+def view_hardware_statistics():
+    """Display the hardware catalog statistics snapshot."""
+    clear_screen()
+    
+    stats = models.get_hardware_statistics()
+    
+    totals = f"Hardware Items: {stats['total_hardware']}\n"
+    totals += f"Categories: {stats['total_categories']}\n"
+    totals += f"Specifications: {stats['total_specs']}\n"
+    totals += f"Known Failures: {stats['total_failures']}\n"
+    totals += f"Troubleshooting Procedures: {stats['total_procedures']}\n"
+    totals += f"Special Tools: {stats['total_special_tools']}"
+    print_info("Hardware Catalog Totals", totals)
+    
+    if stats['by_category']:
+        category_rows = [
+            [name, str(counts['hardware']), str(counts['failures'])]
+            for name, counts in sorted(stats['by_category'].items())
+        ]
+        print_table("By Category", ["Category", "Items", "Failures"], category_rows)
+    
+    if stats['difficulty_histogram']:
+        histogram = stats['difficulty_histogram']
+        largest = max(histogram.values())
+        # Rated buckets in numeric order, then unrated items last
+        buckets = sorted(histogram, key=lambda key: (key == 'unrated', float(key) if key != 'unrated' else 0))
+        difficulty_rows = [
+            ["Unrated" if key == 'unrated' else f"{key}/5", str(histogram[key]),
+             "█" * max(1, round(histogram[key] * HISTOGRAM_BAR_WIDTH / largest))]
+            for key in buckets
+        ]
+        print_table("Repair Difficulty", ["Difficulty", "Items", ""], difficulty_rows)
+    
+    input("\nPress Enter to continue...")
+
 def manage_hardware_catalog():
     """Manage the hardware catalog."""
     while True:
@@ -1,5 +1,5 @@
 from .database import init_db, get_db_connection
-from .models import Role, Employee, PerformanceRating
+from .models import Role, Employee, PerformanceRating, RatingSummary
 from .repository import RoleRepository, EmployeeRepository, PerformanceRatingRepository
 
 __all__ = [
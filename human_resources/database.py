@@ -1,4 +1,5 @@
 from shared.database import DatabaseConnection
+from .repository import invalidate_cache
 
 # Schema for HR database
 HR_SCHEMA = '''
@@ -21,6 +22,14 @@ CREATE TABLE IF NOT EXISTS employees (
     FOREIGN KEY (role_id) REFERENCES roles (id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_employees_role ON employees (role_id);
+
+-- Directory search: case-insensitive prefix matches and status filtering
+CREATE INDEX IF NOT EXISTS idx_employees_first_name ON employees (first_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_employees_last_name ON employees (last_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_employees_email ON employees (email COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_employees_status ON employees (employment_status);
+
 CREATE TABLE IF NOT EXISTS performance_ratings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     employee_id INTEGER NOT NULL,
@@ -30,15 +39,142 @@ CREATE TABLE IF NOT EXISTS performance_ratings (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (employee_id) REFERENCES employees (id)
 );
+
+CREATE INDEX IF NOT EXISTS idx_performance_ratings_employee_date
+ON performance_ratings (employee_id, review_date DESC, id DESC);
+
+-- Rating counts, totals and latest values per employee and per role (role_key
+-- is roles.id, or 0 for employees without a role), kept current by triggers
+CREATE TABLE IF NOT EXISTS employee_rating_rollups (
+    employee_id INTEGER PRIMARY KEY,
+    review_count INTEGER NOT NULL,
+    rating_total INTEGER NOT NULL,
+    latest_rating INTEGER,
+    latest_review_date DATE,
+    latest_rating_id INTEGER,
+    last_outreach_review_date DATE  -- Latest review HR has already reached out about
+);
+
+CREATE TABLE IF NOT EXISTS role_rating_rollups (
+    role_key INTEGER PRIMARY KEY,
+    review_count INTEGER NOT NULL,
+    rating_total INTEGER NOT NULL,
+    latest_review_date DATE
+);
+
+CREATE TRIGGER IF NOT EXISTS rating_rollups_insert AFTER INSERT ON performance_ratings BEGIN
+    INSERT INTO employee_rating_rollups
+    (employee_id, review_count, rating_total, latest_rating, latest_review_date, latest_rating_id)
+    VALUES (new.employee_id, 1, new.rating, new.rating, new.review_date, new.id)
+    ON CONFLICT (employee_id) DO UPDATE SET
+        review_count = review_count + 1,
+        rating_total = rating_total + excluded.rating_total,
+        latest_rating = CASE WHEN (excluded.latest_review_date, excluded.latest_rating_id) > (latest_review_date, latest_rating_id)
+                             THEN excluded.latest_rating ELSE latest_rating END,
+        latest_rating_id = CASE WHEN (excluded.latest_review_date, excluded.latest_rating_id) > (latest_review_date, latest_rating_id)
+                                THEN excluded.latest_rating_id ELSE latest_rating_id END,
+        latest_review_date = MAX(latest_review_date, excluded.latest_review_date);
+
+    INSERT INTO role_rating_rollups (role_key, review_count, rating_total, latest_review_date)
+    SELECT COALESCE(role_id, 0), 1, new.rating, new.review_date FROM employees WHERE id = new.employee_id
+    ON CONFLICT (role_key) DO UPDATE SET
+        review_count = review_count + 1,
+        rating_total = rating_total + excluded.rating_total,
+        latest_review_date = MAX(latest_review_date, excluded.latest_review_date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS rating_rollups_delete AFTER DELETE ON performance_ratings BEGIN
+    UPDATE employee_rating_rollups
+    SET review_count = review_count - 1,
+        rating_total = rating_total - old.rating,
+        (latest_rating, latest_review_date, latest_rating_id) = (
+            SELECT rating, review_date, id FROM performance_ratings
+            WHERE employee_id = old.employee_id
+            ORDER BY review_date DESC, id DESC LIMIT 1
+        )
+    WHERE employee_id = old.employee_id;
+    DELETE FROM employee_rating_rollups WHERE employee_id = old.employee_id AND review_count = 0;
+
+    UPDATE role_rating_rollups
+    SET review_count = review_count - 1,
+        rating_total = rating_total - old.rating,
+        latest_review_date = (
+            SELECT MAX(r.latest_review_date) FROM employees e
+            JOIN employee_rating_rollups r ON r.employee_id = e.id
+            WHERE e.role_id IS NULLIF(role_rating_rollups.role_key, 0)
+        )
+    WHERE role_key = (SELECT COALESCE(role_id, 0) FROM employees WHERE id = old.employee_id);
+    DELETE FROM role_rating_rollups WHERE review_count = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rating_rollups_role_change AFTER UPDATE OF role_id ON employees
+WHEN old.role_id IS NOT new.role_id BEGIN
+    UPDATE role_rating_rollups
+    SET review_count = role_rating_rollups.review_count - r.review_count,
+        rating_total = role_rating_rollups.rating_total - r.rating_total
+    FROM employee_rating_rollups r
+    WHERE r.employee_id = old.id AND role_rating_rollups.role_key = COALESCE(old.role_id, 0);
+
+    INSERT INTO role_rating_rollups (role_key, review_count, rating_total, latest_review_date)
+    SELECT COALESCE(new.role_id, 0), review_count, rating_total, latest_review_date
+    FROM employee_rating_rollups WHERE employee_id = new.id
+    ON CONFLICT (role_key) DO UPDATE SET
+        review_count = review_count + excluded.review_count,
+        rating_total = rating_total + excluded.rating_total,
+        latest_review_date = MAX(latest_review_date, excluded.latest_review_date);
+
+    UPDATE role_rating_rollups
+    SET latest_review_date = (
+        SELECT MAX(r.latest_review_date) FROM employees e
+        JOIN employee_rating_rollups r ON r.employee_id = e.id
+        WHERE e.role_id IS old.role_id
+    )
+    WHERE role_key = COALESCE(old.role_id, 0);
+    DELETE FROM role_rating_rollups WHERE review_count = 0;
+END;
 '''
 
 def init_db():
     """Initialize the HR database with required tables."""
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'employee_rating_rollups'")
+        has_rollups = cursor.fetchone() is not None
+    
     DatabaseConnection.init_db('hr', HR_SCHEMA)
+    
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute("SELECT 1 FROM pragma_table_info('employee_rating_rollups') WHERE name = 'last_outreach_review_date'")
+        if cursor.fetchone() is None:
+            cursor.execute("ALTER TABLE employee_rating_rollups ADD COLUMN last_outreach_review_date DATE")
+    
+    # Summarize ratings given before the rollup tables existed
+    if not has_rollups:
+        with DatabaseConnection.get_cursor('hr') as cursor:
+            cursor.execute('''
+                INSERT INTO employee_rating_rollups
+                (employee_id, review_count, rating_total, latest_rating, latest_review_date, latest_rating_id)
+                SELECT a.employee_id, a.review_count, a.rating_total, p.rating, p.review_date, p.id
+                FROM (
+                    SELECT employee_id, COUNT(*) AS review_count, SUM(rating) AS rating_total
+                    FROM performance_ratings GROUP BY employee_id
+                ) a
+                JOIN performance_ratings p ON p.id = (
+                    SELECT id FROM performance_ratings WHERE employee_id = a.employee_id
+                    ORDER BY review_date DESC, id DESC LIMIT 1
+                )
+            ''')
+            cursor.execute('''
+                INSERT INTO role_rating_rollups (role_key, review_count, rating_total, latest_review_date)
+                SELECT COALESCE(e.role_id, 0), SUM(r.review_count), SUM(r.rating_total), MAX(r.latest_review_date)
+                FROM employee_rating_rollups r
+                JOIN employees e ON e.id = r.employee_id
+                GROUP BY COALESCE(e.role_id, 0)
+            ''')
 
 def reset_db():
     """Reset the HR database by dropping all tables and reinitializing."""
     DatabaseConnection.reset_db('hr', HR_SCHEMA)
+    invalidate_cache()
 
 def get_db_connection():
     """Get a database connection with proper settings."""
@@ -1,68 +1,53 @@
-from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
+from shared.models import LazyDate, SlottedModel, row_value
 
-@dataclass
-class Role:
+class Role(SlottedModel, frozen=True):
     id: Optional[int]
     title: str
     description: Optional[str]
-    created_at: Optional[datetime]
+    created_at: Optional[datetime] = LazyDate(datetime.fromisoformat)
 
     @classmethod
     def from_db_row(cls, row):
-        return cls(
-            id=row['id'],
-            title=row['title'],
-            description=row['description'],
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
-        )
+        return cls(row['id'], row['title'], row['description'], row['created_at'])
 
-@dataclass
-class Employee:
+class Employee(SlottedModel, frozen=True):
     id: Optional[int]
     first_name: str
     last_name: str
     email: str
     role_id: Optional[int]
-    hire_date: date
+    hire_date: date = LazyDate(date.fromisoformat)
     employment_status: str
-    created_at: Optional[datetime]
+    created_at: Optional[datetime] = LazyDate(datetime.fromisoformat)
 
     @classmethod
     def from_db_row(cls, row):
-        try:
-            employment_status = row['employment_status']
-        except (KeyError, IndexError):
-            employment_status = 'active'
-            
         return cls(
-            id=row['id'],
-            first_name=row['first_name'],
-            last_name=row['last_name'],
-            email=row['email'],
-            role_id=row['role_id'],
-            hire_date=date.fromisoformat(row['hire_date']),
-            employment_status=employment_status,
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+            row['id'], row['first_name'], row['last_name'], row['email'], row['role_id'],
+            row['hire_date'], row_value(row, 'employment_status', 'active'), row['created_at']
         )
 
-@dataclass
-class PerformanceRating:
+class PerformanceRating(SlottedModel, frozen=True):
     id: Optional[int]
     employee_id: int
     rating: int
-    review_date: date
+    review_date: date = LazyDate(date.fromisoformat)
     comments: Optional[str]
-    created_at: Optional[datetime]
+    created_at: Optional[datetime] = LazyDate(datetime.fromisoformat)
 
     @classmethod
     def from_db_row(cls, row):
-        return cls(
-            id=row['id'],
-            employee_id=row['employee_id'],
-            rating=row['rating'],
-            review_date=date.fromisoformat(row['review_date']),
-            comments=row['comments'],
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
-        ) 
\ No newline at end of file
+        return cls(row['id'], row['employee_id'], row['rating'], row['review_date'], row['comments'], row['created_at'])
+
+class RatingSummary(SlottedModel, frozen=True):
+    review_count: int
+    rating_total: int
+    latest_rating: Optional[int]  # None for role summaries
+    latest_review_date: Optional[date] = LazyDate(date.fromisoformat)
+    last_outreach_review_date: Optional[date] = LazyDate(date.fromisoformat, default=None)  # None for role summaries
+
+    @property
+    def average(self) -> float:
+        return self.rating_total / self.review_count
@@ -1,7 +1,130 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from shared.database import DatabaseConnection
-from .models import Role, Employee, PerformanceRating
+from .models import Role, Employee, PerformanceRating, RatingSummary
+
+# Employee display names keyed by HR database path, then employee id
+_name_cache: Dict[str, Dict[int, str]] = {}
+
+# Maximum number of ids bound into a single IN (...) query
+NAME_LOOKUP_BATCH_SIZE = 500
+
+# Employees per page of the directory
+DIRECTORY_PAGE_SIZE = 20
+
+# Column lists in model field order, for bulk loads with from_tuple
+ROLE_COLUMNS = ', '.join(Role._fields)
+EMPLOYEE_COLUMNS = ', '.join(Employee._fields)
+
+def invalidate_name_cache():
+    """Forget cached employee names; called whenever employee records are created or replaced."""
+    _name_cache.pop(DatabaseConnection.get_db_path('hr'), None)
+
+def _prefix_pattern(prefix: str) -> str:
+    """Build a LIKE pattern matching values that start with prefix, taken literally."""
+    return prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+class IdentityMap:
+    """Keeps one shared object per id for records loaded from the HR database.
+    
+    Entries are kept per HR database path and looked up by id or, through a
+    dict index per field, by a unique attribute such as an email. The
+    repositories evict entries whenever they write the underlying rows, so a
+    cached object always matches the database as far as this process's
+    writes go.
+    """
+    def __init__(self, *unique_fields: str):
+        self.unique_fields = unique_fields
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[int, Any]] = {}
+        self._indexes: Dict[str, Dict[str, Dict[Any, Any]]] = {}  # Path -> field -> value -> object
+        self._complete: set = set()  # Paths whose entries hold every row
+
+    def _current(self) -> Dict[int, Any]:
+        return self._entries.setdefault(DatabaseConnection.get_db_path('hr'), {})
+
+    def _index(self, field: str) -> Dict[Any, Any]:
+        indexes = self._indexes.setdefault(DatabaseConnection.get_db_path('hr'), {})
+        return indexes.setdefault(field, {})
+
+    def get(self, record_id: int, load: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Get the object for an id, calling load on a miss. Missing rows are not cached."""
+        entries = self._current()
+        record = entries.get(record_id)
+        if record is not None:
+            self.hits += 1
+            return record
+        self.misses += 1
+        return self.add(load())
+
+    def get_by(self, field: str, value: Any, load: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Get the object whose unique field has a value, calling load on a miss."""
+        if field not in self.unique_fields:
+            raise ValueError(f"{field} is not a unique field of this identity map")
+        record = self._index(field).get(value)
+        if record is not None:
+            self.hits += 1
+            return record
+        self.misses += 1
+        return self.add(load())
+
+    def get_all(self, load: Callable[[], List[Any]]) -> List[Any]:
+        """Get every object, ordered by id, calling load unless all rows are cached."""
+        path = DatabaseConnection.get_db_path('hr')
+        if path in self._complete:
+            self.hits += 1
+        else:
+            self.misses += 1
+            for record in load():
+                self.add(record)
+            self._complete.add(path)
+        return [record for _, record in sorted(self._current().items())]
+
+    def add(self, record: Optional[Any]) -> Optional[Any]:
+        """Add a loaded object, returning the cached object if its id is already mapped."""
+        if record is None:
+            return None
+        cached = self._current().setdefault(record.id, record)
+        if cached is record:
+            for field in self.unique_fields:
+                self._index(field)[getattr(record, field)] = record
+        return cached
+
+    def evict(self, record_id: int):
+        """Forget one object after its row was written."""
+        record = self._current().pop(record_id, None)
+        if record is not None:
+            for field in self.unique_fields:
+                index = self._index(field)
+                if index.get(getattr(record, field)) is record:
+                    del index[getattr(record, field)]
+        self._complete.discard(DatabaseConnection.get_db_path('hr'))
+
+    def clear(self):
+        """Forget every object for the current HR database."""
+        path = DatabaseConnection.get_db_path('hr')
+        self._entries.pop(path, None)
+        self._indexes.pop(path, None)
+        self._complete.discard(path)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit and miss counters and the number of cached objects."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._current())}
+
+# Identity maps shared by the repositories below
+employee_map = IdentityMap('email')
+role_map = IdentityMap('title')
+
+def invalidate_cache():
+    """Forget every cached HR record; called whenever HR tables are rewritten outside the repositories."""
+    invalidate_name_cache()
+    employee_map.clear()
+    role_map.clear()
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Get hit and miss counters for the employee and role identity maps."""
+    return {'employees': employee_map.stats(), 'roles': role_map.stats()}
 
 class RoleRepository:
     @staticmethod
@@ -12,27 +135,35 @@ class RoleRepository:
                 (title, description)
             )
             role_id = cursor.lastrowid
+            role_map.evict(role_id)
             return Role(id=role_id, title=title, description=description, created_at=None)
 
     @staticmethod
-    def get_by_title(title: str) -> Optional[Role]:
+    def _load_one(query: str, params: tuple) -> Optional[Role]:
         with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM roles WHERE title = ?', (title,))
+            cursor.execute(query, params)
             row = cursor.fetchone()
             return Role.from_db_row(row) if row else None
 
+    @staticmethod
+    def get_by_title(title: str) -> Optional[Role]:
+        return role_map.get_by('title', title, lambda: RoleRepository._load_one(
+            'SELECT * FROM roles WHERE title = ?', (title,)
+        ))
+
     @staticmethod
     def get_by_id(role_id: int) -> Optional[Role]:
-        with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM roles WHERE id = ?', (role_id,))
-            row = cursor.fetchone()
-            return Role.from_db_row(row) if row else None
+        return role_map.get(role_id, lambda: RoleRepository._load_one(
+            'SELECT * FROM roles WHERE id = ?', (role_id,)
+        ))
 
     @staticmethod
     def get_all() -> List[Role]:
-        with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM roles')
-            return [Role.from_db_row(row) for row in cursor.fetchall()]
+        def load():
+            with DatabaseConnection.get_cursor('hr') as cursor:
+                cursor.execute(f'SELECT {ROLE_COLUMNS} FROM roles')
+                return [Role.from_tuple(row) for row in cursor.fetchall()]
+        return role_map.get_all(load)
 
 class EmployeeRepository:
     @staticmethod
@@ -43,6 +174,8 @@ class EmployeeRepository:
                 (first_name, last_name, email, role_id, hire_date.isoformat(), employment_status)
             )
             employee_id = cursor.lastrowid
+            invalidate_name_cache()
+            employee_map.evict(employee_id)
             return Employee(
                 id=employee_id,
                 first_name=first_name,
@@ -68,25 +201,117 @@ class EmployeeRepository:
             return Employee.from_db_row(row) if row else None
 
     @staticmethod
-    def get_by_id(employee_id: int) -> Optional[Employee]:
+    def _load_one(query: str, params: tuple) -> Optional[Employee]:
         with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM employees WHERE id = ?', (employee_id,))
+            cursor.execute(query, params)
             row = cursor.fetchone()
             return Employee.from_db_row(row) if row else None
 
+    @staticmethod
+    def get_by_id(employee_id: int) -> Optional[Employee]:
+        return employee_map.get(employee_id, lambda: EmployeeRepository._load_one(
+            'SELECT * FROM employees WHERE id = ?', (employee_id,)
+        ))
+
     @staticmethod
     def get_by_email(email: str) -> Optional[Employee]:
         """Get an employee by their email address."""
-        with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM employees WHERE email = ?', (email,))
-            row = cursor.fetchone()
-            return Employee.from_db_row(row) if row else None
+        return employee_map.get_by('email', email, lambda: EmployeeRepository._load_one(
+            'SELECT * FROM employees WHERE email = ?', (email,)
+        ))
 
     @staticmethod
     def get_all() -> List[Employee]:
+        def load():
+            with DatabaseConnection.get_cursor('hr') as cursor:
+                cursor.execute(f'SELECT {EMPLOYEE_COLUMNS} FROM employees')
+                return [Employee.from_tuple(row) for row in cursor.fetchall()]
+        return employee_map.get_all(load)
+
+    @staticmethod
+    def get_by_role_id(role_id: int) -> List[Employee]:
+        """Get the employees holding a role, ordered by id, using the role index."""
         with DatabaseConnection.get_cursor('hr') as cursor:
-            cursor.execute('SELECT * FROM employees')
-            return [Employee.from_db_row(row) for row in cursor.fetchall()]
+            cursor.execute(f'SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE role_id = ? ORDER BY id', (role_id,))
+            return [employee_map.add(Employee.from_tuple(row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def search(text: Optional[str] = None, role_id: Optional[int] = None, status: Optional[str] = None,
+               after: Optional[int] = None, limit: int = DIRECTORY_PAGE_SIZE) -> Tuple[List[Employee], Optional[int]]:
+        """Get one page of the employee directory, ordered by id.
+        
+        Args:
+            text: Case-insensitive prefix of the first name, last name or email;
+                'first last' matches a first-name prefix followed by a last-name prefix
+            role_id: Only employees holding this role
+            status: Only employees with this employment status
+            after: The next_cursor returned with the previous page, or None for the first page
+            limit: Maximum number of employees in the page
+        
+        Returns:
+            tuple: (employees, next_cursor); next_cursor is None on the last page
+        """
+        query, params = EmployeeRepository._search_query(text, role_id, status, after, limit)
+        with DatabaseConnection.get_cursor('hr') as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        
+        employees = [employee_map.add(Employee.from_tuple(row)) for row in rows[:limit]]
+        next_cursor = employees[-1].id if len(rows) > limit else None
+        return employees, next_cursor
+
+    @staticmethod
+    def _search_query(text: Optional[str], role_id: Optional[int], status: Optional[str],
+                      after: Optional[int], limit: int) -> Tuple[str, tuple]:
+        """Build the query and parameters for one directory page; fetches limit + 1 rows to detect a next page."""
+        conditions = []
+        params = []
+        words = text.split() if text else []
+        # With a search, stop the planner walking the whole table in id order
+        # so that the name and email indexes find the matches instead
+        order_key = "+id" if words else "id"
+        if len(words) == 1:
+            conditions.append(
+                "(first_name LIKE ? ESCAPE '\\' OR last_name LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\')"
+            )
+            params.extend([_prefix_pattern(words[0])] * 3)
+        elif words:
+            conditions.append("first_name LIKE ? ESCAPE '\\' AND last_name LIKE ? ESCAPE '\\'")
+            params.extend([_prefix_pattern(words[0]), _prefix_pattern(' '.join(words[1:]))])
+        if role_id is not None:
+            conditions.append("role_id = ?")
+            params.append(role_id)
+        if status is not None:
+            # Likewise keep the status index from displacing the name and email indexes
+            conditions.append(f"{'+' if words else ''}employment_status = ?")
+            params.append(status)
+        if after is not None:
+            conditions.append(f"{order_key} > ?")
+            params.append(after)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return (f'SELECT {EMPLOYEE_COLUMNS} FROM employees {where} ORDER BY {order_key} LIMIT ?',
+                (*params, limit + 1))
+
+    @staticmethod
+    def get_names_by_ids(employee_ids: Iterable[int]) -> Dict[int, str]:
+        """Get full names for a set of employees, using the shared name cache.
+        
+        Names missing from the cache are loaded with one batched query. Ids with
+        no employee record are left out of the result.
+        """
+        cache = _name_cache.setdefault(DatabaseConnection.get_db_path('hr'), {})
+        missing = sorted({employee_id for employee_id in employee_ids if employee_id not in cache})
+        if missing:
+            with DatabaseConnection.get_cursor('hr') as cursor:
+                for start in range(0, len(missing), NAME_LOOKUP_BATCH_SIZE):
+                    batch = missing[start:start + NAME_LOOKUP_BATCH_SIZE]
+                    cursor.execute(
+                        f"SELECT id, first_name || ' ' || last_name FROM employees WHERE id IN ({','.join('?' * len(batch))})",
+                        batch
+                    )
+                    cache.update((row[0], row[1]) for row in cursor.fetchall())
+        return {employee_id: cache[employee_id] for employee_id in employee_ids if employee_id in cache}
 
     @staticmethod
     def update_role(employee_id: int, role_id: Optional[int]) -> bool:
@@ -95,6 +320,7 @@ class EmployeeRepository:
                 'UPDATE employees SET role_id = ? WHERE id = ?',
                 (role_id, employee_id)
             )
+            employee_map.evict(employee_id)
             return cursor.rowcount > 0
 
     @staticmethod
@@ -104,6 +330,7 @@ class EmployeeRepository:
                 'UPDATE employees SET employment_status = ? WHERE id = ?',
                 (employment_status, employee_id)
             )
+            employee_map.evict(employee_id)
             return cursor.rowcount > 0
 
     @staticmethod
@@ -111,6 +338,7 @@ class EmployeeRepository:
         """Deactivate all employees in the system."""
         with DatabaseConnection.get_cursor('hr') as cursor:
             cursor.execute('UPDATE employees SET employment_status = "inactive"')
+            employee_map.clear()
             return cursor.rowcount > 0
 
 class PerformanceRatingRepository:
@@ -145,4 +373,38 @@ class PerformanceRatingRepository:
                 (employee_id,)
             )
             row = cursor.fetchone()
-            return PerformanceRating.from_db_row(row) if row else None 
\ No newline at end of file
+            return PerformanceRating.from_db_row(row) if row else None
+
+    @staticmethod
+    def get_rollups() -> Tuple[Dict[int, RatingSummary], Dict[Optional[int], RatingSummary]]:
+        """Get rating summaries for every rated employee and every role in one read.
+        
+        Returns:
+            tuple: (by_employee, by_role) dicts of RatingSummary, keyed by employee
+                id and by role id (None for employees without a role)
+        """
+        with DatabaseConnection.get_cursor('hr') as cursor:
+            cursor.execute('''
+                SELECT 'employee', employee_id, review_count, rating_total, latest_rating, latest_review_date,
+                       last_outreach_review_date
+                FROM employee_rating_rollups
+                UNION ALL
+                SELECT 'role', NULLIF(role_key, 0), review_count, rating_total, NULL, latest_review_date, NULL
+                FROM role_rating_rollups
+            ''')
+            rows = cursor.fetchall()
+        
+        by_employee, by_role = {}, {}
+        for kind, key, *summary in rows:
+            (by_employee if kind == 'employee' else by_role)[key] = RatingSummary.from_tuple(summary)
+        return by_employee, by_role
+
+    @staticmethod
+    def record_outreach(employee_id: int, review_date: date) -> bool:
+        """Record that HR reached out to an employee about their review on review_date."""
+        with DatabaseConnection.get_cursor('hr') as cursor:
+            cursor.execute('''
+                UPDATE employee_rating_rollups SET last_outreach_review_date = ?
+                WHERE employee_id = ?
+            ''', (review_date.isoformat(), employee_id))
+            return cursor.rowcount > 0
@@ -0,0 +1,185 @@
+"""Employee directory sync: upsert employees from a CSV or JSON Lines export.
+
+Directory records are streamed into a temporary staging table in batches,
+keyed case-insensitively by email, with role titles resolved through a map of
+the roles table loaded once per sync (unknown titles create a role). The
+staged directory is then applied with set-based statements in one
+transaction: changed employees are updated in place, new ones inserted and,
+optionally, employees missing from the directory deactivated. Unchanged rows
+are not written and employee ids never change, so ratings, messages, tickets
+and player links keep pointing at the same people.
+"""
+import csv
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from shared.database import DatabaseConnection
+from player.repository import PlayerRepository
+from .repository import invalidate_cache
+
+logger = logging.getLogger(__name__)
+
+# Records staged per executemany call
+SYNC_BATCH_SIZE = 1000
+
+# Status given to employees missing from the directory
+DEACTIVATED_STATUS = 'inactive'
+
+STAGING_SCHEMA = '''
+    CREATE TEMP TABLE directory_import (
+        email TEXT PRIMARY KEY COLLATE NOCASE,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        role_id INTEGER,
+        hire_date DATE NOT NULL,
+        employment_status TEXT NOT NULL
+    )
+'''
+
+
+@dataclass
+class SyncReport:
+    """What a directory sync changed.
+
+    Attributes:
+        inserted: Employees added
+        updated: Existing employees whose details changed
+        unchanged: Employees already matching the directory
+        deactivated: Employees missing from the directory marked inactive
+        roles_created: Roles added for unknown role titles
+        skipped: One message per record that could not be imported
+    """
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deactivated: int = 0
+    roles_created: int = 0
+    skipped: List[str] = field(default_factory=list)
+
+
+def read_directory(path: str) -> Iterator[Dict[str, str]]:
+    """Stream directory records from a .csv file with a header row or a .jsonl file.
+
+    Each record has first_name, last_name, email and hire_date (YYYY-MM-DD),
+    and optionally role_title and employment_status.
+    """
+    if path.endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+    elif path.endswith(('.jsonl', '.ndjson')):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported directory file: {path}. Expected .csv or .jsonl")
+
+
+def _text(record: Dict, key: str) -> str:
+    value = record.get(key)
+    return str(value).strip() if value is not None else ''
+
+
+def _staging_row(record: Dict, conn, roles: Dict[str, int], report: SyncReport) -> tuple:
+    """Validate a directory record and turn it into a staging row, creating its role if needed."""
+    email, first_name, last_name = _text(record, 'email'), _text(record, 'first_name'), _text(record, 'last_name')
+    for name, value in (('email', email), ('first_name', first_name), ('last_name', last_name)):
+        if not value:
+            raise ValueError(f"missing {name}")
+
+    hire_date = record.get('hire_date')
+    if not isinstance(hire_date, date):
+        hire_date = date.fromisoformat(_text(record, 'hire_date'))
+
+    role_id = None
+    title = _text(record, 'role_title')
+    if title:
+        role_id = roles.get(title)
+        if role_id is None:
+            role_id = conn.execute('INSERT INTO roles (title) VALUES (?) RETURNING id', (title,)).fetchone()[0]
+            roles[title] = role_id
+            report.roles_created += 1
+
+    status = _text(record, 'employment_status') or 'active'
+    return (email, first_name, last_name, role_id, hire_date.isoformat(), status)
+
+
+def sync_employee_directory(records: Iterable[Dict], deactivate_missing: bool = True,
+                            protected_ids: Optional[Set[int]] = None,
+                            batch_size: int = SYNC_BATCH_SIZE) -> SyncReport:
+    """Bring the employees table in line with a directory export.
+
+    Args:
+        records: Directory records, e.g. from read_directory; a later record
+            with the same email replaces an earlier one
+        deactivate_missing: Mark employees missing from the directory inactive
+        protected_ids: Employee ids never deactivated (defaults to the
+            employees linked to a player)
+        batch_size: Records staged per executemany call
+
+    Returns:
+        SyncReport with the number of employees inserted, updated, unchanged
+        and deactivated, and the records skipped
+    """
+    report = SyncReport()
+    if deactivate_missing and protected_ids is None:
+        protected_ids = PlayerRepository.get_linked_employee_ids()
+
+    numbered = enumerate(records, 1)
+    with DatabaseConnection.get_connection('hr') as conn:
+        conn.execute(STAGING_SCHEMA)
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                roles = {row['title']: row['id'] for row in conn.execute('SELECT id, title FROM roles')}
+                while batch := list(islice(numbered, batch_size)):
+                    rows = []
+                    for number, record in batch:
+                        try:
+                            rows.append(_staging_row(record, conn, roles, report))
+                        except (ValueError, TypeError) as e:
+                            report.skipped.append(f"Record {number}: {e}")
+                    conn.executemany('INSERT OR REPLACE INTO directory_import VALUES (?, ?, ?, ?, ?, ?)', rows)
+                staged = conn.execute('SELECT COUNT(*) FROM directory_import').fetchone()[0]
+
+                report.updated = conn.execute('''
+                    UPDATE employees
+                    SET first_name = s.first_name, last_name = s.last_name, role_id = s.role_id,
+                        hire_date = s.hire_date, employment_status = s.employment_status
+                    FROM directory_import s
+                    WHERE employees.email = s.email COLLATE NOCASE
+                      AND (employees.first_name, employees.last_name, employees.role_id,
+                           employees.hire_date, employees.employment_status)
+                          IS NOT (s.first_name, s.last_name, s.role_id, s.hire_date, s.employment_status)
+                ''').rowcount
+                report.inserted = conn.execute('''
+                    INSERT INTO employees (first_name, last_name, email, role_id, hire_date, employment_status)
+                    SELECT s.first_name, s.last_name, s.email, s.role_id, s.hire_date, s.employment_status
+                    FROM directory_import s
+                    WHERE NOT EXISTS (SELECT 1 FROM employees e WHERE e.email = s.email COLLATE NOCASE)
+                ''').rowcount
+                report.unchanged = staged - report.updated - report.inserted
+
+                if deactivate_missing:
+                    report.deactivated = conn.execute('''
+                        UPDATE employees SET employment_status = ?
+                        WHERE employment_status NOT IN (?, 'terminated')
+                          AND NOT EXISTS (SELECT 1 FROM directory_import s WHERE s.email = employees.email)
+                          AND id NOT IN (SELECT value FROM json_each(?))
+                    ''', (DEACTIVATED_STATUS, DEACTIVATED_STATUS, json.dumps(sorted(protected_ids)))).rowcount
+        finally:
+            conn.execute('DROP TABLE temp.directory_import')
+
+    invalidate_cache()
+    logger.info("Directory sync inserted %d, updated %d, deactivated %d employees; skipped %d records",
+                report.inserted, report.updated, report.deactivated, len(report.skipped))
+    return report
+
+
+def sync_directory_file(path: str, **kwargs) -> SyncReport:
+    """Sync the employees table with a .csv or .jsonl directory export; see sync_employee_directory."""
+    return sync_employee_directory(read_directory(path), **kwargs)
@@ -1,7 +1,7 @@
 from . import data
 from shared.database import DatabaseConnection
-from player.repository import PlayerRepository
-from .repository import EmployeeRepository
+from shared.session import get_session
+from .repository import invalidate_cache
 
 def migrate_employee_directory():
     """Migrate the employee directory data into the database."""
@@ -33,13 +33,13 @@ def migrate_employee_directory():
                 role_map[employee['role_title']],
                 employee['hire_date'].isoformat()
             ))
+    
+    invalidate_cache()
 
 def get_current_employee():
     """
     Get the current employee record associated with the current player.
     Returns None if there is no current player or if the player has no associated employee.
+    Reads the game session, so repeated calls do not query the player or HR databases.
     """
-    current_player = PlayerRepository.get_most_recent()
-    if not current_player or not current_player.employee_id:
-        return None
-    return EmployeeRepository.get_by_id(current_player.employee_id) 
\ No newline at end of file
+    return get_session().employee 
\ No newline at end of file
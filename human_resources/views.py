@@ -1,6 +1,6 @@
 from datetime import date
 from typing import Optional
-from . import RoleRepository, EmployeeRepository, PerformanceRatingRepository
+from . import RoleRepository, EmployeeRepository, PerformanceRatingRepository, Employee
 from shared.views import print_menu, clear_screen
 from shared.common_ui import print_common_header
 from shared.rich_ui import print_info, print_error, print_status
@@ -10,6 +10,8 @@ from rich import box
 from rich.console import Console
 from player.repository import PlayerRepository
 from human_resources.utils import get_current_employee
+from shared.session import get_session, refresh_session
+from human_resources.sync import sync_directory_file
 import sys
 console = Console()
 
@@ -90,7 +92,7 @@ def handle_player_quit_job():
                 return False
             
             # Get current player
-            current_player = PlayerRepository.get_most_recent()
+            current_player = get_session().player
             if not current_player:
                 print_error("Error", "No active player found.")
                 input("\nPress Enter to continue...")
@@ -100,6 +102,7 @@ def handle_player_quit_job():
             EmployeeRepository.update_employment_status(current_employee.id, 'inactive')
             # Mark player as inactive in player system
             PlayerRepository.update_employee_id(current_player.id, None)
+            refresh_session()
             print_status("Success", "You have been marked as inactive. Goodbye!")
             print_info("Exiting", "Thank you for playing Whats Broken Now!")
             input("\nPress Enter to exit...")
@@ -124,11 +127,12 @@ def employee_management_menu():
             "3. Update Employee Role",
             "4. Update Employment Status",
             "5. LAYOFF MODE!!",
+            "6. Sync Directory From File",
             "Q. Back to HR Menu"
         ]
         print_menu("Employee Management", menu_options)
         
-        choice = input("\nEnter your choice (1-5, Q): ")
+        choice = input("\nEnter your choice (1-6, Q): ")
         
         if choice == '1':
             list_employees()
@@ -140,6 +144,8 @@ def employee_management_menu():
             update_employment_status()
         elif choice == '5':
             deactivate_all_employees()
+        elif choice == '6':
+            sync_directory()
         elif choice.upper() == 'Q':
             return
         else:
@@ -199,23 +205,80 @@ def performance_reviews_menu():
             input("Press Enter to continue...")
             clear_screen()
 
-def list_employees():
-    """Display all employees."""
-    clear_screen()
-    print_common_header()
-    print("\nEmployee List:")
-    print("-" * 80)
+def browse_employees(title: str, prompt: str, status: Optional[str] = None) -> Optional[str]:
+    """Page through the employee directory, with prefix search on name and email.
     
-    employees = EmployeeRepository.get_all()
-    if not employees:
-        print("No employees found.")
-    else:
+    Args:
+        title: Title of the directory table
+        prompt: What to ask for, e.g. "Enter Employee ID"
+        status: Only list employees with this employment status
+    
+    Returns:
+        The first input that is not a navigation command, or None if the user quits
+    """
+    search = None
+    cursors = [None]  # Cursor of every page visited so far, for going back
+    while True:
+        clear_screen()
+        print_common_header()
+        
+        employees, next_cursor = EmployeeRepository.search(search, status=status, after=cursors[-1])
+        role_titles = {role.id: role.title for role in RoleRepository.get_all()}
+        
+        table = Table(title=f"{title} (page {len(cursors)}{f', matching {search!r}' if search else ''})")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name", style="yellow")
+        table.add_column("Email", style="white")
+        table.add_column("Role", style="magenta")
+        table.add_column("Status", style="green")
         for emp in employees:
-            role = RoleRepository.get_by_id(emp.role_id) if emp.role_id else None
-            role_title = role.title if role else "No Role"
-            print(f"{emp.id}. {emp.first_name} {emp.last_name} - {emp.email} - {role_title} - Status: {emp.employment_status}")
+            table.add_row(str(emp.id), f"{emp.first_name} {emp.last_name}", emp.email,
+                          role_titles.get(emp.role_id, "No Role"), emp.employment_status)
+        console.print(table)
+        if not employees:
+            print("No employees found.")
+        
+        navigation = ["S to search"]
+        if next_cursor:
+            navigation.append("N for next page")
+        if len(cursors) > 1:
+            navigation.append("P for previous page")
+        navigation.append("Q to return")
+        choice = input(f"\n{prompt} ({', '.join(navigation)}): ").strip()
+        
+        if choice.upper() == 'Q':
+            return None
+        if choice.upper() == 'N' and next_cursor:
+            cursors.append(next_cursor)
+        elif choice.upper() == 'P' and len(cursors) > 1:
+            cursors.pop()
+        elif choice.upper() == 'S':
+            search = input("Name or email starts with (press Enter to list everyone): ").strip() or None
+            cursors = [None]
+        else:
+            return choice
+
+def select_employee(title: str = "Select Employee", status: Optional[str] = None) -> Optional[Employee]:
+    """Let the user pick one employee from the paged directory.
     
-    input("\nPress Enter to continue...")
+    Returns None if the user returns without choosing.
+    """
+    while True:
+        choice = browse_employees(title, "Enter Employee ID", status)
+        if choice is None:
+            return None
+        try:
+            employee = EmployeeRepository.get_by_id(int(choice))
+        except ValueError:
+            employee = None
+        if employee and (status is None or employee.employment_status == status):
+            return employee
+        print_error("Employee not found. Please try again.")
+        input("Press Enter to continue...")
+
+def list_employees():
+    """Display the employee directory."""
+    browse_employees("Employee List", "Press Enter to return")
     clear_screen()
 
 def add_employee():
@@ -285,23 +348,10 @@ def update_employee_role():
     print("-" * 80)
     
     try:
-        # List employees
-        employees = EmployeeRepository.get_all()
-        if not employees:
-            print("No employees found.")
-            input("\nPress Enter to continue...")
-            return
-        
-        print("\nSelect Employee:")
-        for emp in employees:
-            print(f"{emp.id}. {emp.first_name} {emp.last_name}")
-        
-        employee_id = int(input("\nEnter Employee ID: "))
-        employee = EmployeeRepository.get_by_id(employee_id)
+        employee = select_employee("Update Employee Role")
         if not employee:
-            print("Employee not found.")
-            input("\nPress Enter to continue...")
             return
+        employee_id = employee.id
         
         # List roles
         roles = RoleRepository.get_all()
@@ -337,23 +387,10 @@ def update_employment_status():
     print("-" * 80)
     
     try:
-        # List employees
-        employees = EmployeeRepository.get_all()
-        if not employees:
-            print("No employees found.")
-            input("\nPress Enter to continue...")
-            return
-        
-        print("\nSelect Employee:")
-        for emp in employees:
-            print(f"{emp.id}. {emp.first_name} {emp.last_name} (Current Status: {emp.employment_status})")
-        
-        employee_id = int(input("\nEnter Employee ID: "))
-        employee = EmployeeRepository.get_by_id(employee_id)
+        employee = select_employee("Update Employment Status")
         if not employee:
-            print("Employee not found.")
-            input("\nPress Enter to continue...")
             return
+        employee_id = employee.id
         
         print("\nSelect New Status:")
         print("1. Active")
@@ -431,23 +468,10 @@ def add_performance_review():
     print("-" * 80)
     
     try:
-        # List employees
-        employees = EmployeeRepository.get_all()
-        if not employees:
-            print("No employees found.")
-            input("\nPress Enter to continue...")
-            return
-        
-        print("\nSelect Employee:")
-        for emp in employees:
-            print(f"{emp.id}. {emp.first_name} {emp.last_name}")
-        
-        employee_id = int(input("\nEnter Employee ID: "))
-        employee = EmployeeRepository.get_by_id(employee_id)
+        employee = select_employee("Add Performance Review")
         if not employee:
-            print("Employee not found.")
-            input("\nPress Enter to continue...")
             return
+        employee_id = employee.id
         
         rating = int(input("\nEnter Rating (1-5): "))
         if not 1 <= rating <= 5:
@@ -482,23 +506,10 @@ def view_employee_reviews():
     print("-" * 80)
     
     try:
-        # List employees
-        employees = EmployeeRepository.get_all()
-        if not employees:
-            print("No employees found.")
-            input("\nPress Enter to continue...")
-            return
-        
-        print("\nSelect Employee:")
-        for emp in employees:
-            print(f"{emp.id}. {emp.first_name} {emp.last_name}")
-        
-        employee_id = int(input("\nEnter Employee ID: "))
-        employee = EmployeeRepository.get_by_id(employee_id)
+        employee = select_employee("View Employee Reviews")
         if not employee:
-            print("Employee not found.")
-            input("\nPress Enter to continue...")
             return
+        employee_id = employee.id
         
         reviews = PerformanceRatingRepository.get_by_employee_id(employee_id)
         if not reviews:
@@ -538,7 +549,31 @@ def deactivate_all_employees():
     input("\nPress Enter to continue...")
     clear_screen()
 
+def sync_directory():
+    """Update employees from a CSV or JSON Lines directory export."""
+    clear_screen()
+    print_common_header()
+    print("\nSync Directory From File")
+    print("-" * 80)
+    print("Columns: first_name, last_name, email, hire_date (YYYY-MM-DD), role_title, employment_status")
+    
+    try:
+        path = input("\nPath to .csv or .jsonl file: ").strip()
+        if path:
+            deactivate = input("Deactivate employees missing from the file? (y/N): ").strip().upper() == 'Y'
+            report = sync_directory_file(path, deactivate_missing=deactivate)
+            print(f"\nAdded {report.inserted}, updated {report.updated}, unchanged {report.unchanged}, "
+                  f"deactivated {report.deactivated} employees; created {report.roles_created} roles.")
+            for message in report.skipped:
+                print(f"Skipped {message}")
+    except (OSError, ValueError) as e:
+        print(f"\nError: {str(e)}")
+    except Exception as e:
+        print(f"\nError syncing directory: {str(e)}")
+    
+    input("\nPress Enter to continue...")
+    clear_screen()
+
 def show_employee_directory():
     """Show the employee directory."""
-    current_player = PlayerRepository.get_most_recent()
-    # ... existing code ... 
\ No newline at end of file
+    browse_employees("Employee Directory", "Press Enter to return") 
\ No newline at end of file
@@ -1,8 +1,13 @@
-from datetime import datetime
+import json
+from shared.clock import get_clock
 from shared.database import DatabaseConnection
+from human_resources.repository import EmployeeRepository
 
-# Schema for mailbox database
-MAILBOX_SCHEMA = '''
+# Default number of messages per page
+DEFAULT_PAGE_SIZE = 20
+
+# Messages table definition, kept separate so init_db can rebuild the table
+MESSAGES_TABLE_SCHEMA = '''
     CREATE TABLE IF NOT EXISTS messages (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         sender_id INTEGER NOT NULL,
@@ -11,59 +16,406 @@ MAILBOX_SCHEMA = '''
         content TEXT NOT NULL,
         timestamp DATETIME NOT NULL,
         is_read BOOLEAN NOT NULL DEFAULT 0,
-        FOREIGN KEY (sender_id) REFERENCES employees(id),
-        FOREIGN KEY (recipient_id) REFERENCES employees(id)
-    )
+        body_id INTEGER
+    );
+'''
+
+# Schema for mailbox database; new files reclaim space with incremental vacuum
+MAILBOX_SCHEMA = '''
+    PRAGMA auto_vacuum = INCREMENTAL;
+''' + MESSAGES_TABLE_SCHEMA + '''
+    CREATE INDEX IF NOT EXISTS idx_messages_recipient_read_time
+    ON messages (recipient_id, is_read, timestamp DESC, id DESC);
+
+    -- Full-text index over subject and content, kept in sync by triggers
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+    USING fts5(subject, content, content='messages', content_rowid='id');
+
+    CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts (rowid, subject, content) VALUES (new.id, new.subject, new.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, subject, content)
+        VALUES ('delete', old.id, old.subject, old.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF subject, content ON messages BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, subject, content)
+        VALUES ('delete', old.id, old.subject, old.content);
+        INSERT INTO messages_fts (rowid, subject, content) VALUES (new.id, new.subject, new.content);
+    END;
+
+    -- Bodies shared by every copy of a broadcast; those messages keep an empty content
+    CREATE TABLE IF NOT EXISTS message_bodies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content TEXT NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_messages_body
+    ON messages (body_id) WHERE body_id IS NOT NULL;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS message_bodies_fts
+    USING fts5(content, content='message_bodies', content_rowid='id');
+
+    CREATE TRIGGER IF NOT EXISTS message_bodies_fts_insert AFTER INSERT ON message_bodies BEGIN
+        INSERT INTO message_bodies_fts (rowid, content) VALUES (new.id, new.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS message_bodies_fts_delete AFTER DELETE ON message_bodies BEGIN
+        INSERT INTO message_bodies_fts (message_bodies_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    END;
+
+    -- Drop a shared body once its last copy is gone
+    CREATE TRIGGER IF NOT EXISTS message_bodies_release AFTER DELETE ON messages
+    WHEN old.body_id IS NOT NULL BEGIN
+        DELETE FROM message_bodies
+        WHERE id = old.body_id
+          AND NOT EXISTS (SELECT 1 FROM messages WHERE body_id = old.body_id);
+    END;
+
+    -- Unread messages per recipient, maintained by the triggers below
+    CREATE TABLE IF NOT EXISTS unread_counts (
+        recipient_id INTEGER PRIMARY KEY,
+        unread INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE TRIGGER IF NOT EXISTS unread_counts_insert AFTER INSERT ON messages
+    WHEN new.is_read = 0 BEGIN
+        INSERT INTO unread_counts (recipient_id, unread) VALUES (new.recipient_id, 1)
+        ON CONFLICT (recipient_id) DO UPDATE SET unread = unread + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS unread_counts_update AFTER UPDATE OF is_read, recipient_id ON messages
+    WHEN old.is_read != new.is_read OR old.recipient_id != new.recipient_id BEGIN
+        UPDATE unread_counts SET unread = unread - 1
+        WHERE recipient_id = old.recipient_id AND old.is_read = 0;
+        INSERT INTO unread_counts (recipient_id, unread) SELECT new.recipient_id, 1 WHERE new.is_read = 0
+        ON CONFLICT (recipient_id) DO UPDATE SET unread = unread + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS unread_counts_delete AFTER DELETE ON messages
+    WHEN old.is_read = 0 BEGIN
+        UPDATE unread_counts SET unread = unread - 1 WHERE recipient_id = old.recipient_id;
+    END;
+
+    -- Reply links: every reply points at its parent and at the first message of its thread
+    CREATE TABLE IF NOT EXISTS message_threads (
+        message_id INTEGER PRIMARY KEY,
+        parent_id INTEGER NOT NULL,
+        root_id INTEGER NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_message_threads_root
+    ON message_threads (root_id);
+
+    CREATE TRIGGER IF NOT EXISTS message_threads_delete AFTER DELETE ON messages BEGIN
+        DELETE FROM message_threads WHERE message_id = old.id;
+    END;
 '''
 
 def init_db():
     """Initialize the mailbox database."""
+    _drop_cross_database_foreign_keys()
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'")
+        has_search_index = cursor.fetchone() is not None
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'unread_counts'")
+        has_unread_counts = cursor.fetchone() is not None
+        
+        # Messages tables created before shared bodies existed
+        cursor.execute("SELECT name FROM pragma_table_info('messages')")
+        columns = {row[0] for row in cursor.fetchall()}
+        if columns and 'body_id' not in columns:
+            cursor.execute("ALTER TABLE messages ADD COLUMN body_id INTEGER")
+    
     # Initialize mailbox database with schema
     DatabaseConnection.init_db('mailbox', MAILBOX_SCHEMA)
+    
+    # Index and count messages written before the search index and counters existed
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        if not has_search_index:
+            cursor.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+        if not has_unread_counts:
+            cursor.execute('''
+                INSERT INTO unread_counts (recipient_id, unread)
+                SELECT recipient_id, COUNT(*) FROM messages WHERE is_read = 0 GROUP BY recipient_id
+            ''')
+
+def _drop_cross_database_foreign_keys():
+    """Rebuild a messages table created with foreign keys into hr.db's employees.
+    
+    Employees live in a different database file, so SQLite can never satisfy
+    those constraints and every insert failed once foreign keys were enabled.
+    """
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("PRAGMA foreign_key_list(messages)")
+        if not cursor.fetchall():
+            return
+        cursor.executescript('''
+            BEGIN;
+            ALTER TABLE messages RENAME TO messages_old;
+            ''' + MESSAGES_TABLE_SCHEMA + '''
+            INSERT INTO messages (id, sender_id, recipient_id, subject, content, timestamp, is_read)
+            SELECT id, sender_id, recipient_id, subject, content, timestamp, is_read FROM messages_old;
+            DROP TABLE messages_old;
+            COMMIT;
+        ''')
+
+# Message columns in get_messages order, resolving shared broadcast bodies
+MESSAGE_COLUMNS = "m.id, m.sender_id, m.subject, COALESCE(b.content, m.content), m.timestamp, m.is_read"
+MESSAGE_SOURCE = "messages m LEFT JOIN message_bodies b ON b.id = m.body_id"
+
+def _with_sender_names(rows):
+    """Replace the sender_id column of message rows with the sender's name."""
+    employee_names = EmployeeRepository.get_names_by_ids({row[1] for row in rows})
+    return [
+        (msg_id, employee_names.get(sender_id, "Unknown Sender"), subject, content, timestamp, is_read)
+        for msg_id, sender_id, subject, content, timestamp, is_read in rows
+    ]
 
-def add_message(sender_id, recipient_id, subject, content):
-    """Add a new message to the database."""
+def add_message(sender_id, recipient_id, subject, content, reply_to_id=None):
+    """Add a new message to the database.
+    
+    Args:
+        reply_to_id: Id of the message being replied to, linking this one into its thread
+    
+    Returns:
+        int: Id of the new message
+    """
     with DatabaseConnection.get_cursor('mailbox') as cursor:
         cursor.execute('''
             INSERT INTO messages (sender_id, recipient_id, subject, content, timestamp, is_read)
             VALUES (?, ?, ?, ?, ?, ?)
-        ''', (sender_id, recipient_id, subject, content, datetime.now(), False))
+        ''', (sender_id, recipient_id, subject, content, get_clock().now(), False))
+        message_id = cursor.lastrowid
+        
+        if reply_to_id is not None:
+            cursor.execute('''
+                INSERT INTO message_threads (message_id, parent_id, root_id)
+                VALUES (?, ?, COALESCE((SELECT root_id FROM message_threads WHERE message_id = ?), ?))
+            ''', (message_id, reply_to_id, reply_to_id, reply_to_id))
+        
+        return message_id
 
-def get_messages(recipient_id):
-    """Get all messages for a recipient."""    
-    # Get messages from mailbox database
+def add_messages_bulk(messages):
+    """Add many messages in a single transaction.
+    
+    Args:
+        messages: Iterable of (sender_id, recipient_id, subject, content) tuples
+    
+    Returns:
+        int: Number of messages added
+    """
+    timestamp = get_clock().now()
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.executemany('''
+            INSERT INTO messages (sender_id, recipient_id, subject, content, timestamp, is_read)
+            VALUES (?, ?, ?, ?, ?, 0)
+        ''', (
+            (sender_id, recipient_id, subject, content, timestamp)
+            for sender_id, recipient_id, subject, content in messages
+        ))
+        return cursor.rowcount
+
+def broadcast_message(sender_id, recipient_ids, subject, content):
+    """Send the same message to many recipients in a single transaction.
+    
+    The body is stored once and shared by every recipient's copy.
+    
+    Returns:
+        int: Number of messages added
+    """
+    recipient_ids = list(dict.fromkeys(recipient_ids))
+    if not recipient_ids:
+        return 0
+    timestamp = get_clock().now()
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("INSERT INTO message_bodies (content) VALUES (?)", (content,))
+        body_id = cursor.lastrowid
+        cursor.executemany('''
+            INSERT INTO messages (sender_id, recipient_id, subject, content, timestamp, is_read, body_id)
+            VALUES (?, ?, ?, '', ?, 0, ?)
+        ''', ((sender_id, recipient_id, subject, timestamp, body_id) for recipient_id in recipient_ids))
+        return cursor.rowcount
+
+def reply_to_message(message_id, sender_id, content):
+    """Send a reply to a message's sender, threaded under it.
+    
+    The subject is the original subject prefixed with "Re: " (once).
+    
+    Returns:
+        int: Id of the reply, or None if the original message does not exist
+    """
     with DatabaseConnection.get_cursor('mailbox') as cursor:
         cursor.execute('''
-            SELECT id, sender_id, subject, content, timestamp, is_read
-            FROM messages
-            WHERE recipient_id = ?
-            ORDER BY timestamp DESC
+            SELECT sender_id, subject FROM messages WHERE id = ?
+        ''', (message_id,))
+        original = cursor.fetchone()
+    if not original:
+        return None
+    recipient_id, subject = original
+    if not subject.startswith("Re: "):
+        subject = f"Re: {subject}"
+    return add_message(sender_id, recipient_id, subject, content, reply_to_id=message_id)
+
+def get_messages(recipient_id, sender_ids=False):
+    """Get all messages for a recipient.
+    
+    Args:
+        sender_ids: Return each sender's employee id instead of their name
+    """
+    # Get messages from mailbox database
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute(f'''
+            SELECT {MESSAGE_COLUMNS}
+            FROM {MESSAGE_SOURCE}
+            WHERE m.recipient_id = ?
+            ORDER BY m.timestamp DESC
         ''', (recipient_id,))
         messages = cursor.fetchall()
     
-    # Get employee names from HR database
-    with DatabaseConnection.get_cursor('hr') as hr_cursor:
-        # Create a mapping of employee IDs to their full names
-        employee_names = {}
-        for msg in messages:
-            sender_id = msg[1]  # sender_id is the second column
-            if sender_id not in employee_names:
-                hr_cursor.execute('''
-                    SELECT first_name || ' ' || last_name
-                    FROM employees
-                    WHERE id = ?
-                ''', (sender_id,))
-                result = hr_cursor.fetchone()
-                employee_names[sender_id] = result[0] if result else "Unknown Sender"
-    
-    # Combine the data
-    formatted_messages = []
-    for msg in messages:
-        msg_id, sender_id, subject, content, timestamp, is_read = msg
-        sender_name = employee_names.get(sender_id, "Unknown Sender")
-        formatted_messages.append((msg_id, sender_name, subject, content, timestamp, is_read))
-    
-    return formatted_messages
+    if sender_ids:
+        return [tuple(row) for row in messages]
+    # Resolve sender names with one batched lookup against the shared name cache
+    return _with_sender_names(messages)
+
+def get_message_page(recipient_id, unread_only=False, page_size=DEFAULT_PAGE_SIZE, cursor=None, headers_only=False,
+                     sender_ids=False):
+    """Get one page of a recipient's messages, unread first, newest first.
+    
+    Args:
+        recipient_id: Employee id of the recipient
+        unread_only: Only return unread messages
+        page_size: Maximum number of messages in the page
+        cursor: The next_cursor returned with the previous page, or None for the first page
+        headers_only: Leave out message bodies (content is None); load them with get_message
+        sender_ids: Return each sender's employee id instead of their name
+    
+    Returns:
+        tuple: (messages, next_cursor). Messages have the same shape as get_messages;
+            next_cursor is None on the last page.
+    """
+    conditions = ["m.recipient_id = ?"]
+    params = [recipient_id]
+    if unread_only:
+        conditions.append("m.is_read = 0")
+    if cursor is not None:
+        # Keyset: everything sorting after the last message of the previous page
+        last_read, last_timestamp, last_id = cursor
+        if unread_only:
+            conditions.append("(m.timestamp, m.id) < (?, ?)")
+            params.extend([last_timestamp, last_id])
+        else:
+            conditions.append("(m.is_read > ? OR (m.is_read = ? AND (m.timestamp, m.id) < (?, ?)))")
+            params.extend([last_read, last_read, last_timestamp, last_id])
+    
+    if headers_only:
+        columns, source = "m.id, m.sender_id, m.subject, NULL, m.timestamp, m.is_read", "messages m"
+    else:
+        columns, source = MESSAGE_COLUMNS, MESSAGE_SOURCE
+    with DatabaseConnection.get_cursor('mailbox') as db_cursor:
+        db_cursor.execute(f'''
+            SELECT {columns}
+            FROM {source}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY m.is_read ASC, m.timestamp DESC, m.id DESC
+            LIMIT ?
+        ''', (*params, page_size + 1))
+        rows = db_cursor.fetchall()
+    
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    messages = [tuple(row) for row in rows] if sender_ids else _with_sender_names(rows)
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = (last[5], last[4], last[0])
+    return messages, next_cursor
+
+def get_message(message_id, recipient_id=None):
+    """Get a single message with its body, optionally restricted to one recipient.
+    
+    Returns:
+        tuple: Same shape as the get_messages entries, or None if not found
+    """
+    query = f'''
+        SELECT {MESSAGE_COLUMNS}
+        FROM {MESSAGE_SOURCE}
+        WHERE m.id = ?
+    '''
+    params = [message_id]
+    if recipient_id is not None:
+        query += " AND m.recipient_id = ?"
+        params.append(recipient_id)
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+    return _with_sender_names([row])[0] if row else None
+
+def _fts_query(text):
+    """Quote each word of free text so FTS5 treats it literally (all words must match)."""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+def search_messages(recipient_id, text, limit=DEFAULT_PAGE_SIZE):
+    """Full-text search a recipient's messages by subject and content, best matches first.
+    
+    Returns:
+        list: Messages in the same shape as get_messages
+    """
+    query = _fts_query(text)
+    if not query:
+        return []
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        # Per-message text and shared broadcast bodies are indexed separately
+        cursor.execute(f'''
+            WITH hits(message_id, rank) AS (
+                SELECT rowid, rank FROM messages_fts WHERE messages_fts MATCH ?
+                UNION ALL
+                SELECT m.id, message_bodies_fts.rank
+                FROM message_bodies_fts
+                JOIN messages m ON m.body_id = message_bodies_fts.rowid
+                WHERE message_bodies_fts MATCH ? AND m.recipient_id = ?
+            )
+            SELECT {MESSAGE_COLUMNS}
+            FROM hits
+            JOIN messages m ON m.id = hits.message_id
+            LEFT JOIN message_bodies b ON b.id = m.body_id
+            WHERE m.recipient_id = ?
+            GROUP BY m.id
+            ORDER BY MIN(hits.rank)
+            LIMIT ?
+        ''', (query, query, recipient_id, recipient_id, limit))
+        return _with_sender_names(cursor.fetchall())
+
+def get_thread(message_id, participant_id=None):
+    """Get every message in the thread containing a message, oldest first.
+    
+    Args:
+        message_id: Id of any message in the thread
+        participant_id: If given, only messages sent or received by this employee
+    
+    Returns:
+        list: Messages in the same shape as get_messages
+    """
+    query = f'''
+        WITH root(id) AS (
+            SELECT COALESCE((SELECT root_id FROM message_threads WHERE message_id = ?), ?)
+        )
+        SELECT {MESSAGE_COLUMNS}
+        FROM {MESSAGE_SOURCE}
+        WHERE (m.id = (SELECT id FROM root)
+               OR m.id IN (SELECT message_id FROM message_threads WHERE root_id = (SELECT id FROM root)))
+    '''
+    params = [message_id, message_id]
+    if participant_id is not None:
+        query += " AND (m.sender_id = ? OR m.recipient_id = ?)"
+        params.extend([participant_id, participant_id])
+    query += " ORDER BY m.timestamp, m.id"
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute(query, params)
+        return _with_sender_names(cursor.fetchall())
 
 def mark_as_read(message_id):
     """Mark a message as read."""
@@ -74,32 +426,58 @@ def mark_as_read(message_id):
             WHERE id = ?
         ''', (message_id,))
 
+def mark_many_as_read(message_ids, recipient_id=None):
+    """Mark a set of messages as read with a single statement.
+    
+    Args:
+        message_ids: Ids of the messages to mark
+        recipient_id: If given, only that recipient's messages are marked
+    
+    Returns:
+        int: Number of messages that changed from unread to read
+    """
+    query = '''
+        UPDATE messages
+        SET is_read = 1
+        WHERE id IN (SELECT value FROM json_each(?)) AND is_read = 0
+    '''
+    params = [json.dumps(list(message_ids))]
+    if recipient_id is not None:
+        query += " AND recipient_id = ?"
+        params.append(recipient_id)
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute(query, params)
+        return cursor.rowcount
+
+def mark_all_as_read(recipient_id):
+    """Mark every unread message of a recipient as read.
+    
+    Returns:
+        int: Number of messages that changed from unread to read
+    """
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute('''
+            UPDATE messages
+            SET is_read = 1
+            WHERE recipient_id = ? AND is_read = 0
+        ''', (recipient_id,))
+        return cursor.rowcount
+
 def get_unread_count(recipient_id):
     """Get the count of unread messages for a recipient."""
     with DatabaseConnection.get_cursor('mailbox') as cursor:
         cursor.execute('''
-            SELECT COUNT(*)
-            FROM messages
-            WHERE recipient_id = ? AND is_read = 0
+            SELECT unread
+            FROM unread_counts
+            WHERE recipient_id = ?
         ''', (recipient_id,))
-        return cursor.fetchone()[0]
+        row = cursor.fetchone()
+        return row[0] if row else 0
 
 def delete_message(message_id):
     """Delete a message from the database.
     Returns True if message was deleted, False if message didn't exist."""
     with DatabaseConnection.get_cursor('mailbox') as cursor:
-        # First check if message exists
-        cursor.execute('SELECT id FROM messages WHERE id = ?', (message_id,))
-        if not cursor.fetchone():
-            return False
-        
-        # Delete the message
         cursor.execute('DELETE FROM messages WHERE id = ?', (message_id,))
-        
-        # Verify the deletion
-        cursor.execute('SELECT id FROM messages WHERE id = ?', (message_id,))
-        if cursor.fetchone():
-            # If we can still find the message, something went wrong
-            return False
-            
-        return True 
\ No newline at end of file
+        return cursor.rowcount > 0
+ 
\ No newline at end of file
@@ -0,0 +1,260 @@
+"""Mailbox retention: archive old mail, trim oversized inboxes and compact mailbox.db.
+
+Expired messages are copied into the ``mailbox_archive`` database and deleted
+from ``mailbox.db`` in batches. Each batch is one transaction over both files,
+with the archive attached to the mailbox connection, and its delete is a single
+statement. The mailbox triggers keep the search index, unread counters, shared
+bodies and thread links consistent as rows go. Freed pages are then returned
+to the filesystem with an incremental vacuum.
+
+MailboxRetentionJob runs the policy periodically on a background thread.
+"""
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from shared.clock import get_clock
+from shared.database import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+# Schema for the mailbox archive database
+ARCHIVE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS archived_messages (
+        id INTEGER PRIMARY KEY,
+        sender_id INTEGER NOT NULL,
+        recipient_id INTEGER NOT NULL,
+        subject TEXT NOT NULL,
+        content TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        is_read BOOLEAN NOT NULL,
+        archived_at DATETIME NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_archived_messages_recipient
+    ON archived_messages (recipient_id, timestamp DESC);
+'''
+
+
+@dataclass
+class RetentionPolicy:
+    """Which messages to remove from the live mailbox and how.
+
+    Attributes:
+        max_age_days: Remove messages older than this many days (None disables)
+        max_messages_per_recipient: Keep only this many newest messages per
+            recipient (None disables)
+        keep_unread: Never remove unread messages
+        archive: Copy removed messages to the archive database first
+        batch_size: Messages moved per transaction
+        vacuum_pages: Pages to reclaim per run (None reclaims all free pages)
+    """
+    max_age_days: Optional[int] = 90
+    max_messages_per_recipient: Optional[int] = None
+    keep_unread: bool = True
+    archive: bool = True
+    batch_size: int = 500
+    vacuum_pages: Optional[int] = None
+
+
+@dataclass
+class RetentionReport:
+    archived: int = 0
+    deleted: int = 0
+    freed_pages: int = 0
+
+
+def init_archive_db():
+    """Initialize the mailbox archive database."""
+    DatabaseConnection.init_db('mailbox_archive', ARCHIVE_SCHEMA)
+
+
+# Ids of the messages a retention run removes, selected once per run
+EXPIRED_SCHEMA = 'CREATE TEMP TABLE expired_messages (id INTEGER PRIMARY KEY)'
+
+
+def _collect_expired_ids(conn, policy: RetentionPolicy, now: datetime) -> int:
+    """Store the ids of every message the policy removes in temp.expired_messages.
+
+    The age and per-recipient selects each scan the messages table once, here,
+    rather than once per batch.
+
+    Returns:
+        int: Number of messages selected
+    """
+    conn.execute(EXPIRED_SCHEMA)
+    selects = []
+    params = []
+    unread_filter = " AND is_read != 0" if policy.keep_unread else ""
+    if policy.max_age_days is not None:
+        cutoff = now - timedelta(days=policy.max_age_days)
+        selects.append(f"SELECT id FROM messages WHERE timestamp < ?{unread_filter}")
+        params.append(cutoff.isoformat(sep=' '))
+    if policy.max_messages_per_recipient is not None:
+        selects.append(f'''
+            SELECT id FROM (
+                SELECT id, is_read, ROW_NUMBER() OVER (
+                    PARTITION BY recipient_id ORDER BY timestamp DESC, id DESC
+                ) AS position
+                FROM messages
+            )
+            WHERE position > ?{unread_filter}
+        ''')
+        params.append(policy.max_messages_per_recipient)
+    if not selects:
+        return 0
+
+    with conn:
+        return conn.execute(
+            f"INSERT INTO temp.expired_messages (id) {' UNION '.join(selects)}", params
+        ).rowcount
+
+
+def _next_expired_batch(conn, after_id: int, limit: int) -> List[int]:
+    """Get the next limit ids from temp.expired_messages above after_id, in id order."""
+    cursor = conn.execute(
+        "SELECT id FROM temp.expired_messages WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def apply_retention(policy: Optional[RetentionPolicy] = None, now: Optional[datetime] = None) -> RetentionReport:
+    """Archive and delete the messages selected by a retention policy, then compact.
+
+    Expired messages are selected once into a temporary table, which is then
+    paged through batch_size ids at a time; each batch is archived and
+    deleted in its own transaction.
+
+    Args:
+        policy: Retention policy (defaults to RetentionPolicy())
+        now: Reference time for age limits (defaults to the clock's current time)
+
+    Returns:
+        RetentionReport with the number of messages archived and deleted and
+        the number of pages returned to the filesystem
+    """
+    policy = policy or RetentionPolicy()
+    report = RetentionReport()
+    now = now or get_clock().now()
+
+    with DatabaseConnection.get_connection('mailbox') as conn:
+        try:
+            if _collect_expired_ids(conn, policy, now) and policy.archive:
+                init_archive_db()
+                conn.execute("ATTACH DATABASE ? AS archive", (DatabaseConnection.get_db_path('mailbox_archive'),))
+            expired_ids = _next_expired_batch(conn, 0, policy.batch_size)
+            while expired_ids:
+                batch = json.dumps(expired_ids)
+                with conn:  # One transaction per batch, across both files
+                    if policy.archive:
+                        cursor = conn.execute('''
+                            INSERT OR REPLACE INTO archive.archived_messages
+                            (id, sender_id, recipient_id, subject, content, timestamp, is_read, archived_at)
+                            SELECT m.id, m.sender_id, m.recipient_id, m.subject,
+                                   COALESCE(b.content, m.content), m.timestamp, m.is_read, ?
+                            FROM messages m
+                            LEFT JOIN message_bodies b ON b.id = m.body_id
+                            WHERE m.id IN (SELECT value FROM json_each(?))
+                        ''', (get_clock().now().isoformat(sep=' '), batch))
+                        report.archived += cursor.rowcount
+                    cursor = conn.execute(
+                        "DELETE FROM messages WHERE id IN (SELECT value FROM json_each(?))",
+                        (batch,)
+                    )
+                    report.deleted += cursor.rowcount
+                expired_ids = _next_expired_batch(conn, expired_ids[-1], policy.batch_size)
+        finally:
+            conn.execute("DROP TABLE IF EXISTS temp.expired_messages")
+
+    report.freed_pages = compact_mailbox(policy.vacuum_pages)
+    return report
+
+
+def compact_mailbox(max_pages: Optional[int] = None) -> int:
+    """Return free pages in mailbox.db to the filesystem.
+
+    Databases created before incremental vacuum was enabled are converted with
+    a one-off full VACUUM.
+
+    Returns:
+        int: Number of pages freed
+    """
+    with DatabaseConnection.get_connection('mailbox') as conn:
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+        elif max_pages is None:
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+        else:
+            conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+        free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return free_before - free_after
+
+
+def get_archived_messages(recipient_id: int, limit: int = 50):
+    """Get a recipient's archived messages, newest first.
+
+    Returns:
+        list: (id, sender_id, subject, content, timestamp, is_read) tuples
+    """
+    init_archive_db()
+    with DatabaseConnection.get_cursor('mailbox_archive') as cursor:
+        cursor.execute('''
+            SELECT id, sender_id, subject, content, timestamp, is_read
+            FROM archived_messages
+            WHERE recipient_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        ''', (recipient_id, limit))
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+class MailboxRetentionJob:
+    """Applies a retention policy to the mailbox on a background thread."""
+
+    def __init__(self, policy: Optional[RetentionPolicy] = None, interval_seconds: float = 3600):
+        self.policy = policy or RetentionPolicy()
+        self.interval_seconds = interval_seconds
+        self.thread = None
+        self.last_report: Optional[RetentionReport] = None
+        self._stop_event = threading.Event()
+
+    def run_once(self) -> RetentionReport:
+        """Apply the policy once in the calling thread."""
+        report = apply_retention(self.policy)
+        self.last_report = report
+        logger.info("Mailbox retention archived %d, deleted %d, freed %d pages",
+                    report.archived, report.deleted, report.freed_pages)
+        return report
+
+    def run(self):
+        """Background loop: apply the policy, then wait for the next interval."""
+        logger.info("Mailbox retention job started")
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error("Error applying mailbox retention: %s", e, exc_info=True)
+            get_clock().wait(self._stop_event, self.interval_seconds)
+
+    def start(self):
+        """Start the background thread."""
+        if self.thread is not None:
+            logger.warning("Mailbox retention job is already running")
+            return
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the background thread, waiting for a run in progress to finish."""
+        if self.thread is None:
+            return
+        self._stop_event.set()
+        self.thread.join(timeout=30)
+        self.thread = None
+        logger.info("Mailbox retention job stopped")
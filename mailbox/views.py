@@ -4,10 +4,14 @@ from shared.common_ui import print_common_header
 from shared.rich_ui import print_status, print_info, print_error
 from datetime import datetime
 from human_resources.repository import EmployeeRepository
+from human_resources.views import select_employee
 from player.repository import PlayerRepository
 from player.models import Player
 from player.utils import validate_player_setup, validate_current_player
 
+# Number of message headers shown per page
+MESSAGES_PER_PAGE = 10
+
 def format_message_list(messages):
     """Format a list of messages for display."""
     formatted_messages = []
@@ -43,6 +47,9 @@ def show_mailbox_menu():
             "1. View Messages",
             "2. Send Message",
             "3. Delete Message",
+            "4. Search Messages",
+            "5. Send Announcement to All Employees",
+            "6. Mark All as Read",
             "Q. Return to Main Menu"
         ]
         
@@ -55,6 +62,14 @@ def show_mailbox_menu():
             send_message(current_player.employee_id)
         elif choice == '3':
             delete_message()
+        elif choice == '4':
+            search_messages(current_player.employee_id)
+        elif choice == '5':
+            send_announcement(current_player.employee_id)
+        elif choice == '6':
+            marked = models.mark_all_as_read(current_player.employee_id)
+            print_status("Message Status", f"Marked {marked} messages as read.")
+            input("\nPress Enter to continue...")
         elif choice.upper() == 'Q':
             clear_screen()
             break
@@ -62,30 +77,56 @@ def show_mailbox_menu():
             print_error("Invalid choice. Please try again.")
             input("Press Enter to continue...")
 
+def choose_message(recipient_id, title, action):
+    """Page through a recipient's message headers and return the chosen message id.
+    
+    Returns None if the mailbox is empty or the user returns without choosing.
+    """
+    cursors = [None]  # Cursor of every page visited so far, for going back
+    while True:
+        clear_screen()
+        print_common_header()
+        
+        messages, next_cursor = models.get_message_page(
+            recipient_id, page_size=MESSAGES_PER_PAGE, cursor=cursors[-1], headers_only=True
+        )
+        if not messages:
+            print_info("No Messages", "Your mailbox is empty.")
+            input("\nPress Enter to continue...")
+            return None
+        
+        formatted_messages = format_message_list(messages)
+        if len(cursors) > 1 or next_cursor:
+            formatted_messages.append(f"Page {len(cursors)}")
+        print_menu(title, formatted_messages)
+        
+        navigation = []
+        if next_cursor:
+            navigation.append("N for next page")
+        if len(cursors) > 1:
+            navigation.append("P for previous page")
+        navigation.append("Q to return")
+        choice = input(f"\nEnter message number to {action} ({', '.join(navigation)}): ").upper()
+        if choice == 'Q':
+            return None
+        if choice == 'N' and next_cursor:
+            cursors.append(next_cursor)
+            continue
+        if choice == 'P' and len(cursors) > 1:
+            cursors.pop()
+            continue
+        
+        try:
+            return int(choice)
+        except ValueError:
+            print_error("Invalid message number.")
+            input("Press Enter to continue...")
+
 def view_messages(player_id):
     """View all messages."""
-    clear_screen()
-    print_common_header()
-    
-    messages = models.get_messages(player_id)
-    if not messages:
-        print_info("No Messages", "Your mailbox is empty.")
-        input("\nPress Enter to continue...")
-        return
-    
-    formatted_messages = format_message_list(messages)
-    print_menu("Your Messages", formatted_messages)
-    
-    choice = input("\nEnter message number to read (or Q to return): ")
-    if choice.upper() == 'Q':
-        return
-    
-    try:
-        msg_id = int(choice)
+    msg_id = choose_message(player_id, "Your Messages", "read")
+    if msg_id is not None:
         view_message(msg_id)
-    except ValueError:
-        print_error("Invalid message number.")
-        input("Press Enter to continue...")
 
 def view_message(msg_id):
     """View a specific message."""
@@ -102,8 +143,7 @@ def view_message(msg_id):
         input("Press Enter to continue...")
         return
     
-    messages = models.get_messages(current_player.employee_id)
-    message = next((msg for msg in messages if msg[0] == msg_id), None)
+    message = models.get_message(msg_id, current_player.employee_id)
     
     if not message:
         print_error("Message not found.")
@@ -121,45 +161,67 @@ def view_message(msg_id):
         {content}
     """)
     
-    input("\nPress Enter to continue...")
+    choice = input("\nEnter R to reply, T to view the thread, or press Enter to continue: ").upper()
+    if choice == 'R':
+        reply_to_message(current_player.employee_id, msg_id)
+    elif choice == 'T':
+        view_thread(msg_id, current_player.employee_id)
 
-def select_recipient():
-    """Display a list of employees and allow selection of a recipient."""
-    employees = EmployeeRepository.get_all()
-    if not employees:
-        print_error("No employees found in the system.")
-        return None
+def view_thread(msg_id, employee_id):
+    """Show every message in a message's thread, oldest first."""
+    clear_screen()
+    print_common_header()
     
-    print("\nSelect a recipient:")
-    for i, emp in enumerate(employees, 1):
-        print(f"{i}. {emp.first_name} {emp.last_name}")
+    for _, sender_name, subject, content, timestamp, _ in models.get_thread(msg_id, employee_id):
+        print_info(f"{subject} - {sender_name} ({timestamp})", content)
     
-    while True:
-        try:
-            choice = input("\nEnter recipient number (or Q to return): ")
-            if choice.upper() == 'Q':
-                return None
-            
-            index = int(choice) - 1
-            if 0 <= index < len(employees):
-                return employees[index].id
-            else:
-                print_error("Invalid selection. Please try again.")
-        except ValueError:
-            print_error("Please enter a valid number.")
+    input("\nPress Enter to continue...")
 
-def send_message(sender_id):
-    """Send a new message."""
+def reply_to_message(sender_id, msg_id):
+    """Reply to a message, linking the reply into its thread."""
+    content = read_message_body()
+    if not content:
+        print_error("Reply not sent. The message body is required.")
+    elif models.reply_to_message(msg_id, sender_id, content) is None:
+        print_error("Message not found.")
+    else:
+        print_status("Message Status", "Reply sent successfully!")
+    
+    input("\nPress Enter to continue...")
+
+def search_messages(recipient_id):
+    """Search the player's messages by subject and content."""
     clear_screen()
     print_common_header()
     
-    print_info("Send Message", "Enter message details:")
-    recipient_id = select_recipient()
-    if not recipient_id:
+    text = input("Search for: ").strip()
+    if not text:
         return
     
-    subject = input("Subject: ")
+    messages = models.search_messages(recipient_id, text)
+    if not messages:
+        print_info("Search Results", f"No messages match '{text}'.")
+        input("\nPress Enter to continue...")
+        return
+    
+    print_menu(f"Messages matching '{text}'", format_message_list(messages))
+    choice = input("\nEnter message number to read (or Q to return): ")
+    if choice.upper() == 'Q':
+        return
     
+    try:
+        view_message(int(choice))
+    except ValueError:
+        print_error("Invalid message number.")
+        input("Press Enter to continue...")
+
+def select_recipient():
+    """Let the user pick a recipient from the paged employee directory."""
+    employee = select_employee("Select a Recipient")
+    return employee.id if employee else None
+
+def read_message_body():
+    """Read a multi-line message body, ended by an empty line."""
     print("\nEnter your message (press Enter twice to finish):")
     content_lines = []
     while True:
@@ -168,7 +230,20 @@ def send_message(sender_id):
             break
         content_lines.append(line)
     
-    content = "\n".join(content_lines[:-1])  # Remove the last empty line
+    return "\n".join(content_lines[:-1])  # Remove the last empty line
+
+def send_message(sender_id):
+    """Send a new message."""
+    clear_screen()
+    print_common_header()
+    
+    recipient_id = select_recipient()
+    if not recipient_id:
+        return
+    
+    print_info("Send Message", "Enter message details:")
+    subject = input("Subject: ")
+    content = read_message_body()
     
     if recipient_id and subject and content:
         models.add_message(sender_id, recipient_id, subject, content)
@@ -178,6 +253,27 @@ def send_message(sender_id):
     
     input("\nPress Enter to continue...")
 
+def send_announcement(sender_id):
+    """Send one message to every active employee."""
+    clear_screen()
+    print_common_header()
+    
+    print_info("Send Announcement", "Enter announcement details:")
+    subject = input("Subject: ")
+    content = read_message_body()
+    if not (subject and content):
+        print_error("Announcement not sent. All fields are required.")
+        input("\nPress Enter to continue...")
+        return
+    
+    recipient_ids = [
+        emp.id for emp in EmployeeRepository.get_all()
+        if emp.employment_status == 'active' and emp.id != sender_id
+    ]
+    sent = models.broadcast_message(sender_id, recipient_ids, subject, content)
+    print_status("Message Status", f"Announcement sent to {sent} employees.")
+    input("\nPress Enter to continue...")
+
 def delete_message():
     """Delete a message."""
     clear_screen()
@@ -193,30 +289,17 @@ def delete_message():
         input("Press Enter to continue...")
         return
     
-    messages = models.get_messages(current_player.employee_id)
-    if not messages:
-        print_info("No Messages", "Your mailbox is empty.")
-        input("\nPress Enter to continue...")
-        return
-    
-    formatted_messages = format_message_list(messages)
-    print_menu("Delete Message", formatted_messages)
-    
-    choice = input("\nEnter message number to delete (or Q to return): ")
-    if choice.upper() == 'Q':
+    msg_id = choose_message(current_player.employee_id, "Delete Message", "delete")
+    if msg_id is None:
         return
     
-    try:
-        msg_id = int(choice)
-        result = models.delete_message(msg_id)
-        if result is True:
-            print_status("Message Status", "Message deleted successfully!")
-        elif result is False:
-            print_error("Failed to delete message. It may not exist or there was a database error.")
-        else:
-            print_error("An unexpected error occurred while deleting the message.")
-    except ValueError:
-        print_error("Invalid message number.")
+    result = models.delete_message(msg_id)
+    if result is True:
+        print_status("Message Status", "Message deleted successfully!")
+    elif result is False:
+        print_error("Failed to delete message. It may not exist or there was a database error.")
+    else:
+        print_error("An unexpected error occurred while deleting the message.")
     
     input("Press Enter to continue...")
 
@@ -1,25 +1,19 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
+from shared.models import LazyDate, SlottedModel, row_value
 
-@dataclass
-class Player:
+class Player(SlottedModel):
     id: Optional[int]
     first_name: str
     last_name: str
     email: str
     employee_id: Optional[int]  # Reference to HR employee record
-    created_at: Optional[datetime]
+    created_at: Optional[datetime] = LazyDate(datetime.fromisoformat)
     days_survived: int = 0
 
     @classmethod
     def from_db_row(cls, row):
         return cls(
-            id=row['id'],
-            first_name=row['first_name'],
-            last_name=row['last_name'],
-            email=row['email'],
-            employee_id=row['employee_id'],
-            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-            days_survived=row['days_survived'] if 'days_survived' in row else 0
-        ) 
\ No newline at end of file
+            row['id'], row['first_name'], row['last_name'], row['email'], row['employee_id'],
+            row['created_at'], row_value(row, 'days_survived', 0)
+        )
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Set
 from .models import Player
 from shared.database import DatabaseConnection
 from human_resources.repository import EmployeeRepository
@@ -70,6 +70,13 @@ class PlayerRepository:
             cursor.execute('SELECT COUNT(*) FROM players')
             return cursor.fetchone()[0] > 0
 
+    @staticmethod
+    def get_linked_employee_ids() -> Set[int]:
+        """Get the ids of every employee record a player is linked to."""
+        with DatabaseConnection.get_cursor('player') as cursor:
+            cursor.execute('SELECT DISTINCT employee_id FROM players WHERE employee_id IS NOT NULL')
+            return {row[0] for row in cursor.fetchall()}
+
     @staticmethod
     def update_employee_id(player_id: int, employee_id: int) -> bool:
         """Update a player's employee ID reference."""
@@ -0,0 +1,122 @@
+"""Injectable clock for game timestamps and agent waits.
+
+Code that timestamps records or waits between cycles asks get_clock() instead
+of calling datetime.now() or time.sleep() directly, so simulations and soak
+tests can install a faster clock with set_clock():
+
+- SystemClock: real time, the default
+- VirtualClock: time runs `speed` times faster than real time from a start
+  point, and waits are shortened to match, e.g. speed=1440 plays a game day
+  per real minute
+- ManualClock: time stands still until set or advanced, and waiting advances
+  it instantly; for single-threaded simulations stepping their own time
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+class Clock(ABC):
+    """The current time and a way to wait, in the clock's own time."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """The current local time, naive."""
+        pass
+
+    def utc_now(self) -> datetime:
+        """The current time in UTC, naive, matching SQLite's CURRENT_TIMESTAMP."""
+        return self.now().astimezone(timezone.utc).replace(tzinfo=None)
+
+    def sleep(self, seconds: float):
+        """Wait for a number of clock seconds."""
+        self.wait(threading.Event(), seconds)
+
+    @abstractmethod
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        """Wait up to a number of clock seconds for an event; returns whether it is set."""
+        pass
+
+
+class SystemClock(Clock):
+    """Real time."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(seconds)
+
+
+class VirtualClock(Clock):
+    """Time running a fixed multiple faster than real time."""
+
+    def __init__(self, speed: float, start: Optional[datetime] = None):
+        if speed <= 0:
+            raise ValueError("Clock speed must be positive")
+        self.speed = speed
+        self.start = start or datetime.now()
+        self._origin = time.monotonic()
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=(time.monotonic() - self._origin) * self.speed)
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds / self.speed)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(seconds / self.speed)
+
+
+class ManualClock(Clock):
+    """Time that only moves when set or advanced."""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime.now()
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            return self._now
+
+    def set(self, when: datetime):
+        with self._lock:
+            self._now = when
+
+    def advance(self, seconds: float = 0, **delta) -> datetime:
+        """Move time forward by seconds plus any timedelta keywords (minutes=, hours=, days=)."""
+        with self._lock:
+            self._now += timedelta(seconds=seconds, **delta)
+            return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        if not event.is_set():
+            self.advance(seconds)
+        return event.is_set()
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """Get the clock in use."""
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """Install a clock, or the system clock for None.
+
+    Returns:
+        Clock: The clock previously in use, for restoring it afterwards
+    """
+    global _clock
+    previous, _clock = _clock, clock or SystemClock()
+    return previous
@@ -2,7 +2,7 @@ from .rich_ui import print_game_header
 from player.repository import PlayerRepository
 from human_resources.repository import EmployeeRepository
 from player.models import Player
-from human_resources.utils import get_current_employee
+from shared.session import get_session
 import shutil
 from rich.console import Console
 
@@ -12,8 +12,9 @@ def print_common_header():
     from mailbox import models as mailbox_models
     from game_calendar import models as calendar_models
     
-    # Get current employee info
-    current_employee = get_current_employee()
+    # Get current employee info from the session rather than the player and HR databases
+    session = get_session()
+    current_employee = session.employee
     employee_name = f"{current_employee.first_name} {current_employee.last_name}" if current_employee else ""
     
     # Get active ticket count
@@ -26,11 +27,10 @@ def print_common_header():
     player_level = 1  # Placeholder until player module is implemented
     
     # Get game day from calendar module
-    game_day = calendar_models.get_current_game_day()
+    game_day = session.game_day
     
     # Get meetings count for today
-    meetings = calendar_models.get_meetings(game_day)
-    meetings_count = len(meetings)
+    meetings_count = calendar_models.count_meetings(game_day)
         
     # Print the game header
     print_game_header(active_tickets, mailbox_messages, game_day, player_level, meetings_count, employee_name) 
@@ -1,8 +1,9 @@
 import sqlite3
 import os
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import Callable, Optional, Union, Dict
 
 # Base directory for all databases
 DB_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'databases')
@@ -16,6 +17,7 @@ DB_PATHS = {
     'hardware': os.path.join(DB_DIR, 'hardware_catalog.db'),
     'hr': os.path.join(DB_DIR, 'hr.db'),
     'mailbox': os.path.join(DB_DIR, 'mailbox.db'),
+    'mailbox_archive': os.path.join(DB_DIR, 'mailbox_archive.db'),
     'calendar': os.path.join(DB_DIR, 'calendar.db'),
     'player': os.path.join(DB_DIR, 'player.db'),
     'game_state': os.path.join(DB_DIR, 'game_state.db')
@@ -29,6 +31,9 @@ class DatabaseConnection:
     
     _test_db_paths: Dict[str, str] = {}
     
+    # Called with (db_name, seconds) as each connection closes; see set_observer
+    _observer: Optional[Callable[[str, float], None]] = None
+    
     @classmethod
     def set_test_db_paths(cls, paths: Dict[str, str]):
         """Set test database paths for testing.
@@ -43,6 +48,16 @@ class DatabaseConnection:
         """Clear test database paths."""
         cls._test_db_paths = {}
     
+    @classmethod
+    def set_observer(cls, observer: Optional[Callable[[str, float], None]]):
+        """Report how long each connection was open, e.g. to profile a simulation.
+        
+        Args:
+            observer: Called with the database name and seconds spent between
+                opening and closing each connection, or None to stop reporting
+        """
+        cls._observer = observer
+    
     @classmethod
     def get_db_path(cls, db_name: str) -> str:
         """Get the path to a database file.
@@ -69,6 +84,7 @@ class DatabaseConnection:
         if db_name not in DB_PATHS:
             raise ValueError(f"Unknown database: {db_name}. Must be one of {list(DB_PATHS.keys())}")
             
+        started = time.perf_counter()
         conn = sqlite3.connect(DatabaseConnection.get_db_path(db_name), timeout=timeout)
         # Set row factory to return rows as dictionaries
         conn.row_factory = sqlite3.Row
@@ -80,6 +96,9 @@ class DatabaseConnection:
             yield conn
         finally:
             conn.close()
+            observer = DatabaseConnection._observer
+            if observer is not None:
+                observer(db_name, time.perf_counter() - started)
 
     @staticmethod
     @contextmanager
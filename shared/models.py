@@ -0,0 +1,111 @@
+"""Compact record classes for rows loaded from the game databases.
+
+SlottedModel subclasses declare their fields with annotations, as with
+@dataclass, and get __slots__, a generated __init__, __eq__ and __repr__.
+Fields whose default is a LazyDate keep the ISO text read from SQLite and
+parse it on first access. Declaring a class with ``frozen=True`` makes its
+instances immutable and hashable.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_MISSING = object()
+
+
+class LazyDate:
+    """A date or datetime field stored as ISO text until it is first read."""
+
+    def __init__(self, parse: Callable[[str], Any], default: Any = _MISSING):
+        self.parse = parse
+        self.default = default
+        self.slot = None  # Slot member descriptor, bound by SlottedModel
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if isinstance(value, str):
+            value = self.parse(value) if value else None
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        if obj._frozen:
+            raise AttributeError(f"cannot assign to field of frozen {type(obj).__name__}")
+        self.slot.__set__(obj, value)
+
+
+class _ModelMeta(type):
+    def __new__(mcls, name, bases, namespace, frozen: bool = False):
+        fields = tuple(field for field in namespace.get('__annotations__', {}) if not field.startswith('_'))
+        lazy = {field: namespace.pop(field) for field in fields if isinstance(namespace.get(field), LazyDate)}
+        defaults = {field: namespace.pop(field) for field in fields if field in namespace}
+        for field, descriptor in lazy.items():
+            if descriptor.default is not _MISSING:
+                defaults[field] = descriptor.default
+
+        namespace['__slots__'] = tuple(f'_{field}' if field in lazy else field for field in fields)
+        namespace['_frozen'] = frozen
+        cls = super().__new__(mcls, name, bases, namespace)
+        if not fields:
+            return cls
+
+        # Lazy fields are descriptors in front of an underscored slot
+        for field, descriptor in lazy.items():
+            descriptor.slot = cls.__dict__[f'_{field}']
+            setattr(cls, field, descriptor)
+        cls._fields = fields
+        cls.__init__ = _make_init(cls, fields, defaults, lazy)
+        if frozen:
+            cls.__hash__ = lambda self: hash(self._astuple())
+        return cls
+
+
+def _make_init(cls, fields: Tuple[str, ...], defaults: Dict[str, Any], lazy: Dict[str, LazyDate]):
+    """Generate an __init__ that stores each argument straight into its slot."""
+    setters = {f'_set_{field}': cls.__dict__[f'_{field}' if field in lazy else field].__set__ for field in fields}
+    defaults_ns = {f'_default_{field}': value for field, value in defaults.items()}
+    params = ', '.join(f'{field}=_default_{field}' if field in defaults else field for field in fields)
+    body = '\n'.join(f'    _set_{field}(self, {field})' for field in fields)
+    namespace = {}
+    exec(f'def __init__(self, {params}):\n{body}\n', {**setters, **defaults_ns}, namespace)
+    return namespace['__init__']
+
+
+class SlottedModel(metaclass=_ModelMeta):
+    """Base for compact, optionally frozen record classes."""
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_tuple(cls, values):
+        """Build a record from values in field order, e.g. a row selected with the field list."""
+        return cls(*values)
+
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{type(self).__name__}({values})'
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(f"cannot assign to field of frozen {type(self).__name__}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if self._frozen:
+            raise AttributeError(f"cannot delete field of frozen {type(self).__name__}")
+        super().__delattr__(name)
+
+
+def row_value(row, column: str, default: Optional[Any] = None) -> Any:
+    """Read a column from a sqlite3.Row, with a default for columns older databases lack."""
+    return row[column] if column in row.keys() else default
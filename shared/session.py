@@ -0,0 +1,83 @@
+"""The signed-in player's session: current player, employee, role and game day.
+
+Finding the current employee takes a player.db query for the most recent
+player and an hr.db query for their employee record, and every screen header
+needs it. A GameSession resolves the player once, at login in
+validate_player_setup, and keeps it until a change event calls
+refresh_session: the player signing up, quitting or having their record
+updated. The employee and role are read through the HR identity maps, which
+the HR repositories keep current, and the game day through the calendar's
+current-day cache, so none of them cost a query per screen.
+"""
+from typing import Dict, Optional
+from shared.database import DatabaseConnection
+from player.models import Player
+from player.repository import PlayerRepository
+from human_resources.models import Employee, Role
+from human_resources.repository import EmployeeRepository, RoleRepository
+
+# Sessions keyed by player database path
+_sessions: Dict[str, 'GameSession'] = {}
+
+
+class GameSession:
+    """The current player and the employee, role and game day that go with them."""
+
+    def __init__(self):
+        self.player: Optional[Player] = None
+        self._loaded = False
+
+    def refresh(self) -> 'GameSession':
+        """Reload the current player from the player database."""
+        self.player = PlayerRepository.get_most_recent()
+        self._loaded = True
+        return self
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def employee(self) -> Optional[Employee]:
+        """The current player's employee record, or None without a player or employee."""
+        if not self.player or not self.player.employee_id:
+            return None
+        return EmployeeRepository.get_by_id(self.player.employee_id)
+
+    @property
+    def role(self) -> Optional[Role]:
+        """The current employee's role, or None."""
+        employee = self.employee
+        if not employee or not employee.role_id:
+            return None
+        return RoleRepository.get_by_id(employee.role_id)
+
+    @property
+    def game_day(self) -> int:
+        """The current game day number."""
+        from game_calendar.models import get_current_game_day
+        return get_current_game_day()
+
+
+def _current() -> GameSession:
+    path = DatabaseConnection.get_db_path('player')
+    session = _sessions.get(path)
+    if session is None:
+        session = _sessions[path] = GameSession()
+    return session
+
+
+def get_session() -> GameSession:
+    """Get the session for the current player database, loading it on first use."""
+    session = _current()
+    return session if session.loaded else session.refresh()
+
+
+def refresh_session() -> GameSession:
+    """Reload the session after the current player or their employee link changes."""
+    return _current().refresh()
+
+
+def clear_session():
+    """Forget the session for the current player database."""
+    _sessions.pop(DatabaseConnection.get_db_path('player'), None)
@@ -0,0 +1,14 @@
+"""
+Headless simulation of the whole game loop, for load testing.
+
+Usage: python -m simulation --days 5 --bots 3
+"""
+from .runner import SimulationConfig, run_simulation
+from .metrics import DayMetrics, SimulationReport
+
+__all__ = [
+    'SimulationConfig',
+    'run_simulation',
+    'DayMetrics',
+    'SimulationReport',
+]
@@ -0,0 +1,74 @@
+"""Scripted stand-ins for the player and the LLM used by headless simulations."""
+import random
+from typing import Dict, Optional
+
+from human_resources.models import Employee
+from mailbox import models as mailbox_models
+from tickets import models as ticket_models
+
+HR_SUBJECTS = ["Time off request", "Question about benefits", "Desk move", "Training budget"]
+
+
+class ScriptedModel:
+    """Answers every prompt with a canned reply, in place of an llm model."""
+
+    class _Response:
+        def __init__(self, text: str):
+            self._text = text
+
+        def text(self) -> str:
+            return self._text
+
+    def __init__(self, reply: str = "Thanks for reaching out. We'll follow up shortly."):
+        self.reply = reply
+        self.prompts = 0
+
+    def prompt(self, prompt: str) -> '_Response':
+        self.prompts += 1
+        return self._Response(self.reply)
+
+
+class PlayerBot:
+    """A scripted IT support player who works tickets and writes to HR.
+
+    Each call to act() is one tick of the bot's shift. The bot claims an
+    unassigned ticket while it has fewer than `capacity` open, moves each
+    claimed ticket to In Progress and resolves it `work_ticks` ticks later,
+    submitting a ticket_submitted event to the queue. Now and then it mails HR.
+    """
+
+    def __init__(self, employee: Employee, hr_manager_id: Optional[int], work_ticks: int = 2,
+                 capacity: int = 2, message_chance: float = 0.05, rng: Optional[random.Random] = None):
+        self.employee = employee
+        self.hr_manager_id = hr_manager_id
+        self.work_ticks = work_ticks
+        self.capacity = capacity
+        self.message_chance = message_chance
+        self.rng = rng or random.Random()
+        self.open_tickets: Dict[str, int] = {}  # Ticket id to ticks of work left
+
+    def act(self, queue_manager, metrics):
+        """Work one tick, recording what happened in a DayMetrics."""
+        for ticket_id, ticks_left in list(self.open_tickets.items()):
+            if ticks_left > 1:
+                self.open_tickets[ticket_id] = ticks_left - 1
+                continue
+            ticket_models.mutate_ticket_status(ticket_id, 'Resolved')
+            del self.open_tickets[ticket_id]
+            event_id = queue_manager.add_event('ticket_submitted', {'ticket_id': ticket_id, 'employee_id': self.employee.id})
+            metrics.event_queued(event_id)
+            metrics.tickets_resolved += 1
+
+        if len(self.open_tickets) < self.capacity:
+            unassigned = ticket_models.get_unassigned_tickets()
+            if unassigned:
+                ticket_id = unassigned[0]['id']
+                ticket_models.assign_ticket(ticket_id, self.employee.id)
+                ticket_models.mutate_ticket_status(ticket_id, 'In Progress')
+                self.open_tickets[ticket_id] = self.work_ticks
+
+        if self.hr_manager_id and self.rng.random() < self.message_chance:
+            subject = self.rng.choice(HR_SUBJECTS)
+            mailbox_models.add_message(self.employee.id, self.hr_manager_id, subject,
+                                       f"Hi, {self.employee.first_name} here with a question: {subject.lower()}.")
+            metrics.messages_sent += 1
@@ -0,0 +1,88 @@
+"""Per-day throughput, queue latency and database time of a simulation run."""
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class DayMetrics:
+    """What happened during one simulated game day.
+
+    Attributes:
+        day: Game day number
+        tickets_created: Tickets opened by the customer agent
+        tickets_resolved: Tickets resolved by player bots
+        messages_sent: Messages the bots sent to HR
+        messages_handled: Unread HR messages the HR agent answered
+        events_processed: Queue events handled
+        queue_latency: Seconds from queueing to handling, per event
+        db_seconds: Seconds connections were open, per database
+        wall_seconds: Real time the day took to simulate
+    """
+    day: int
+    tickets_created: int = 0
+    tickets_resolved: int = 0
+    messages_sent: int = 0
+    messages_handled: int = 0
+    events_processed: int = 0
+    queue_latency: List[float] = field(default_factory=list)
+    db_seconds: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    wall_seconds: float = 0.0
+    _queued_at: Dict[int, float] = field(default_factory=dict, repr=False)
+
+    def event_queued(self, event_id: int):
+        self._queued_at[event_id] = time.perf_counter()
+
+    def event_processed(self, event_id: int):
+        self.events_processed += 1
+        queued_at = self._queued_at.pop(event_id, None)
+        if queued_at is not None:
+            self.queue_latency.append(time.perf_counter() - queued_at)
+
+    def record_db_time(self, db_name: str, seconds: float):
+        """DatabaseConnection observer: add one connection's open time."""
+        self.db_seconds[db_name] += seconds
+
+    @property
+    def db_total(self) -> float:
+        return sum(self.db_seconds.values())
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.queue_latency) / len(self.queue_latency) if self.queue_latency else 0.0
+
+
+@dataclass
+class SimulationReport:
+    days: List[DayMetrics] = field(default_factory=list)
+
+    def total(self, attribute: str) -> float:
+        return sum(getattr(day, attribute) for day in self.days)
+
+    def format(self) -> str:
+        """Render a per-day table followed by totals and per-database time."""
+        lines = [
+            f"{'Day':>4} {'Created':>8} {'Resolved':>9} {'Msgs sent':>10} {'Msgs handled':>13} "
+            f"{'Events':>7} {'Latency ms':>11} {'DB ms':>8} {'Wall ms':>8}"
+        ]
+        for day in self.days:
+            lines.append(
+                f"{day.day:>4} {day.tickets_created:>8} {day.tickets_resolved:>9} {day.messages_sent:>10} "
+                f"{day.messages_handled:>13} {day.events_processed:>7} {day.mean_latency * 1000:>11.2f} "
+                f"{day.db_total * 1000:>8.1f} {day.wall_seconds * 1000:>8.1f}"
+            )
+        wall = self.total('wall_seconds')
+        lines.append(
+            f"Total: {self.total('tickets_created'):.0f} tickets created, {self.total('tickets_resolved'):.0f} resolved, "
+            f"{self.total('messages_handled'):.0f} messages handled in {wall:.2f} s "
+            f"({self.total('tickets_resolved') / wall if wall else 0:.1f} tickets resolved/s)"
+        )
+        by_database = defaultdict(float)
+        for day in self.days:
+            for db_name, seconds in day.db_seconds.items():
+                by_database[db_name] += seconds
+        lines.append("DB time: " + ", ".join(
+            f"{db_name} {seconds * 1000:.1f} ms" for db_name, seconds in sorted(by_database.items(), key=lambda item: -item[1])
+        ))
+        return '\n'.join(lines)
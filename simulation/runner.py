@@ -0,0 +1,212 @@
+"""Run the customer agent, HR agent and event queue with scripted players, headless.
+
+The simulation builds a fresh set of databases in a work directory, seeds
+the hardware catalog and employee directory, and plays N game days. Each day
+is a fixed number of ticks on a ManualClock set to each tick's game time: no
+thread sleeps, and every component is stepped in turn on the calling thread.
+- The customer agent checks for due tickets.
+- Each player bot claims, works and resolves tickets and mails HR.
+- The queue handles every pending event.
+- The HR agent runs its task cycle every few ticks.
+At the end of a day the calendar advances. DayMetrics records throughput,
+queue latency and the time spent in each database.
+
+Usage: python -m simulation [--days N] [--bots N] [--ticks-per-day N] [--online]
+"""
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from agent.customer.customer_agent import CustomerAgent
+from agent.hr.hr_agent import HRAgent
+from game_calendar import models as calendar_models
+from game_queue.simple_queue import GameEventQueue
+from game_queue.start import QueueManager
+from hardware import models as hardware_models
+from hardware import utils as hardware_utils
+from human_resources import database as hr_database
+from human_resources import utils as hr_utils
+from human_resources.repository import EmployeeRepository, RoleRepository, invalidate_cache
+from mailbox import models as mailbox_models
+from player.repository import init_db as init_player_db
+from shared.clock import ManualClock, set_clock
+from shared.database import DB_PATHS, DatabaseConnection
+from shared.session import clear_session
+from tickets import models as ticket_models
+from .bots import PlayerBot, ScriptedModel
+from .metrics import DayMetrics, SimulationReport
+
+logger = logging.getLogger(__name__)
+
+# Game time of day 1, tick 0
+GAME_START = datetime(2024, 1, 1, 9, 0)
+
+
+@dataclass
+class SimulationConfig:
+    """Shape of a simulation run.
+
+    Attributes:
+        days: Game days to simulate
+        bots: Number of scripted IT support players
+        customers: Size of the customer population
+        max_new_tickets: Open 'New' tickets at which customers stop filing
+            (None for no limit, so the bots' backlog grows under load)
+        ticks_per_day: Steps per game day; each covers the working day's
+            minutes divided evenly
+        hr_every_ticks: Ticks between HR agent task cycles
+        work_ticks: Ticks a bot spends on a ticket before resolving it
+        message_chance: Chance per tick that a bot mails HR
+        offline: Answer LLM prompts with canned text instead of calling a model
+        seed: Random seed for reproducible runs
+        workdir: Directory for the simulation databases (a temporary
+            directory when None)
+    """
+    days: int = 5
+    bots: int = 3
+    customers: int = 1000
+    max_new_tickets: Optional[int] = None
+    ticks_per_day: int = 32
+    hr_every_ticks: int = 8
+    work_ticks: int = 2
+    message_chance: float = 0.05
+    offline: bool = True
+    seed: Optional[int] = None
+    workdir: Optional[str] = None
+
+
+def _setup_databases(workdir: str):
+    """Point every database at the work directory and seed it."""
+    DatabaseConnection.set_test_db_paths({
+        name: os.path.join(workdir, os.path.basename(path)) for name, path in DB_PATHS.items()
+    })
+    invalidate_cache()
+    clear_session()
+    hardware_models.init_db()
+    hardware_utils.migrate_hardware_catalog()
+    ticket_models.init_db()
+    hr_database.init_db()
+    hr_utils.migrate_employee_directory()
+    mailbox_models.init_db()
+    calendar_models.init_db()
+    init_player_db()
+
+
+def _create_bots(config: SimulationConfig, hr_manager_id: Optional[int], rng: random.Random):
+    role = RoleRepository.get_by_title("IT Support Specialist")
+    return [
+        PlayerBot(
+            EmployeeRepository.create(f"Bot{i}", "Player", f"bot{i}@simulation.local",
+                                      date(2024, 1, 1), role.id if role else None),
+            hr_manager_id, work_ticks=config.work_ticks, message_chance=config.message_chance, rng=rng
+        )
+        for i in range(1, config.bots + 1)
+    ]
+
+
+def _simulate_day(day: int, config: SimulationConfig, clock: ManualClock, customer_agent, hr_agent,
+                  queue_manager, bots, hr_manager_id: Optional[int]) -> DayMetrics:
+    metrics = DayMetrics(day=day)
+    DatabaseConnection.set_observer(metrics.record_db_time)
+    started = time.perf_counter()
+    workday = timedelta(minutes=8 * 60)
+    day_start = GAME_START + timedelta(days=day - 1)
+
+    for tick in range(config.ticks_per_day):
+        clock.set(day_start + workday * tick / config.ticks_per_day)
+        metrics.tickets_created += customer_agent.check_and_create_tickets()
+
+        for bot in bots:
+            bot.act(queue_manager, metrics)
+
+        while (event := queue_manager.process_next()) is not None:
+            metrics.event_processed(event['id'])
+
+        if hr_agent and hr_manager_id and (tick + 1) % config.hr_every_ticks == 0:
+            unread = mailbox_models.get_unread_count(hr_manager_id)
+            hr_agent.process_tasks()
+            metrics.messages_handled += unread - mailbox_models.get_unread_count(hr_manager_id)
+
+    calendar_models.advance_game_day()
+    metrics.wall_seconds = time.perf_counter() - started
+    DatabaseConnection.set_observer(None)
+    return metrics
+
+
+def run_simulation(config: Optional[SimulationConfig] = None) -> SimulationReport:
+    """Play config.days game days headless and report per-day metrics.
+
+    The simulation owns the database paths and the clock while it runs. When
+    it finishes it clears the paths and the HR and session caches and
+    restores the previous clock.
+    """
+    config = config or SimulationConfig()
+    rng = random.Random(config.seed)
+    report = SimulationReport()
+    clock = ManualClock(GAME_START)
+    previous_clock = set_clock(clock)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            _setup_databases(config.workdir or temp_dir)
+
+            customer_agent = CustomerAgent()
+            customer_agent.population_size = config.customers
+            customer_agent.max_new_tickets = config.max_new_tickets
+            customer_agent.rng = rng
+            hr_agent = HRAgent()
+            hr_agent.initialize()
+            if config.offline:
+                customer_agent.comment_generator = lambda item: f"My {item['name']} stopped working."
+                hr_agent.llm_client = ScriptedModel()
+            managers = EmployeeRepository.get_by_role_id(hr_agent.role.id)
+            hr_manager_id = managers[0].id if managers else None
+
+            queue_manager = QueueManager()
+            queue_manager.queue = GameEventQueue()  # Bind to the simulation's game_state database
+
+            bots = _create_bots(config, hr_manager_id, rng)
+            for day in range(1, config.days + 1):
+                metrics = _simulate_day(day, config, clock, customer_agent, hr_agent, queue_manager, bots, hr_manager_id)
+                report.days.append(metrics)
+                logger.info("Simulated day %d in %.3f s", day, metrics.wall_seconds)
+        finally:
+            DatabaseConnection.set_observer(None)
+            invalidate_cache()
+            clear_session()
+            calendar_models.invalidate_current_day_cache()
+            DatabaseConnection.clear_test_db_paths()
+            set_clock(previous_clock)
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game loop headless and report throughput.")
+    parser.add_argument('--days', type=int, default=SimulationConfig.days)
+    parser.add_argument('--bots', type=int, default=SimulationConfig.bots)
+    parser.add_argument('--customers', type=int, default=SimulationConfig.customers)
+    parser.add_argument('--max-new-tickets', type=int, default=None,
+                        help="Stop customers filing at this many open New tickets")
+    parser.add_argument('--ticks-per-day', type=int, default=SimulationConfig.ticks_per_day)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workdir', default=None, help="Keep the simulation databases in this directory")
+    parser.add_argument('--online', action='store_true', help="Call the configured LLM models")
+    args = parser.parse_args()
+
+    report = run_simulation(SimulationConfig(
+        days=args.days, bots=args.bots, customers=args.customers, max_new_tickets=args.max_new_tickets,
+        ticks_per_day=args.ticks_per_day,
+        seed=args.seed, workdir=args.workdir, offline=not args.online
+    ))
+    print(report.format())
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ from hardware import models as hardware_models, utils as hardware_utils
 from shared import views as shared_views
 from tickets import models as ticket_models
 from mailbox import models as mailbox_models
+from mailbox.retention import MailboxRetentionJob, init_archive_db
 from human_resources import database as hr_database, utils as hr_utils
 from game_calendar import models as calendar_models
 
@@ -76,6 +77,7 @@ def main():
     
     # Initialize mailbox database after HR database
     mailbox_models.init_db()  # Initialize mailbox database
+    init_archive_db()  # Initialize mailbox archive database
     
     calendar_models.init_db()  # Initialize calendar database
     init_player_db()  # Initialize player database
@@ -88,6 +90,10 @@ def main():
     # Initialize queue system
     queue_manager = init_queue()
     
+    # Archive old mail in the background
+    retention_job = MailboxRetentionJob()
+    retention_job.start()
+    
     # Initialize agents
     hr_agent = init_hr_agent()
     if not hr_agent:
@@ -114,6 +120,7 @@ def main():
             # Clean up agents
             cleanup_hr_agent(hr_agent)
             cleanup_customer_agent(customer_agent)
+            retention_job.stop()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,112 @@
+import os
+import random
+import tempfile
+from datetime import datetime
+import pytest
+from agent.customer.customer_agent import CustomerAgent
+from agent.customer.population import CustomerPopulation
+from hardware import models as hardware_models
+from hardware import utils as hardware_utils
+from shared.database import DatabaseConnection
+from tickets import models as ticket_models
+
+NOW = datetime(2024, 1, 1, 9, 0).timestamp()
+
+@pytest.fixture
+def tickets_db():
+    """Point the tickets and hardware databases at temporary files and seed the catalog."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'tickets': os.path.join(temp_dir, 'tickets.db'),
+            'hardware': os.path.join(temp_dir, 'hardware.db')
+        })
+        ticket_models.init_db()
+        hardware_models.init_db()
+        hardware_utils.migrate_hardware_catalog()
+        yield temp_dir
+        DatabaseConnection.clear_test_db_paths()
+
+def test_population_pops_due_customers_in_order(tickets_db):
+    """Test that seeding is idempotent and due customers come off the heap earliest first."""
+    population = CustomerPopulation()
+    assert population.ensure(2000, NOW, random.Random(1)) == 2000
+    assert population.ensure(2000, NOW, random.Random(1)) == 0
+    assert len(population) == 2000
+    
+    later = NOW + 24 * 3600
+    due = population.pop_due(later, limit=50)
+    assert len(due) == 50 and len(population) == 1950
+    with DatabaseConnection.get_cursor('tickets') as cursor:
+        cursor.execute(f"SELECT next_ticket_at FROM customers WHERE id IN ({','.join('?' * len(due))})", due)
+        times = sorted(row[0] for row in cursor.fetchall())
+        cursor.execute("SELECT MIN(next_ticket_at) FROM customers WHERE id NOT IN (%s)" % ','.join('?' * len(due)), due)
+        assert times[-1] <= cursor.fetchone()[0]
+    assert [customer[0] for customer in population.get_customers(due[:3])] == due[:3]
+
+def test_reschedule_pushes_next_ticket_times(tickets_db):
+    """Test that rescheduled customers go back on the heap one jittered interval later."""
+    population = CustomerPopulation()
+    population.ensure(100, NOW, random.Random(2))
+    due = population.pop_due(NOW + 72 * 3600 * 1.5, limit=100)
+    assert len(due) == 100 and len(population) == 0
+    
+    population.reschedule(due, NOW)
+    assert len(population) == 100
+    with DatabaseConnection.get_cursor('tickets') as cursor:
+        cursor.execute("SELECT MIN(next_ticket_at - last_ticket_at), MAX(next_ticket_at - last_ticket_at), "
+                       "MIN(ticket_frequency_hours), MAX(ticket_frequency_hours) FROM customers")
+        shortest, longest, min_hours, max_hours = cursor.fetchone()
+    assert shortest >= min_hours * 3600 * 0.5 * 0.75
+    assert longest <= max_hours * 3600 * 1.5 * 1.25
+    assert population.pop_due(NOW, limit=100) == []
+
+def test_agent_creates_tickets_as_one_batch(tickets_db):
+    """Test that the agent files a ticket per due customer up to its limits."""
+    agent = CustomerAgent()
+    agent.population_size = 500
+    agent.comment_generator = lambda item: "It broke."
+    
+    agent.max_new_tickets = 3
+    agent.check_and_create_tickets(datetime(2024, 1, 1))  # Seeds first tickets over the coming days
+    assert len(agent.population) == 500
+    start = datetime(2024, 1, 2, 9, 0)
+    assert agent.check_and_create_tickets(start) == 3
+    assert agent.check_and_create_tickets(start) == 0
+    
+    agent.max_new_tickets = None
+    agent.max_tickets_per_check = 40
+    assert agent.check_and_create_tickets(datetime(2024, 1, 9)) == 40
+    assert ticket_models.get_ticket_count() == 43
+    assert ticket_models.get_tickets_by_status() == {'New': 43}
+
+def test_seeded_reschedule_is_reproducible(tickets_db):
+    """Test that the same seed gives the same next ticket times."""
+    def run(seed):
+        population = CustomerPopulation()
+        population.ensure(0, NOW)
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute("DELETE FROM customers")
+        population.ensure(200, NOW, random.Random(seed))
+        due = population.pop_due(NOW + 24 * 3600, limit=200)
+        population.reschedule(due, NOW + 24 * 3600, random.Random(seed))
+        with DatabaseConnection.get_cursor('tickets') as cursor:
+            cursor.execute("SELECT id, next_ticket_at FROM customers ORDER BY id")
+            return [tuple(row) for row in cursor.fetchall()]
+    
+    assert run(3) == run(3)
+    assert run(3) != run(4)
+
+def test_agent_caps_reporter_comment_generation(tickets_db):
+    """Test that a large batch calls the comment generator at most max_comments_per_check times."""
+    agent = CustomerAgent()
+    agent.population_size = 500
+    agent.max_new_tickets = None
+    agent.max_comments_per_check = 3
+    calls = []
+    agent.comment_generator = lambda item: calls.append(item) or f"{item['name']} broke."
+    
+    agent.check_and_create_tickets(datetime(2024, 1, 1))
+    created = agent.check_and_create_tickets(datetime(2024, 1, 9))
+    assert created > 3
+    assert len(calls) <= 3
+    assert ticket_models.get_ticket_count() == created
@@ -0,0 +1,53 @@
+import os
+import tempfile
+from datetime import date
+import pytest
+from agent.hr.hr_agent import HRAgent
+from human_resources.database import init_db as init_hr_db
+from human_resources.repository import EmployeeRepository, PerformanceRatingRepository, RoleRepository, invalidate_cache
+from mailbox import models as mailbox_models
+from shared.database import DatabaseConnection
+from simulation.bots import ScriptedModel
+
+@pytest.fixture
+def hr_setup():
+    """Point the HR and mailbox databases at temporary files with an HR manager and one employee."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'hr': os.path.join(temp_dir, 'hr.db'),
+            'mailbox': os.path.join(temp_dir, 'mailbox.db'),
+        })
+        init_hr_db()
+        mailbox_models.init_db()
+        hr_role = RoleRepository.create("HR Manager")
+        manager = EmployeeRepository.create("Hana", "Reyes", "hana@example.com", date(2024, 1, 1), hr_role.id)
+        employee = EmployeeRepository.create("Eli", "Stone", "eli@example.com", date(2024, 1, 1))
+        yield manager, employee
+        invalidate_cache()
+        DatabaseConnection.clear_test_db_paths()
+
+def _start_agent():
+    agent = HRAgent()
+    agent.llm_client = ScriptedModel("How are things going?")
+    agent.initialize()
+    return agent
+
+def _check_ins(employee):
+    return [message for message in mailbox_models.get_messages(employee.id) if message[2] == "HR Check-in"]
+
+def test_outreach_sent_once_per_review_across_restarts(hr_setup):
+    """Test that a low review triggers one check-in, even after the agent restarts."""
+    _, employee = hr_setup
+    PerformanceRatingRepository.create(employee.id, 2, date(2024, 3, 1))
+    
+    _start_agent()._handle_employee_concerns()
+    assert len(_check_ins(employee)) == 1
+    
+    restarted = _start_agent()
+    restarted._handle_employee_concerns()
+    assert len(_check_ins(employee)) == 1
+    assert restarted.llm_client.prompts == 0
+    
+    PerformanceRatingRepository.create(employee.id, 1, date(2024, 4, 1))
+    restarted._handle_employee_concerns()
+    assert len(_check_ins(employee)) == 2
@@ -0,0 +1,32 @@
+import os
+import tempfile
+from datetime import date
+import pytest
+from game_calendar import models
+from human_resources.database import init_db as init_hr_db
+from human_resources.repository import EmployeeRepository
+from player.repository import init_db as init_player_db
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def calendar_db():
+    """Point the calendar, HR and player databases at temporary files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'calendar': os.path.join(temp_dir, 'calendar.db'),
+            'hr': os.path.join(temp_dir, 'hr.db'),
+            'player': os.path.join(temp_dir, 'player.db')
+        })
+        init_hr_db()
+        init_player_db()
+        models.init_db()
+        yield temp_dir
+        DatabaseConnection.clear_test_db_paths()
+
+@pytest.fixture
+def employees(calendar_db):
+    """Create three active employees."""
+    return [
+        EmployeeRepository.create(first, last, f"{first.lower()}@example.com", date(2024, 1, 1))
+        for first, last in [("Ada", "Alpha"), ("Ben", "Beta"), ("Cy", "Gamma")]
+    ]
@@ -0,0 +1,201 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from game_calendar import models
+from shared.database import DatabaseConnection
+
+def test_get_meetings_groups_attendees(employees):
+    """Test that a day's meetings come back with their attendee names."""
+    ada, ben, cy = employees
+    assert models.add_meeting("Standup", "", "09:00", "09:15", [ada.id, ben.id], game_day=2)
+    assert models.add_meeting("Review", "Sprint", "14:00", "15:00", [cy.id], game_day=2)
+    assert models.add_meeting("Planning", "", "10:00", "11:00", [ada.id], game_day=3)
+    
+    meetings = models.get_meetings(2)
+    assert [(m[1], m[3], m[5]) for m in meetings] == [
+        ("Standup", "09:00", [(ada.id, "Ada Alpha"), (ben.id, "Ben Beta")]),
+        ("Review", "14:00", [(cy.id, "Cy Gamma")]),
+    ]
+    
+    meeting = models.get_meeting(meetings[0][0])
+    assert meeting[5:] == (2, "Ada Alpha, Ben Beta")
+
+def test_count_meetings_tracks_schedule(employees):
+    """Test the per-day meeting counter through adds and deletes."""
+    ada = employees[0]
+    assert models.count_meetings(2) == 0
+    models.add_meeting("One", "", "09:00", "10:00", [ada.id], game_day=2)
+    models.add_meeting("Two", "", "11:00", "12:00", [ada.id], game_day=2)
+    assert models.count_meetings(2) == 2
+    
+    models.delete_meeting(models.get_meetings(2)[0][0])
+    assert models.count_meetings(2) == 1
+    
+    models.reset_game_days()
+    assert models.count_meetings(2) == 0
+
+def test_count_meetings_backfilled_on_init(employees):
+    """Test that init_db counts meetings scheduled before the counter table existed."""
+    ada = employees[0]
+    models.add_meeting("One", "", "09:00", "10:00", [ada.id], game_day=4)
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("DROP TABLE meeting_counts")
+    
+    models.init_db()
+    assert models.count_meetings(4) == 1
+
+def test_add_and_update_reject_overlapping_attendees(employees):
+    """Test that meetings cannot double-book an attendee."""
+    ada, ben, cy = employees
+    assert models.add_meeting("Standup", "", "09:00", "10:00", [ada.id, ben.id], game_day=2)
+    assert not models.add_meeting("Clash", "", "09:30", "10:30", [cy.id, ben.id], game_day=2)
+    assert models.add_meeting("Back to back", "", "10:00", "11:00", [ben.id], game_day=2)
+    assert models.add_meeting("Other day", "", "09:30", "10:30", [ben.id], game_day=3)
+    assert not models.add_meeting("Backwards", "", "12:00", "11:00", [cy.id], game_day=2)
+    
+    standup_id = models.get_meetings(2)[0][0]
+    assert models.find_conflicts([cy.id, ben.id], 2, "09:30", "10:30") == [
+        (ben.id, standup_id, "Standup"),
+        (ben.id, standup_id + 1, "Back to back"),
+    ]
+    # A meeting may be moved within its own slot, but not onto another
+    assert models.update_meeting(standup_id, "Standup", "", "09:15", "09:45", [ada.id, ben.id])
+    assert not models.update_meeting(standup_id, "Standup", "", "09:30", "10:30", [ada.id, ben.id])
+    assert models.find_conflicts([ada.id], 2, "09:00", "09:15") == []
+
+def test_find_free_slots_across_days(employees):
+    """Test that free windows are shared by every attendee over a day range."""
+    ada, ben, cy = employees
+    models.add_meeting("Standup", "", "09:00", "09:30", [ada.id], game_day=2)
+    models.add_meeting("Review", "", "10:00", "12:00", [ben.id], game_day=2)
+    models.add_meeting("Offsite", "", "09:00", "17:00", [ada.id, ben.id], game_day=3)
+    models.add_meeting("Lunch", "", "12:00", "13:00", [cy.id], game_day=4)
+    
+    assert models.find_free_slots([ada.id, ben.id], 2, 60, last_day=4) == [
+        (2, "12:00", "17:00"),
+        (4, "09:00", "17:00"),
+    ]
+    assert models.find_free_slots([ada.id, ben.id], 2, 30) == [
+        (2, "09:30", "10:00"),
+        (2, "12:00", "17:00"),
+    ]
+    models.delete_meeting(models.get_meetings(3)[0][0])
+    assert models.find_free_slots([ada.id], 3, 480) == [(3, "09:00", "17:00")]
+
+def test_busy_index_backfilled_on_init(employees):
+    """Test that init_db indexes meetings scheduled before the busy table existed."""
+    ada = employees[0]
+    models.add_meeting("One", "", "09:00", "10:00", [ada.id], game_day=4)
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("DROP TABLE attendee_busy")
+    models.init_db()
+    assert not models.add_meeting("Two", "", "09:30", "10:30", [ada.id], game_day=4)
+
+def test_advance_game_day_publishes_current_day(calendar_db):
+    """Test that advancing creates the next day once and updates the cached day."""
+    assert models.get_current_game_day() == 1
+    assert models.advance_game_day() == 2
+    assert models.get_current_game_day() == 2
+    
+    # Days already created by scheduling ahead are reused
+    models.add_meeting("Later", "", "09:00", "10:00", [], game_day=5)
+    assert models.advance_game_day() == 3
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("SELECT day_number FROM game_days ORDER BY day_number")
+        assert [row[0] for row in cursor.fetchall()] == [1, 2, 3, 4, 5]
+    
+    # The cached value matches what is stored
+    models.invalidate_current_day_cache()
+    assert models.get_current_game_day() == 3
+    models.reset_game_days()
+    assert models.get_current_game_day() == 1
+
+def test_concurrent_advances_each_move_one_day(calendar_db):
+    """Test that advances racing on separate connections never skip or repeat a day."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        new_days = list(pool.map(lambda _: models.advance_game_day(), range(20)))
+    assert sorted(new_days) == list(range(2, 22))
+    assert models.get_current_game_day() == 21
+
+def test_current_game_day_served_from_cache(calendar_db):
+    """Test that repeated reads of the current day do not query the database."""
+    models.get_current_game_day()
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("DROP TABLE current_game_day")
+    assert models.get_current_game_day() == 1
+
+def test_recurring_meeting_expanded_per_day(employees):
+    """Test that a recurring meeting appears on its days without schedule rows."""
+    ada, ben, cy = employees
+    recurrence_id = models.add_recurring_meeting("Standup", "", "09:00", "09:15", [ada.id, ben.id], first_day=2)
+    weekly_id = models.add_recurring_meeting("1:1", "", "11:00", "11:30", [cy.id], first_day=2, interval_days=7, last_day=16)
+    models.add_meeting("Review", "", "10:00", "11:00", [cy.id], game_day=9)
+    
+    standup = models.occurrence_id(recurrence_id)
+    assert [(m[0], m[1], m[5]) for m in models.get_meetings(30)] == [
+        (standup, "Standup", [(ada.id, "Ada Alpha"), (ben.id, "Ben Beta")]),
+    ]
+    assert [m[1] for m in models.get_meetings(9)] == ["Standup", "Review", "1:1"]
+    assert models.count_meetings(9) == 3
+    assert models.count_meetings(23) == 1
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("SELECT day_number, meetings FROM recurring_counts ORDER BY day_number")
+        assert [tuple(row) for row in cursor.fetchall()] == [(9, 2), (23, 1)]
+    assert models.parse_meeting_id(" r%d " % weekly_id) == models.occurrence_id(weekly_id)
+    with DatabaseConnection.get_cursor('calendar') as cursor:
+        cursor.execute("SELECT COUNT(*) FROM schedule")
+        assert cursor.fetchone()[0] == 1
+
+def test_recurring_meeting_exceptions(employees):
+    """Test cancelling, moving and ending occurrences of a recurring meeting."""
+    ada, ben, _ = employees
+    recurrence_id = models.add_recurring_meeting("Standup", "", "09:00", "09:15", [ada.id], first_day=2)
+    assert models.count_meetings(3) == 1
+    
+    assert models.cancel_occurrence(recurrence_id, 3)
+    assert models.get_meetings(3) == []
+    assert models.count_meetings(3) == 0
+    
+    assert models.reschedule_occurrence(recurrence_id, 4, "10:00", "10:15")
+    assert [m[3] for m in models.get_meetings(4)] == ["10:00"]
+    assert models.get_meetings(5)[0][3] == "09:00"
+    
+    assert models.count_meetings(6) == 1
+    assert models.end_recurring_meeting(recurrence_id, 5)
+    assert models.get_meetings(6) == []
+    assert models.count_meetings(6) == 0
+    assert not models.cancel_occurrence(recurrence_id, 6)
+    assert models.end_recurring_meeting(recurrence_id, 1)
+    assert models.get_meetings(2) == []
+
+def test_recurring_meetings_take_part_in_conflicts(employees):
+    """Test that occurrences block overlapping meetings and free slots."""
+    ada, ben, _ = employees
+    recurrence_id = models.add_recurring_meeting("Standup", "", "09:00", "10:00", [ada.id], first_day=2, interval_days=2)
+    
+    assert not models.add_meeting("Clash", "", "09:30", "10:30", [ada.id, ben.id], game_day=4)
+    assert models.add_meeting("Fine", "", "09:30", "10:30", [ada.id, ben.id], game_day=3)
+    assert models.find_conflicts([ada.id], 6, "09:00", "09:30") == [(ada.id, models.occurrence_id(recurrence_id), "Standup")]
+    assert models.add_recurring_meeting("Sync", "", "10:00", "11:00", [ben.id], first_day=2) is None
+    
+    assert models.find_free_slots([ada.id], 2, 60, last_day=3) == [
+        (2, "10:00", "17:00"),
+        (3, "10:30", "17:00"),
+    ]
+    assert models.reschedule_occurrence(recurrence_id, 2, "08:00", "08:30")
+    assert models.find_free_slots([ada.id], 2, 60) == [(2, "09:00", "17:00")]
+
+def test_meeting_times_normalized_to_hh_mm(employees):
+    """Test that unpadded times are stored zero-padded and invalid ones rejected."""
+    ada, ben, _ = employees
+    assert models.normalize_time(" 9:05") == "09:05"
+    for invalid in ("24:00", "9:5", "9", "ab:cd", "12:60"):
+        with pytest.raises(ValueError):
+            models.normalize_time(invalid)
+    
+    assert models.add_meeting("Early", "", "9:00", "9:30", [ada.id], game_day=2)
+    assert not models.add_meeting("Bad", "", "9:00", "25:00", [ada.id], game_day=2)
+    assert [m[3:5] for m in models.get_meetings(2)] == [("09:00", "09:30")]
+    assert [c[0] for c in models.find_conflicts([ada.id], 2, "9:15", "9:45")] == [ada.id]
+    assert models.find_free_slots([ada.id], 2, 60, day_start="9:00")[0] == (2, "09:30", "17:00")
+    assert models.add_recurring_meeting("Sync", "", "8:00", "8:30", [ben.id], first_day=2) is not None
+    assert models.get_meetings(3)[0][3] == "08:00"
@@ -0,0 +1,16 @@
+import os
+import tempfile
+import pytest
+from hardware import models
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def temp_db_dir():
+    """Point the hardware database at a temporary file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'hardware': os.path.join(temp_dir, 'hardware_catalog.db')
+        })
+        models.init_db()
+        yield temp_dir
+        DatabaseConnection.clear_test_db_paths()
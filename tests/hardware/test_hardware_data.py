@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import pytest
+from hardware import data, models, utils
+
+def write_category(directory, category, items, version=data.CATALOG_FORMAT_VERSION):
+    """Write a single JSON Lines category file."""
+    with open(os.path.join(directory, f"{category}.jsonl"), 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"format_version": version, "category": category}) + "\n")
+        for item in items:
+            f.write(json.dumps(item) + "\n")
+
+def make_item(name):
+    return {
+        "name": name,
+        "manufacturer": "Test Manufacturer",
+        "model": f"{name}-1",
+        "repair_difficulty": 2,
+        "specs": {"power": "5V"},
+        "common_failures": ["Fails sometimes"],
+        "troubleshooting_procedures": [{"name": "Reboot", "steps": ["Turn off", "Turn on"]}],
+        "special_tools": ["Screwdriver"]
+    }
+
+def test_bundled_catalog_follows_index_order():
+    """Test that the bundled catalog lists categories in index order."""
+    loader = data.CatalogLoader()
+    assert loader.categories() == [
+        'consumer-electronics',
+        'industrial-equipment',
+        'networking-devices',
+        'medical-equipment',
+        'automotive-systems'
+    ]
+    items = list(loader.iter_items('consumer-electronics'))
+    assert items[0]['name'] == 'QuantumCore™ Home Assistant'
+
+def test_loader_without_index_uses_directory_listing():
+    """Test that a directory without an index is discovered by extension."""
+    with tempfile.TemporaryDirectory() as catalog_dir:
+        write_category(catalog_dir, 'b-category', [make_item('Beta')])
+        write_category(catalog_dir, 'a-category', [make_item('Alpha')])
+        loader = data.CatalogLoader(catalog_dir)
+        assert loader.categories() == ['a-category', 'b-category']
+        assert [item['name'] for item in loader.iter_items('b-category')] == ['Beta']
+
+def test_loader_rejects_unsupported_version():
+    """Test that data files with an unknown format version are rejected."""
+    with tempfile.TemporaryDirectory() as catalog_dir:
+        write_category(catalog_dir, 'future', [make_item('Gamma')], version=99)
+        loader = data.CatalogLoader(catalog_dir)
+        with pytest.raises(data.CatalogFormatError):
+            list(loader.iter_items('future'))
+
+def test_migrate_from_custom_loader(temp_db_dir):
+    """Test migrating the catalog from a pluggable loader."""
+    catalog_dir = os.path.join(temp_db_dir, 'catalog')
+    os.makedirs(catalog_dir)
+    write_category(catalog_dir, 'gadgets', [make_item('Widget'), make_item('Gizmo')])
+    
+    utils.migrate_hardware_catalog(data.CatalogLoader(catalog_dir))
+    
+    categories = models.get_hardware_categories()
+    assert [c['name'] for c in categories] == ['gadgets']
+    items = models.get_hardware_items(categories[0]['id'])
+    assert sorted(item['name'] for item in items) == ['Gizmo', 'Widget']
+    procedures = models.get_troubleshooting_procedures(items[0]['id'])
+    assert [step['description'] for step in procedures[0]['steps']] == ['Turn off', 'Turn on']
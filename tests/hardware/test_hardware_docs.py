@@ -0,0 +1,68 @@
+import json
+import os
+import pytest
+from hardware import docs, models, utils
+
+@pytest.fixture
+def catalog_db(temp_db_dir):
+    """Populate the temporary hardware database from the bundled catalog."""
+    utils.migrate_hardware_catalog()
+    return temp_db_dir
+
+def test_get_hardware_details_matches_single_item_queries(catalog_db):
+    """Test that the batch detail API agrees with the per-item getters."""
+    items = models.get_hardware_items()
+    details = models.get_hardware_details([item['id'] for item in items])
+    for item in items:
+        assert details[item['id']]['specs'] == models.get_hardware_specs(item['id'])
+        assert details[item['id']]['failures'] == models.get_hardware_failures(item['id'])
+        assert details[item['id']]['procedures'] == models.get_troubleshooting_procedures(item['id'])
+        assert details[item['id']]['special_tools'] == models.get_special_tools(item['id'])
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_catalog_docs(catalog_db, workers):
+    """Test rendering one page per category, in-process and with a worker pool."""
+    output_dir = os.path.join(catalog_db, 'docs')
+    results = docs.generate_catalog_docs(output_dir, workers=workers)
+    
+    assert set(results.values()) == {'written'}
+    with open(os.path.join(output_dir, 'consumer-electronics.md'), encoding='utf-8') as f:
+        content = f.read()
+    assert content.startswith("# Consumer Electronics\n")
+    assert "## QuantumCore™ Home Assistant" in content
+    assert "**Repair Difficulty:** Moderate (3/5)" in content
+
+def test_generate_catalog_docs_only_rewrites_changed_categories(catalog_db):
+    """Test that unchanged categories are skipped on the next run."""
+    output_dir = os.path.join(catalog_db, 'docs')
+    docs.generate_catalog_docs(output_dir, workers=1)
+    
+    item = models.get_hardware_items()[0]
+    models.update_hardware_item(item['id'], name="Renamed Device")
+    results = docs.generate_catalog_docs(output_dir, workers=1)
+    
+    assert results.pop('consumer-electronics') == 'written'
+    assert set(results.values()) == {'unchanged'}
+
+def test_difficulty_label_covers_half_steps():
+    """Test that half-step difficulties get a label between their neighbours."""
+    assert docs.difficulty_label(3) == "Moderate"
+    assert docs.difficulty_label(4.5) == "High to Expert"
+    assert docs.difficulty_label(7) == "Unknown"
+
+def test_generate_catalog_docs_prunes_removed_categories(catalog_db):
+    """Test that pages for categories no longer in the catalog are deleted."""
+    output_dir = os.path.join(catalog_db, 'docs')
+    docs.generate_catalog_docs(output_dir, workers=1)
+    manifest = docs._load_manifest(output_dir)
+    manifest['retired-devices.md'] = 'stale'
+    with open(os.path.join(output_dir, docs.MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    retired_page = os.path.join(output_dir, 'retired-devices.md')
+    with open(retired_page, 'w', encoding='utf-8') as f:
+        f.write("# Retired Devices\n")
+    
+    results = docs.generate_catalog_docs(output_dir, workers=1)
+    assert results['retired-devices'] == 'removed'
+    assert not os.path.exists(retired_page)
+    assert 'retired-devices.md' not in docs._load_manifest(output_dir)
@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import patch
+from hardware import models, utils, views
+
+@pytest.fixture
+def catalog_db(temp_db_dir):
+    """Populate the temporary hardware database from the bundled catalog."""
+    utils.migrate_hardware_catalog()
+    return temp_db_dir
+
+def test_statistics_after_migration(catalog_db):
+    """Test that migration rebuilds the full statistics snapshot."""
+    stats = models.get_hardware_statistics()
+    assert stats['total_hardware'] == 18
+    assert stats['total_categories'] == 5
+    assert stats['total_failures'] == 88
+    assert stats['by_category']['consumer-electronics'] == {'hardware': 2, 'failures': 8}
+    assert sum(stats['difficulty_histogram'].values()) == 18
+    assert 'unrated' not in stats['difficulty_histogram']
+
+def test_statistics_follow_added_items(catalog_db):
+    """Test that adding an item updates the snapshot incrementally."""
+    category = models.get_hardware_categories()[0]
+    success, error = models.add_hardware_item(category['id'], "Spare Part", "Acme", "SP-1")
+    assert success, error
+    
+    stats = models.get_hardware_statistics()
+    assert stats['total_hardware'] == 19
+    assert stats['by_category'][category['name']]['hardware'] == 3
+    assert stats['difficulty_histogram']['unrated'] == 1
+
+def test_failed_add_leaves_statistics_untouched(catalog_db):
+    """Test that a rejected insert does not change the snapshot."""
+    success, _ = models.add_hardware_item(9999, "Ghost", "Nobody", "G-0")
+    assert not success
+    assert models.get_hardware_statistics()['total_hardware'] == 18
+
+def test_init_db_backfills_statistics(catalog_db):
+    """Test that an existing catalog without a snapshot gets one on init."""
+    with models.DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("DELETE FROM hardware_statistics")
+    models.init_db()
+    assert models.get_hardware_statistics()['total_hardware'] == 18
+
+@patch('hardware.views.clear_screen')
+def test_view_hardware_statistics(mock_clear, catalog_db):
+    """Test the admin statistics screen renders the snapshot."""
+    with patch('builtins.input', return_value=''), \
+         patch('hardware.views.print_table') as mock_table:
+        views.view_hardware_statistics()
+    titles = [call.args[0] for call in mock_table.call_args_list]
+    assert titles == ["By Category", "Repair Difficulty"]
+
+@patch('hardware.views.clear_screen')
+def test_view_hardware_statistics_half_step_difficulty(mock_clear, catalog_db):
+    """Test that half-step difficulties get their own bucket and bars are scaled."""
+    assert '4.5' in models.get_hardware_statistics()['difficulty_histogram']
+
+    with patch('builtins.input', return_value=''), \
+         patch('hardware.views.print_table') as mock_table:
+        views.view_hardware_statistics()
+    rows = mock_table.call_args_list[-1].args[2]
+    labels = [row[0] for row in rows]
+    assert "4.5/5" in labels
+    assert labels == sorted(labels, key=lambda label: float(label.split('/')[0]))
+    assert max(len(row[2]) for row in rows) == views.HISTOGRAM_BAR_WIDTH
@@ -0,0 +1,56 @@
+import os
+import zipfile
+import pytest
+from hardware import models, snapshot, triage, utils
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def catalog_db(temp_db_dir):
+    """Populate the temporary hardware database from the bundled catalog."""
+    utils.migrate_hardware_catalog()
+    return temp_db_dir
+
+def _dump_catalog():
+    tables = {}
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        for table, columns in models.CATALOG_TABLES.items():
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+            tables[table] = [tuple(row) for row in cursor.fetchall()]
+    return tables
+
+def test_snapshot_round_trip(catalog_db):
+    """Test that exporting then importing restores the catalog exactly."""
+    path = os.path.join(catalog_db, 'catalog.snapshot')
+    before = _dump_catalog()
+    statistics = models.get_hardware_statistics()
+    
+    counts = snapshot.export_catalog_snapshot(path, row_group_size=7)
+    assert counts == {table: len(rows) for table, rows in before.items()}
+    
+    # Import into a fresh database
+    DatabaseConnection.set_test_db_paths({'hardware': os.path.join(catalog_db, 'restored.db')})
+    models.init_db()
+    snapshot.import_catalog_snapshot(path)
+    
+    assert _dump_catalog() == before
+    assert models.get_hardware_statistics() == statistics
+    failure_id = before['hardware_failures'][0][0]
+    assert triage.suggest_procedures_for_failure(failure_id)
+
+def test_snapshot_import_rejects_corrupt_row_group(catalog_db):
+    """Test that a checksum mismatch aborts the import and keeps the catalog."""
+    path = os.path.join(catalog_db, 'catalog.snapshot')
+    snapshot.export_catalog_snapshot(path)
+    before = _dump_catalog()
+    
+    corrupt = os.path.join(catalog_db, 'corrupt.snapshot')
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(corrupt, 'w') as target:
+        for info in source.infolist():
+            payload = source.read(info.filename)
+            if info.filename.startswith('hardware_specs/'):
+                payload = payload.replace(b'"', b"'", 1)
+            target.writestr(info, payload)
+    
+    with pytest.raises(snapshot.SnapshotError, match="checksum mismatch"):
+        snapshot.import_catalog_snapshot(corrupt)
+    assert _dump_catalog() == before
@@ -0,0 +1,53 @@
+import pytest
+from hardware import models, triage, utils
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def catalog_db(temp_db_dir):
+    """Populate the temporary hardware database from the bundled catalog."""
+    utils.migrate_hardware_catalog()
+    return temp_db_dir
+
+def test_tokenize():
+    """Test that tokenizing drops short words, stop words and plurals."""
+    assert triage.tokenize("Reset the Quantum Gates and a PSU") == ['reset', 'quantum', 'gate', 'psu']
+
+def test_migration_builds_suggestions_for_every_failure(catalog_db):
+    """Test that the index has suggestions for each known failure."""
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("""
+            SELECT COUNT(*) FROM hardware_failures
+            WHERE id NOT IN (SELECT failure_id FROM failure_procedure_suggestions)
+        """)
+        assert cursor.fetchone()[0] == 0
+
+def test_suggest_procedures_for_ticket_uses_known_failure(catalog_db):
+    """Test that a ticket quoting a catalog failure gets the matching procedure first."""
+    ticket = {
+        'description': "Customer reports an issue. Holographic storage matrix corruption\n\nIt ate my photos.",
+        'hardware': {
+            'name': 'QuantumCore™ Home Assistant',
+            'model': 'QCH-3000',
+            'manufacturer': 'FutureTech Industries'
+        }
+    }
+    suggestions = triage.suggest_procedures_for_ticket(ticket)
+    assert suggestions[0]['name'] == 'Storage Recovery'
+    assert len(suggestions) <= 3
+
+def test_suggest_procedures_for_unknown_text(catalog_db):
+    """Test free-text scoring for descriptions that match no known failure."""
+    suggestions = triage.suggest_procedures_for_ticket({
+        'description': "battery will not charge",
+        'hardware': {'name': 'Unknown', 'model': 'X', 'manufacturer': 'Y'}
+    })
+    assert suggestions
+    assert all('Battery' in suggestion['name'] for suggestion in suggestions)
+
+def test_init_db_builds_missing_index(catalog_db):
+    """Test that init_db indexes catalogs migrated before the index existed."""
+    with DatabaseConnection.get_cursor('hardware') as cursor:
+        cursor.execute("DELETE FROM failure_procedure_suggestions")
+        cursor.execute("DELETE FROM procedure_terms")
+    models.init_db()
+    assert triage.suggest_procedures_for_text("quantum reset")
@@ -0,0 +1,31 @@
+import os
+import tempfile
+from datetime import date
+import pytest
+from human_resources.database import init_db
+from human_resources.repository import EmployeeRepository, RoleRepository
+from player.repository import init_db as init_player_db
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def hr_db():
+    """Point the HR and player databases at temporary files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'hr': os.path.join(temp_dir, 'hr.db'),
+            'player': os.path.join(temp_dir, 'player.db'),
+        })
+        init_db()
+        init_player_db()
+        yield temp_dir
+        DatabaseConnection.clear_test_db_paths()
+
+@pytest.fixture
+def employees(hr_db):
+    """Create two roles and three employees."""
+    engineer = RoleRepository.create("Engineer", "Builds things")
+    manager = RoleRepository.create("Manager", "Runs things")
+    return [
+        EmployeeRepository.create(first, last, f"{first.lower()}@example.com", date(2024, 1, 1), role.id)
+        for first, last, role in [("Ann", "Able", engineer), ("Bob", "Baker", engineer), ("Cat", "Cole", manager)]
+    ]
@@ -0,0 +1,170 @@
+from datetime import date
+from human_resources import repository
+from human_resources.database import init_db
+from human_resources.repository import EmployeeRepository, PerformanceRatingRepository, RoleRepository
+from shared.database import DatabaseConnection
+
+def test_identity_map_returns_one_object_per_id(employees):
+    """Test that repeated lookups share one object and count hits and misses."""
+    ann = employees[0]
+    before = repository.get_cache_stats()['employees']
+    
+    first = EmployeeRepository.get_by_id(ann.id)
+    assert EmployeeRepository.get_by_id(ann.id) is first
+    assert EmployeeRepository.get_by_email("ann@example.com") is first
+    assert next(emp for emp in EmployeeRepository.get_all() if emp.id == ann.id) is first
+    assert [emp.id for emp in EmployeeRepository.get_all()] == [emp.id for emp in employees]
+    
+    stats = repository.get_cache_stats()['employees']
+    assert stats['misses'] - before['misses'] == 2
+    assert stats['hits'] - before['hits'] == 3
+    assert EmployeeRepository.get_by_id(9999) is None
+
+def test_identity_map_indexes_unique_fields(employees):
+    """Test that lookups by unique field use the index and follow evictions."""
+    identity_map = repository.IdentityMap('email')
+    ann = identity_map.add(EmployeeRepository.get_by_id(employees[0].id))
+    assert identity_map.get_by('email', "ann@example.com", lambda: None) is ann
+    
+    identity_map.evict(ann.id)
+    assert identity_map.get_by('email', "ann@example.com", lambda: None) is None
+    identity_map.add(ann)
+    identity_map.clear()
+    assert identity_map.get_by('email', "ann@example.com", lambda: None) is None
+    assert identity_map.stats()['hits'] == 1
+
+def test_writes_invalidate_cached_employees(employees):
+    """Test that repository writes are visible through later lookups."""
+    ann, bob, cat = employees
+    EmployeeRepository.get_all()
+    
+    assert EmployeeRepository.update_employment_status(ann.id, 'inactive')
+    assert EmployeeRepository.get_by_id(ann.id).employment_status == 'inactive'
+    assert EmployeeRepository.update_role(bob.id, cat.role_id)
+    assert EmployeeRepository.get_by_email("bob@example.com").role_id == cat.role_id
+    
+    new = EmployeeRepository.create("Dan", "Drake", "dan@example.com", ann.hire_date)
+    assert [emp.id for emp in EmployeeRepository.get_all()][-1] == new.id
+    
+    assert EmployeeRepository.deactivate_all_employees()
+    assert {emp.employment_status for emp in EmployeeRepository.get_all()} == {'inactive'}
+
+def test_roles_cached_by_id_and_title(employees):
+    """Test the role identity map and that new roles show up in get_all."""
+    engineer = RoleRepository.get_by_title("Engineer")
+    assert RoleRepository.get_by_id(engineer.id) is engineer
+    assert [role.title for role in RoleRepository.get_all()] == ["Engineer", "Manager"]
+    
+    RoleRepository.create("Intern")
+    assert [role.title for role in RoleRepository.get_all()] == ["Engineer", "Manager", "Intern"]
+    assert RoleRepository.get_by_title("Nobody") is None
+
+def test_get_by_role_id_uses_role_index(employees):
+    """Test role lookups return the shared objects through the role index."""
+    ann, bob, cat = employees
+    assert [emp.id for emp in EmployeeRepository.get_by_role_id(ann.role_id)] == [ann.id, bob.id]
+    assert EmployeeRepository.get_by_role_id(cat.role_id)[0] is EmployeeRepository.get_by_id(cat.id)
+    assert EmployeeRepository.get_by_role_id(9999) == []
+    
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN SELECT * FROM employees WHERE role_id = ? ORDER BY id', (ann.role_id,))
+        assert 'idx_employees_role' in ' '.join(row[3] for row in cursor.fetchall())
+
+def test_search_prefix_filters_and_pages(employees):
+    """Test directory search by name or email prefix, role and status, page by page."""
+    ann, bob, cat = employees
+    EmployeeRepository.create("Annie", "Zed", "zed_100%@example.com", ann.hire_date, cat.role_id, 'on_leave')
+    
+    def ids(text=None, **filters):
+        return [emp.id for emp in EmployeeRepository.search(text, **filters)[0]]
+    
+    assert ids("an") == [ann.id, ann.id + 3]
+    assert ids("BAK") == [bob.id]
+    assert ids("cat@") == [cat.id]
+    assert ids("ann ab") == [ann.id]
+    assert ids("zed_1") == [ann.id + 3]
+    assert ids("zed%") == []
+    assert ids("an", status='active') == [ann.id]
+    assert ids(role_id=cat.role_id) == [cat.id, ann.id + 3]
+    
+    seen, cursor = [], None
+    while True:
+        page, cursor = EmployeeRepository.search(limit=3, after=cursor)
+        seen.extend(emp.id for emp in page)
+        if cursor is None:
+            break
+    assert seen == [ann.id, bob.id, cat.id, ann.id + 3]
+
+def test_search_uses_directory_indexes(employees):
+    """Test that prefix searches are answered from the name and email indexes."""
+    for status in (None, 'active'):
+        query, params = EmployeeRepository._search_query("an", None, status, 0, 20)
+        with DatabaseConnection.get_cursor('hr') as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            plan = ' '.join(row[3] for row in cursor.fetchall())
+        for index in ('idx_employees_first_name', 'idx_employees_last_name', 'idx_employees_email'):
+            assert index in plan
+
+def test_rating_rollups_follow_ratings_and_role_changes(employees):
+    """Test per-employee and per-role rollups through creates, role moves and deletes."""
+    ann, bob, cat = employees
+    PerformanceRatingRepository.create(ann.id, 4, date(2024, 3, 1))
+    PerformanceRatingRepository.create(ann.id, 2, date(2024, 1, 1))
+    PerformanceRatingRepository.create(bob.id, 5, date(2024, 2, 1))
+    PerformanceRatingRepository.create(cat.id, 3, date(2024, 4, 1))
+    
+    by_employee, by_role = PerformanceRatingRepository.get_rollups()
+    assert (by_employee[ann.id].review_count, by_employee[ann.id].average) == (2, 3.0)
+    assert (by_employee[ann.id].latest_rating, by_employee[ann.id].latest_review_date) == (4, date(2024, 3, 1))
+    assert (by_role[ann.role_id].review_count, by_role[ann.role_id].rating_total) == (3, 11)
+    assert by_role[ann.role_id].latest_review_date == date(2024, 3, 1)
+    assert bob.id in by_employee and len(by_employee) == 3
+    
+    EmployeeRepository.update_role(ann.id, None)
+    _, by_role = PerformanceRatingRepository.get_rollups()
+    assert (by_role[bob.role_id].rating_total, by_role[bob.role_id].latest_review_date) == (5, date(2024, 2, 1))
+    assert by_role[None].review_count == 2
+    
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute("DELETE FROM performance_ratings WHERE employee_id = ? AND rating = 4", (ann.id,))
+        cursor.execute("DELETE FROM performance_ratings WHERE employee_id = ?", (bob.id,))
+    by_employee, by_role = PerformanceRatingRepository.get_rollups()
+    assert (by_employee[ann.id].latest_rating, by_employee[ann.id].review_count) == (2, 1)
+    assert bob.id not in by_employee and bob.role_id not in by_role
+    assert by_role[None].latest_review_date == date(2024, 1, 1)
+
+def test_rating_rollups_backfilled_on_init(employees):
+    """Test that init_db summarizes ratings given before the rollup tables existed."""
+    ann, bob, _ = employees
+    PerformanceRatingRepository.create(ann.id, 4, date(2024, 3, 1))
+    PerformanceRatingRepository.create(bob.id, 2, date(2024, 1, 1))
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute("DROP TABLE employee_rating_rollups")
+        cursor.execute("DELETE FROM role_rating_rollups")
+    init_db()
+    
+    by_employee, by_role = PerformanceRatingRepository.get_rollups()
+    assert by_employee[ann.id].latest_rating == 4
+    assert (by_role[ann.role_id].review_count, by_role[ann.role_id].average) == (2, 3.0)
+    
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM performance_ratings WHERE employee_id = ? ORDER BY review_date DESC LIMIT 1",
+            (ann.id,)
+        )
+        assert 'idx_performance_ratings_employee_date' in ' '.join(row[3] for row in cursor.fetchall())
+
+def test_outreach_recorded_on_rollups(employees):
+    """Test that outreach is stored with the rollups, including on databases created before the column."""
+    ann, _, _ = employees
+    PerformanceRatingRepository.create(ann.id, 2, date(2024, 3, 1))
+    with DatabaseConnection.get_cursor('hr') as cursor:
+        cursor.execute("ALTER TABLE employee_rating_rollups DROP COLUMN last_outreach_review_date")
+    init_db()
+    
+    by_employee, by_role = PerformanceRatingRepository.get_rollups()
+    assert by_employee[ann.id].last_outreach_review_date is None
+    assert PerformanceRatingRepository.record_outreach(ann.id, date(2024, 3, 1))
+    by_employee, _ = PerformanceRatingRepository.get_rollups()
+    assert by_employee[ann.id].last_outreach_review_date == date(2024, 3, 1)
+    assert by_role[ann.role_id].last_outreach_review_date is None
@@ -0,0 +1,74 @@
+import json
+import os
+import sqlite3
+from human_resources.repository import EmployeeRepository, RoleRepository
+from human_resources.sync import read_directory, sync_directory_file, sync_employee_directory
+from shared.database import DatabaseConnection
+
+def _record(first, last, role="Engineer", hire_date="2024-01-01", **extra):
+    return {'first_name': first, 'last_name': last, 'email': f"{first.lower()}@example.com",
+            'role_title': role, 'hire_date': hire_date, **extra}
+
+def test_sync_upserts_by_email_and_keeps_ids(employees):
+    """Only changed rows are written, new employees are added and existing ids are kept."""
+    ann, bob, cat = employees
+    report = sync_employee_directory([
+        _record("Ann", "Able"),
+        _record("Bob", "Baker", role="Manager"),
+        {**_record("Cat", "Cole", role="Manager"), 'email': "CAT@example.com"},
+        _record("Dan", "Dale", role="Designer"),
+    ])
+    
+    assert (report.inserted, report.updated, report.unchanged, report.deactivated) == (1, 1, 2, 0)
+    assert report.roles_created == 1
+    assert EmployeeRepository.get_by_id(bob.id).role_id == RoleRepository.get_by_title("Manager").id
+    assert EmployeeRepository.get_by_id(cat.id).email == "cat@example.com"
+    dan = EmployeeRepository.get_by_email("dan@example.com")
+    assert dan.role_id == RoleRepository.get_by_title("Designer").id
+    assert dan.employment_status == 'active'
+    
+    again = sync_employee_directory([_record("Ann", "Able"), _record("Bob", "Baker", role="Manager"),
+                                     _record("Cat", "Cole", role="Manager"), _record("Dan", "Dale", role="Designer")])
+    assert (again.inserted, again.updated, again.unchanged) == (0, 0, 4)
+
+def test_sync_deactivates_missing_employees_except_players(employees):
+    """Employees missing from the directory become inactive unless a player is linked to them."""
+    ann, bob, cat = employees
+    # players.employee_id references a table in hr.db, so link without foreign key checks
+    with sqlite3.connect(DatabaseConnection.get_db_path('player')) as conn:
+        conn.execute("INSERT INTO players (first_name, last_name, email, employee_id) VALUES ('Cat', 'Cole', 'player@example.com', ?)", (cat.id,))
+    
+    report = sync_employee_directory([_record("Ann", "Able")])
+    
+    assert report.deactivated == 1
+    assert EmployeeRepository.get_by_id(bob.id).employment_status == 'inactive'
+    assert EmployeeRepository.get_by_id(cat.id).employment_status == 'active'
+    assert sync_employee_directory([_record("Ann", "Able")]).deactivated == 0
+
+def test_sync_skips_invalid_records(employees):
+    """Bad records are reported and the rest of the directory is still applied."""
+    report = sync_employee_directory([
+        _record("Dan", "Dale"),
+        {**_record("Eve", "Ellis"), 'email': " "},
+        _record("Fay", "Fox", hire_date="soon"),
+    ], deactivate_missing=False)
+    
+    assert report.inserted == 1
+    assert [message.split(':')[0] for message in report.skipped] == ["Record 2", "Record 3"]
+    assert EmployeeRepository.get_by_email("fay@example.com") is None
+
+def test_sync_reads_csv_and_jsonl_files(hr_db):
+    """Directory files are read in either format with batched staging."""
+    csv_path = os.path.join(hr_db, "directory.csv")
+    with open(csv_path, "w") as f:
+        f.write("first_name,last_name,email,role_title,hire_date\n")
+        f.writelines(f"Emp{i},Test,emp{i}@example.com,Engineer,2024-01-01\n" for i in range(25))
+    jsonl_path = os.path.join(hr_db, "directory.jsonl")
+    with open(jsonl_path, "w") as f:
+        f.writelines(json.dumps(_record(f"Emp{i}", "Test", employment_status="on_leave")) + "\n" for i in range(20))
+    
+    assert len(list(read_directory(csv_path))) == 25
+    assert sync_directory_file(csv_path, batch_size=10).inserted == 25
+    report = sync_directory_file(jsonl_path, batch_size=7)
+    assert (report.updated, report.deactivated) == (20, 5)
+    assert EmployeeRepository.get_by_email("emp3@example.com").employment_status == 'on_leave'
@@ -0,0 +1,30 @@
+import os
+import tempfile
+from datetime import date
+import pytest
+from mailbox import models
+from human_resources.database import init_db as init_hr_db
+from human_resources.repository import EmployeeRepository
+from shared.database import DatabaseConnection
+
+@pytest.fixture
+def mailbox_db():
+    """Point the mailbox, mailbox archive and HR databases at temporary files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            'mailbox': os.path.join(temp_dir, 'mailbox.db'),
+            'mailbox_archive': os.path.join(temp_dir, 'mailbox_archive.db'),
+            'hr': os.path.join(temp_dir, 'hr.db')
+        })
+        init_hr_db()
+        models.init_db()
+        yield temp_dir
+        DatabaseConnection.clear_test_db_paths()
+
+@pytest.fixture
+def employees(mailbox_db):
+    """Create a recipient and two senders."""
+    return [
+        EmployeeRepository.create(first, last, f"{first.lower()}@example.com", date(2024, 1, 1))
+        for first, last in [("Rita", "Recipient"), ("Sam", "Sender"), ("Sue", "Sender")]
+    ]
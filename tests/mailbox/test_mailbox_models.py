@@ -0,0 +1,198 @@
+from datetime import datetime
+from mailbox import models
+from human_resources import repository
+from human_resources.repository import EmployeeRepository
+from shared.clock import ManualClock, set_clock
+from shared.database import DatabaseConnection
+
+def test_get_messages_resolves_sender_names(employees):
+    """Test that each message carries its sender's full name."""
+    recipient, sam, sue = employees
+    models.add_message(sam.id, recipient.id, "Hello", "From Sam")
+    models.add_message(sue.id, recipient.id, "Hi", "From Sue")
+    models.add_message(999, recipient.id, "Ghost", "From nobody")
+    
+    senders = {msg[2]: msg[1] for msg in models.get_messages(recipient.id)}
+    assert senders == {"Hello": "Sam Sender", "Hi": "Sue Sender", "Ghost": "Unknown Sender"}
+
+def test_get_names_by_ids_uses_one_query_per_batch(employees, monkeypatch):
+    """Test that names are loaded in batches and then served from the cache."""
+    ids = [employee.id for employee in employees]
+    monkeypatch.setattr(repository, 'NAME_LOOKUP_BATCH_SIZE', 2)
+    queries = []
+    real_get_cursor = DatabaseConnection.get_cursor
+    
+    def counting_get_cursor(db_name, *args, **kwargs):
+        queries.append(db_name)
+        return real_get_cursor(db_name, *args, **kwargs)
+    monkeypatch.setattr(DatabaseConnection, 'get_cursor', counting_get_cursor)
+    
+    repository.invalidate_name_cache()
+    assert EmployeeRepository.get_names_by_ids(ids) == {
+        ids[0]: "Rita Recipient", ids[1]: "Sam Sender", ids[2]: "Sue Sender"
+    }
+    assert queries == ['hr']
+    
+    EmployeeRepository.get_names_by_ids(ids)
+    assert queries == ['hr']
+
+def test_name_cache_invalidated_on_create(employees):
+    """Test that a sender created after a lookup still resolves."""
+    recipient = employees[0]
+    assert EmployeeRepository.get_names_by_ids([recipient.id, 1000]) == {recipient.id: "Rita Recipient"}
+    
+    newcomer = EmployeeRepository.create("Nia", "New", "nia@example.com", recipient.hire_date)
+    assert EmployeeRepository.get_names_by_ids([newcomer.id]) == {newcomer.id: "Nia New"}
+
+def _add_messages(sender_id, recipient_id, count):
+    for i in range(count):
+        models.add_message(sender_id, recipient_id, f"Subject {i}", f"Body {i}")
+
+def test_get_message_page_orders_unread_first_and_pages_by_keyset(employees):
+    """Test that pages cover every message once, unread before read, newest first."""
+    recipient, sam, _ = employees
+    _add_messages(sam.id, recipient.id, 7)
+    models.mark_as_read(1)
+    models.mark_as_read(4)
+    
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = models.get_message_page(recipient.id, page_size=3, cursor=cursor)
+        assert len(page) <= 3
+        seen.extend(page)
+        if cursor is None:
+            break
+    
+    assert [msg[0] for msg in seen] == [7, 6, 5, 3, 2, 4, 1]
+    assert all(msg[3] is not None for msg in seen)
+
+def test_get_message_page_unread_headers_only(employees):
+    """Test the unread-only filter and the header-only projection."""
+    recipient, sam, _ = employees
+    _add_messages(sam.id, recipient.id, 3)
+    models.mark_as_read(2)
+    
+    page, cursor = models.get_message_page(recipient.id, unread_only=True, headers_only=True)
+    assert cursor is None
+    assert [(msg[0], msg[1], msg[3]) for msg in page] == [(3, "Sam Sender", None), (1, "Sam Sender", None)]
+    
+    assert models.get_message(3, recipient.id)[3] == "Body 2"
+    assert models.get_message(3, sam.id) is None
+
+def test_sender_ids_skip_name_lookup(employees, monkeypatch):
+    """Test that callers can ask for sender ids instead of resolved names."""
+    recipient, sam, sue = employees
+    models.add_message(sam.id, recipient.id, "One", "Body")
+    models.add_message(sue.id, recipient.id, "Two", "Body")
+    monkeypatch.setattr(models.EmployeeRepository, 'get_names_by_ids', None)
+    
+    assert [msg[1] for msg in models.get_messages(recipient.id, sender_ids=True)] == [sue.id, sam.id]
+    page, _ = models.get_message_page(recipient.id, unread_only=True, sender_ids=True)
+    assert [msg[1] for msg in page] == [sue.id, sam.id]
+
+def test_search_messages(employees):
+    """Test full-text search over subject and content, scoped to the recipient."""
+    recipient, sam, sue = employees
+    models.add_message(sam.id, recipient.id, "Payroll question", "When is the next pay date?")
+    models.add_message(sue.id, recipient.id, "Lunch", "Pizza on Friday")
+    models.add_message(sam.id, sue.id, "Payroll", "Not for Rita")
+    
+    assert [msg[2] for msg in models.search_messages(recipient.id, "payroll")] == ["Payroll question"]
+    assert [msg[2] for msg in models.search_messages(recipient.id, "friday")] == ["Lunch"]
+    assert [msg[0] for msg in models.search_messages(recipient.id, 'pay "date')] == [1]
+    
+    models.delete_message(1)
+    assert models.search_messages(recipient.id, "payroll") == []
+
+def test_replies_are_threaded(employees):
+    """Test that replies link to their parent and the whole thread loads together."""
+    recipient, sam, sue = employees
+    root_id = models.add_message(sam.id, recipient.id, "Laptop", "Mine is broken")
+    models.add_message(sue.id, recipient.id, "Unrelated", "Hello")
+    reply_id = models.reply_to_message(root_id, recipient.id, "Which one?")
+    second_id = models.reply_to_message(reply_id, sam.id, "The grey one")
+    
+    assert models.reply_to_message(999, sam.id, "Nobody home") is None
+    thread = models.get_thread(second_id)
+    assert [msg[0] for msg in thread] == [root_id, reply_id, second_id]
+    assert [msg[2] for msg in thread] == ["Laptop", "Re: Laptop", "Re: Laptop"]
+    assert [msg[0] for msg in models.get_thread(root_id, participant_id=sue.id)] == []
+
+def test_add_messages_bulk(employees):
+    """Test adding many messages in one call."""
+    recipient, sam, sue = employees
+    added = models.add_messages_bulk([
+        (sam.id, recipient.id, "One", "First"),
+        (sue.id, recipient.id, "Two", "Second"),
+    ])
+    
+    assert added == 2
+    assert sorted(msg[3] for msg in models.get_messages(recipient.id)) == ["First", "Second"]
+    assert models.get_unread_count(recipient.id) == 2
+
+def test_broadcast_message_shares_one_body(employees):
+    """Test that a broadcast stores its body once and every copy reads it."""
+    recipient, sam, sue = employees
+    sent = models.broadcast_message(sam.id, [recipient.id, sue.id, sue.id], "Town hall", "Friday at noon")
+    
+    assert sent == 2
+    for employee in (recipient, sue):
+        (message,) = models.get_messages(employee.id)
+        assert message[1:4] == ("Sam Sender", "Town hall", "Friday at noon")
+        assert models.get_message(message[0])[3] == "Friday at noon"
+        assert [msg[0] for msg in models.search_messages(employee.id, "noon")] == [message[0]]
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("SELECT COUNT(*) FROM message_bodies")
+        assert cursor.fetchone()[0] == 1
+    
+    # The shared body goes away with its last copy
+    for employee in (recipient, sue):
+        models.delete_message(models.get_messages(employee.id)[0][0])
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("SELECT COUNT(*) FROM message_bodies")
+        assert cursor.fetchone()[0] == 0
+
+def test_unread_counts_follow_writes(employees):
+    """Test that the unread counter tracks inserts, reads and deletes."""
+    recipient, sam, sue = employees
+    _add_messages(sam.id, recipient.id, 4)
+    models.broadcast_message(sue.id, [recipient.id, sam.id], "All hands", "Agenda")
+    assert models.get_unread_count(recipient.id) == 5
+    assert models.get_unread_count(sam.id) == 1
+    assert models.get_unread_count(sue.id) == 0
+    
+    models.mark_as_read(1)
+    models.mark_as_read(1)
+    assert models.get_unread_count(recipient.id) == 4
+    
+    assert models.mark_many_as_read([1, 2, 3], recipient_id=recipient.id) == 2
+    models.delete_message(4)
+    assert models.get_unread_count(recipient.id) == 1
+    
+    models.delete_message(1)
+    assert models.get_unread_count(recipient.id) == 1
+    assert models.mark_all_as_read(recipient.id) == 1
+    assert models.get_unread_count(recipient.id) == 0
+    assert models.get_unread_count(sam.id) == 1
+
+def test_unread_counts_backfilled_on_init(employees):
+    """Test that init_db counts mail written before the counter table existed."""
+    recipient, sam, _ = employees
+    _add_messages(sam.id, recipient.id, 3)
+    models.mark_as_read(2)
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("DROP TABLE unread_counts")
+    
+    models.init_db()
+    assert models.get_unread_count(recipient.id) == 2
+
+def test_messages_timestamped_with_installed_clock(employees):
+    """Test that new messages take their timestamp from the game clock."""
+    recipient, sender, _ = employees
+    previous = set_clock(ManualClock(datetime(2024, 1, 1, 9, 0)))
+    try:
+        message_id = models.add_message(sender.id, recipient.id, "Hello", "Hi")
+    finally:
+        set_clock(previous)
+    assert models.get_message(message_id)[4].startswith("2024-01-01 09:00")
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from mailbox import models, retention
+from mailbox.retention import RetentionPolicy, MailboxRetentionJob
+from shared.database import DatabaseConnection
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+def _backdate(message_id, days):
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute(
+            "UPDATE messages SET timestamp = ? WHERE id = ?",
+            ((NOW - timedelta(days=days)).isoformat(sep=' '), message_id)
+        )
+
+def test_age_policy_archives_old_read_messages(employees):
+    """Test that old read mail moves to the archive and everything else stays."""
+    recipient, sam, sue = employees
+    old_read = models.add_message(sam.id, recipient.id, "Old", "Archive me")
+    old_unread = models.add_message(sam.id, recipient.id, "Old unread", "Keep me")
+    recent = models.add_message(sam.id, recipient.id, "Recent", "Keep me too")
+    models.broadcast_message(sue.id, [recipient.id], "Old news", "Shared body")
+    for message_id, days in [(old_read, 120), (old_unread, 120), (recent, 5), (4, 100)]:
+        _backdate(message_id, days)
+    models.mark_many_as_read([old_read, 4])
+    
+    report = retention.apply_retention(RetentionPolicy(max_age_days=90, batch_size=1), now=NOW)
+    
+    assert (report.archived, report.deleted) == (2, 2)
+    assert sorted(msg[0] for msg in models.get_messages(recipient.id)) == [old_unread, recent]
+    assert models.search_messages(recipient.id, "archive") == []
+    archived = retention.get_archived_messages(recipient.id)
+    assert [(msg[0], msg[3]) for msg in archived] == [(4, "Shared body"), (old_read, "Archive me")]
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("SELECT COUNT(*) FROM message_bodies")
+        assert cursor.fetchone()[0] == 0
+
+def test_size_policy_keeps_newest_per_recipient(employees):
+    """Test trimming each inbox to its newest messages without archiving."""
+    recipient, sam, _ = employees
+    for days in (4, 3, 2, 1):
+        _backdate(models.add_message(sam.id, recipient.id, f"{days} days ago", "Body"), days)
+    models.add_message(recipient.id, sam.id, "Other inbox", "Body")
+    
+    policy = RetentionPolicy(max_age_days=None, max_messages_per_recipient=2, keep_unread=False, archive=False,
+                             batch_size=1)
+    report = retention.apply_retention(policy, now=NOW)
+    
+    assert (report.archived, report.deleted) == (0, 2)
+    assert [msg[2] for msg in models.get_messages(recipient.id)] == ["1 days ago", "2 days ago"]
+    assert len(models.get_messages(sam.id)) == 1
+    assert models.get_unread_count(recipient.id) == 2
+
+def test_retention_job_runs_once(employees):
+    """Test the job's synchronous entry point and that compaction leaves incremental vacuum on."""
+    recipient, sam, _ = employees
+    _backdate(models.add_message(sam.id, recipient.id, "Old", "Body" * 1000), 365)
+    models.mark_all_as_read(recipient.id)
+    
+    job = MailboxRetentionJob(RetentionPolicy(max_age_days=30))
+    report = job.run_once()
+    
+    assert report.deleted == 1
+    assert job.last_report is report
+    with DatabaseConnection.get_cursor('mailbox') as cursor:
+        cursor.execute("PRAGMA auto_vacuum")
+        assert cursor.fetchone()[0] == 2
+
+def test_delete_message_reports_missing(employees):
+    """Test that delete_message tells a deleted message from a missing one."""
+    recipient, sam, _ = employees
+    message_id = models.add_message(sam.id, recipient.id, "Bye", "Body")
+    assert models.delete_message(message_id) is True
+    assert models.delete_message(message_id) is False
@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from shared.clock import Clock, ManualClock, SystemClock, VirtualClock, get_clock, set_clock
+from shared.database import DatabaseConnection
+
+START = datetime(2024, 1, 1, 9, 0)
+
+@pytest.fixture
+def manual_clock():
+    """Install a manual clock for the test and restore the previous clock."""
+    clock = ManualClock(START)
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+def test_manual_clock_moves_only_when_told(manual_clock):
+    """Test that waits advance a manual clock instantly and a set event stops it."""
+    assert get_clock() is manual_clock
+    assert manual_clock.now() == START
+    manual_clock.sleep(3600)
+    assert manual_clock.now() == START + timedelta(hours=1)
+    assert manual_clock.advance(minutes=30) == START + timedelta(hours=1, minutes=30)
+    
+    event = threading.Event()
+    assert manual_clock.wait(event, 60) is False
+    event.set()
+    assert manual_clock.wait(event, 60) is True
+    assert manual_clock.now() == START + timedelta(hours=1, minutes=31)
+
+def test_virtual_clock_runs_faster_than_real_time():
+    """Test that an accelerated clock covers an hour of clock time in a fraction of a second."""
+    clock = VirtualClock(speed=36_000, start=START)
+    started = time.monotonic()
+    clock.sleep(3600)
+    assert time.monotonic() - started < 1
+    assert clock.now() >= START + timedelta(hours=1)
+    with pytest.raises(ValueError):
+        VirtualClock(speed=0)
+
+def test_set_clock_none_restores_system_clock(manual_clock):
+    """Test that set_clock returns the previous clock and None means real time."""
+    assert set_clock(None) is manual_clock
+    assert isinstance(get_clock(), SystemClock)
+    set_clock(manual_clock)
+
+def test_clock_is_abstract():
+    """Test that a clock must implement now and wait."""
+    with pytest.raises(TypeError):
+        Clock()
+
+def test_queue_timestamps_are_utc(manual_clock, tmp_path):
+    """Test that queue timestamps from the clock compare with CURRENT_TIMESTAMP defaults."""
+    from game_queue.simple_queue import GameEventQueue
+    DatabaseConnection.set_test_db_paths({'game_state': os.path.join(tmp_path, 'game_state.db')})
+    try:
+        queue = GameEventQueue()
+        event_id = queue.add_event("admin_notification", {'message': "hi"})
+        with DatabaseConnection.get_cursor('game_state') as cursor:
+            cursor.execute("SELECT created_at FROM game_events WHERE id = ?", (event_id,))
+            assert cursor.fetchone()[0] == manual_clock.utc_now().isoformat(sep=' ')
+            cursor.execute("INSERT INTO game_events (event_type, data) VALUES ('old', '{}')")
+        
+        # Both rows, one stamped by the clock and one by the column default, are now 31+ days old
+        manual_clock.set(datetime.now(timezone.utc).astimezone().replace(tzinfo=None) + timedelta(days=31))
+        queue.cleanup_old_events(days=30)
+        assert queue.get_pending_events() == []
+    finally:
+        DatabaseConnection.clear_test_db_paths()
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+import pytest
+from human_resources.models import Employee, Role
+from player.models import Player
+
+ROW = (1, "Ann", "Able", "ann@example.com", 2, "2024-01-02", "active", "2024-01-02 09:30:00")
+
+def test_dates_parsed_lazily_and_once():
+    """Test that ISO text is kept until the date field is first read."""
+    employee = Employee.from_tuple(ROW)
+    assert employee._hire_date == "2024-01-02"
+    assert employee.hire_date == date(2024, 1, 2)
+    assert employee._hire_date is employee.hire_date
+    assert employee.created_at == datetime(2024, 1, 2, 9, 30)
+    assert Role(1, "Engineer", None, None).created_at is None
+    assert Role(1, "Engineer", None, "").created_at is None
+
+def test_models_are_slotted_and_compare_by_value():
+    """Test slots, equality, hashing and repr of the record classes."""
+    employee = Employee.from_tuple(ROW)
+    same = Employee(1, "Ann", "Able", "ann@example.com", 2, date(2024, 1, 2), "active",
+                    created_at=datetime(2024, 1, 2, 9, 30))
+    assert not hasattr(employee, '__dict__')
+    assert employee == same and hash(employee) == hash(same)
+    assert employee != Employee.from_tuple(ROW[:1] + ("Bob",) + ROW[2:])
+    assert repr(Role(1, "Engineer", "Builds", None)) == "Role(id=1, title='Engineer', description='Builds', created_at=None)"
+
+def test_frozen_models_reject_assignment():
+    """Test that frozen models cannot change while non-frozen ones can."""
+    employee = Employee.from_tuple(ROW)
+    with pytest.raises(AttributeError):
+        employee.first_name = "Bob"
+    with pytest.raises(AttributeError):
+        employee.hire_date = date(2020, 1, 1)
+    
+    player = Player(1, "Ann", "Able", "ann@example.com", 1, None)
+    assert player.days_survived == 0
+    player.days_survived = 3
+    assert player.days_survived == 3
+    with pytest.raises(TypeError):
+        hash(player)
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import tempfile
+from datetime import date
+import pytest
+from game_calendar import models as calendar_models
+from human_resources.database import init_db as init_hr_db
+from human_resources.repository import EmployeeRepository, RoleRepository
+from human_resources.utils import get_current_employee
+from player.repository import PlayerRepository, init_db as init_player_db
+from shared.database import DatabaseConnection
+from shared.session import clear_session, get_session, refresh_session
+
+@pytest.fixture
+def session_db():
+    """Point the player, HR and calendar databases at temporary files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        DatabaseConnection.set_test_db_paths({
+            name: os.path.join(temp_dir, f'{name}.db') for name in ('player', 'hr', 'calendar')
+        })
+        init_player_db()
+        init_hr_db()
+        calendar_models.init_db()
+        yield temp_dir
+        clear_session()
+        DatabaseConnection.clear_test_db_paths()
+
+def _add_player(email, employee_id):
+    # players.employee_id references a table in hr.db, so link without foreign key checks
+    with sqlite3.connect(DatabaseConnection.get_db_path('player')) as conn:
+        conn.execute("INSERT INTO players (first_name, last_name, email, employee_id, created_at) VALUES ('P', 'Q', ?, ?, ?)",
+                     (email, employee_id, f"2024-01-0{employee_id} 00:00:00"))
+
+def test_session_resolves_player_once(session_db, monkeypatch):
+    """Test that the player, employee, role and game day come from the session after login."""
+    role = RoleRepository.create("IT Support Specialist")
+    employee = EmployeeRepository.create("Ann", "Able", "ann@example.com", date(2024, 1, 1), role.id)
+    _add_player("ann@example.com", employee.id)
+    
+    session = refresh_session()
+    assert session.player.email == "ann@example.com"
+    assert session.employee.id == employee.id
+    assert session.role.title == "IT Support Specialist"
+    assert session.game_day == 1
+    
+    calls = []
+    monkeypatch.setattr(PlayerRepository, 'get_most_recent', lambda: calls.append(1))
+    assert get_current_employee().id == employee.id
+    assert get_session() is session
+    assert calls == []
+
+def test_session_follows_change_events(session_db):
+    """Test that repository writes show through and a refresh picks up a new player."""
+    ann = EmployeeRepository.create("Ann", "Able", "ann@example.com", date(2024, 1, 1))
+    bob = EmployeeRepository.create("Bob", "Baker", "bob@example.com", date(2024, 1, 1))
+    _add_player("ann@example.com", ann.id)
+    assert get_session().employee.id == ann.id
+    
+    EmployeeRepository.update_employment_status(ann.id, 'on_leave')
+    assert get_session().employee.employment_status == 'on_leave'
+    calendar_models.advance_game_day()
+    assert get_session().game_day == 2
+    
+    _add_player("bob@example.com", bob.id)
+    assert get_session().employee.id == ann.id
+    assert refresh_session().employee.id == bob.id
+    with sqlite3.connect(DatabaseConnection.get_db_path('player')) as conn:
+        conn.execute("UPDATE players SET employee_id = NULL")
+    assert get_session().employee.id == bob.id
+    assert refresh_session().employee is None
@@ -0,0 +1,15 @@
+from shared.database import DatabaseConnection
+from simulation import SimulationConfig, run_simulation
+
+def test_simulation_plays_game_days_headless(tmp_path):
+    """Test that a short run moves tickets, mail and events through every component."""
+    report = run_simulation(SimulationConfig(days=2, bots=2, ticks_per_day=16, hr_every_ticks=4,
+                                             message_chance=0.5, seed=7, workdir=str(tmp_path)))
+    
+    assert [day.day for day in report.days] == [1, 2]
+    assert report.total('tickets_created') > 0
+    assert report.total('tickets_resolved') == report.total('events_processed') > 0
+    assert report.total('messages_handled') > 0
+    assert all(day.db_total > 0 and 'tickets' in day.db_seconds for day in report.days)
+    assert "tickets resolved/s" in report.format()
+    assert DatabaseConnection.get_db_path('tickets') != str(tmp_path / 'tickets.db')
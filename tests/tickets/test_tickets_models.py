@@ -283,5 +283,28 @@ class TestTickets(unittest.TestCase):
         self.assertEqual(status_counts['Open'], 1)
         self.assertEqual(status_counts['In Progress'], 1)
 
+    def test_add_tickets_bulk(self):
+        """Test adding a batch of tickets, reusing products across the batch."""
+        tickets = [{
+            'id': f'BULK-{i}',
+            'title': f'Bulk Ticket {i}',
+            'status': 'New',
+            'description': f'Bulk description {i}',
+            'hardware': {
+                'name': 'Test Product' if i % 2 else 'Other Product',
+                'model': 'Model X',
+                'manufacturer': 'Test Manufacturer'
+            }
+        } for i in range(5)]
+        self.assertEqual(models.add_tickets_bulk(tickets), 5)
+        self.assertEqual(models.add_tickets_bulk([]), 0)
+
+        self.assertEqual(models.get_tickets_by_status(), {'New': 5})
+        with DatabaseConnection.get_cursor('tickets') as c:
+            c.execute("SELECT COUNT(*) FROM products")
+            self.assertEqual(c.fetchone()[0], 2)
+            c.execute("SELECT description FROM ticket_description WHERE ticket_id = 'BULK-3'")
+            self.assertEqual(c.fetchone()[0], 'Bulk description 3')
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -23,10 +23,11 @@ class TestTicketViews(unittest.TestCase):
         self.mock_employee.last_name = "User"
         self.mock_employee.email = "test@example.com"
 
+    @patch('tickets.views.print_common_header')
     @patch('tickets.views.get_current_employee')
     @patch('tickets.views.models.get_active_tickets')
     @patch('tickets.views.show_ticket_interaction')
-    def test_work_new_ticket(self, mock_show_interaction, mock_get_tickets, mock_get_employee):
+    def test_work_new_ticket(self, mock_show_interaction, mock_get_tickets, mock_get_employee, mock_header):
         """Test the work_new_ticket function."""
         # Mock the active tickets
         mock_tickets = [
@@ -1,6 +1,7 @@
-from datetime import datetime
+from shared.clock import get_clock
 import os
 from shared.database import DatabaseConnection
+from human_resources.repository import EmployeeRepository
 
 # Get the directory where this module is located
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -216,7 +217,7 @@ def insert_ticket_history(cursor, ticket_id, title, status, description, product
             INSERT INTO ticket_history 
             (ticket_id, title, status, product_id, comment, changed_at, assignee_id)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (ticket_id, title, status, product_id, comment, datetime.now(), assignee_id))
+        """, (ticket_id, title, status, product_id, comment, get_clock().now(), assignee_id))
     except Exception as e:
         print(f"Error inserting history: {str(e)}")
         raise
@@ -249,7 +250,7 @@ def add_ticket(ticket):
               ticket['title'],
               ticket['status'],
               product_id,
-              datetime.now()))
+              get_clock().now()))
         
         # Insert the description
         c.execute("""
@@ -257,6 +258,54 @@ def add_ticket(ticket):
             VALUES (?, ?)
         """, (ticket['id'], ticket['description']))
 
+def add_tickets_bulk(tickets):
+    """Add many tickets in a single transaction.
+    
+    Each distinct hardware item is resolved to a product once, and the tickets
+    and their descriptions are inserted with one executemany each.
+    
+    Args:
+        tickets: Ticket dicts shaped like add_ticket's
+    
+    Returns:
+        int: Number of tickets added
+    """
+    tickets = list(tickets)
+    if not tickets:
+        return 0
+    created_at = get_clock().now()
+    with DatabaseConnection.get_cursor('tickets') as c:
+        product_ids = {}
+        for ticket in tickets:
+            key = (ticket['hardware']['name'], ticket['hardware']['model'], ticket['hardware']['manufacturer'])
+            if key in product_ids:
+                continue
+            c.execute("""
+                SELECT id FROM products 
+                WHERE name = ? AND model = ? AND manufacturer = ?
+            """, key)
+            row = c.fetchone()
+            if row:
+                product_ids[key] = row[0]
+            else:
+                c.execute("INSERT INTO products (name, model, manufacturer) VALUES (?, ?, ?)", key)
+                product_ids[key] = c.lastrowid
+        
+        c.executemany("""
+            INSERT INTO tickets (id, title, status, product_id, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (ticket['id'], ticket['title'], ticket['status'],
+             product_ids[(ticket['hardware']['name'], ticket['hardware']['model'], ticket['hardware']['manufacturer'])],
+             created_at)
+            for ticket in tickets
+        ])
+        c.executemany("""
+            INSERT INTO ticket_description (ticket_id, description)
+            VALUES (?, ?)
+        """, [(ticket['id'], ticket['description']) for ticket in tickets])
+    return len(tickets)
+
 def list_products():
     """List all products in the database."""
     with DatabaseConnection.get_cursor('tickets') as c:
@@ -401,7 +450,7 @@ def mutate_ticket_status(ticket_id, new_status):
                 new_status,
                 row['product_id'],
                 f"Status changed from {row['status']} to {new_status}",
-                datetime.now(),
+                get_clock().now(),
                 row['assignee_id']
             ))
 
@@ -474,7 +523,7 @@ def assign_ticket(ticket_id, employee_id):
                 row['ticket_status'],
                 row['ticket_product_id'],
                 f"Ticket reassigned from {row['current_assignee_id']} to {employee_id}",
-                datetime.now(),
+                get_clock().now(),
                 employee_id
             ))
 
@@ -501,22 +550,16 @@ def get_ticket_assignee(ticket_id):
         if not result or not result['assignee_id']:
             return None
             
-        # Then get the employee details from the HR database
-        with DatabaseConnection.get_cursor('hr') as hr_cursor:
-            hr_cursor.execute("""
-                SELECT id, first_name, last_name, email
-                FROM employees
-                WHERE id = ?
-            """, (result['assignee_id'],))
-            employee = hr_cursor.fetchone()
-            if employee:
-                return {
-                    'id': employee['id'],
-                    'first_name': employee['first_name'],
-                    'last_name': employee['last_name'],
-                    'email': employee['email']
-                }
-            return None
+    # Then get the employee details through the HR identity map
+    employee = EmployeeRepository.get_by_id(result['assignee_id'])
+    if employee:
+        return {
+            'id': employee.id,
+            'first_name': employee.first_name,
+            'last_name': employee.last_name,
+            'email': employee.email
+        }
+    return None
 
 def get_assigned_tickets(employee_id):
     """Get all tickets assigned to an employee."""
@@ -5,6 +5,7 @@ from shared.common_ui import print_common_header
 from shared.rich_ui import print_status, print_info, print_error, print_table
 from human_resources.repository import EmployeeRepository
 from human_resources.utils import get_current_employee
+from hardware import triage as hardware_triage
 from player.models import Player
 from rich.console import Console
 from rich.panel import Panel
@@ -88,6 +89,9 @@ def print_status_pane():
 
 def show_ticket_interaction(ticket):
     """Show the ticket interaction screen for the selected ticket."""
+    # Ranked procedures come from the precomputed triage index, so look them up once
+    suggestions = hardware_triage.suggest_procedures_for_ticket(ticket)
+    
     while True:
         clear_screen()
         
@@ -161,6 +165,24 @@ def show_ticket_interaction(ticket):
         console.print(comment_panel)
         console.print()  # Add spacing
         
+        # Display suggested troubleshooting procedures
+        if suggestions:
+            suggestion_text = ""
+            for i, procedure in enumerate(suggestions, 1):
+                suggestion_text += f"[bold dark_goldenrod]{i}.[/] [sea_green2]{procedure['name']}[/]"
+                if procedure['hardware_name'] != ticket['hardware']['name']:
+                    suggestion_text += f" [dark_sea_green](from {procedure['hardware_name']})[/]"
+                suggestion_text += "\n"
+            suggestion_panel = Panel(
+                suggestion_text.rstrip("\n"),
+                title="🛠️ Suggested Procedures",
+                style="dark_sea_green",
+                box=box.ROUNDED,
+                expand=True
+            )
+            console.print(suggestion_panel)
+            console.print()  # Add spacing
+        
         # Display recent history with enhanced styling
         history = models.get_ticket_history(ticket['id'])
         if not history: